@@ -60,6 +60,7 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hash-key',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -67,6 +68,7 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
             '--native',
             '--entrypoint',
             '--docker-kwargs',
@@ -97,6 +99,14 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--load-balancing',
+            '--hedging',
+            '--retry-policy',
+            '--concurrency-limit',
+            '--data-streaming',
+            '--shared-memory',
+            '--compression',
+            '--compression-min-bytes',
         ],
         'flow': [
             '--help',
@@ -111,6 +121,7 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hash-key',
             '--uses',
             '--env',
             '--inspect',
@@ -130,6 +141,7 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hash-key',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -137,8 +149,10 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
             '--native',
             '--prefetch',
+            '--prefetch-window',
             '--title',
             '--description',
             '--cors',
@@ -156,6 +170,9 @@ ac_table = {
             '--port-expose',
             '--graph-description',
             '--deployments-addresses',
+            '--response-cache',
+            '--request-batching',
+            '--singleflight-endpoints',
             '--daemon',
             '--runtime-backend',
             '--runtime',
@@ -172,6 +189,14 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--load-balancing',
+            '--hedging',
+            '--retry-policy',
+            '--concurrency-limit',
+            '--data-streaming',
+            '--shared-memory',
+            '--compression',
+            '--compression-min-bytes',
         ],
         'hub new': [
             '--help',
@@ -217,6 +242,7 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hash-key',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -224,6 +250,7 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
             '--native',
             '--entrypoint',
             '--docker-kwargs',
@@ -254,6 +281,14 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--load-balancing',
+            '--hedging',
+            '--retry-policy',
+            '--concurrency-limit',
+            '--data-streaming',
+            '--shared-memory',
+            '--compression',
+            '--compression-min-bytes',
         ],
         'deployment': [
             '--help',
@@ -268,6 +303,7 @@ ac_table = {
             '--k8s-namespace',
             '--k8s-disable-connection-pool',
             '--polling',
+            '--hash-key',
             '--uses',
             '--uses-with',
             '--uses-metas',
@@ -275,6 +311,7 @@ ac_table = {
             '--py-modules',
             '--port-in',
             '--host-in',
+            '--disable-uds',
             '--native',
             '--entrypoint',
             '--docker-kwargs',
@@ -305,6 +342,14 @@ ac_table = {
             '--uses-before-address',
             '--uses-after-address',
             '--connection-list',
+            '--load-balancing',
+            '--hedging',
+            '--retry-policy',
+            '--concurrency-limit',
+            '--data-streaming',
+            '--shared-memory',
+            '--compression',
+            '--compression-min-bytes',
             '--uses-before',
             '--uses-after',
             '--external',
@@ -64,7 +64,7 @@ __version__ = '3.0.5'
 
 # do not change this line manually
 # this is managed by proto/build-proto.sh and updated on every execution
-__proto_version__ = '0.1.8'
+__proto_version__ = '0.1.14'
 try:
     __docarray_version__ = _docarray.__version__
 except AttributeError as e:
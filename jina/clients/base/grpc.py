@@ -10,6 +10,7 @@ from jina.excepts import BadClient, BadClientInput, BaseJinaException
 from jina.logging.profile import ProgressBar
 from jina.proto import jina_pb2_grpc
 from jina.serve.networking import GrpcConnectionPool
+from jina.serve.stream import RESULTS_IN_ORDER_METADATA
 
 if TYPE_CHECKING:
     from jina.clients.base import InputType, CallbackFnType
@@ -27,6 +28,7 @@ class GRPCBaseClient(BaseClient):
         on_done: 'CallbackFnType',
         on_error: Optional['CallbackFnType'] = None,
         on_always: Optional['CallbackFnType'] = None,
+        results_in_order: bool = False,
         **kwargs,
     ):
         try:
@@ -47,7 +49,12 @@ class GRPCBaseClient(BaseClient):
                 )
 
                 with cm1 as p_bar:
-                    async for resp in stub.Call(req_iter):
+                    async for resp in stub.Call(
+                        req_iter,
+                        metadata=((RESULTS_IN_ORDER_METADATA, 'true'),)
+                        if results_in_order
+                        else None,
+                    ):
                         callback_exec(
                             response=resp,
                             on_error=on_error,
@@ -5,6 +5,13 @@ from abc import ABC, abstractmethod
 from jina.types.request import Request
 from jina.importer import ImportExtensions
 from jina.types.request.data import DataRequest
+from jina.serve.media_types import (
+    JSON_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE,
+    request_from_bytes,
+    request_from_dict,
+    request_to_bytes,
+)
 
 if TYPE_CHECKING:
     from jina.types.request import Response
@@ -67,7 +74,18 @@ class AioHttpClientlet(ABC):
 
 
 class HTTPClientlet(AioHttpClientlet):
-    """HTTP Client to be used with the streamer"""
+    """HTTP Client to be used with the streamer
+
+    :param args: positional args of :class:`AioHttpClientlet`
+    :param media_type: the media type the requests are sent and the responses are accepted with, the serialized
+        DataRequestProto (`application/x-protobuf`) by default. `application/json` sends the requests in the form of
+        the JSON models of the gateway
+    :param kwargs: keyword args of :class:`AioHttpClientlet`
+    """
+
+    def __init__(self, *args, media_type: str = PROTOBUF_MEDIA_TYPE, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.media_type = media_type
 
     async def send_message(self, request: 'Request'):
         """Sends a POST request to the server
@@ -75,10 +93,26 @@ class HTTPClientlet(AioHttpClientlet):
         :param request: request as dict
         :return: send post message
         """
-        req_dict = request.to_dict()
-        req_dict['exec_endpoint'] = req_dict['header']['exec_endpoint']
-
-        return await self.session.post(url=self.url, json=req_dict).__aenter__()
+        if self.media_type == JSON_MEDIA_TYPE:
+            req_dict = request.to_dict()
+            req_dict['exec_endpoint'] = req_dict['header']['exec_endpoint']
+
+            return await self.session.post(url=self.url, json=req_dict).__aenter__()
+        return await self.session.post(
+            url=self.url,
+            data=request_to_bytes(request, self.media_type),
+            headers={'Content-Type': self.media_type, 'Accept': self.media_type},
+        ).__aenter__()
+
+    async def read_response(self, response) -> 'DataRequest':
+        """Read the DataRequest from a response of the server
+
+        :param response: the response to a message sent with :meth:`send_message`
+        :return: the DataRequest
+        """
+        if self.media_type == JSON_MEDIA_TYPE:
+            return request_from_dict(await response.json())
+        return request_from_bytes(await response.read(), self.media_type)
 
     async def recv_message(self):
         """Receive message for HTTP (sleep)
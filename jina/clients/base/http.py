@@ -10,7 +10,6 @@ from jina.importer import ImportExtensions
 from jina.logging.profile import ProgressBar
 from jina.types.request import Request
 from jina.serve.stream import RequestStreamer
-from jina.types.request.data import DataRequest
 
 if TYPE_CHECKING:
     from jina.clients.base import InputType, CallbackFnType
@@ -25,6 +24,7 @@ class HTTPBaseClient(BaseClient):
         on_done: 'CallbackFnType',
         on_error: Optional['CallbackFnType'] = None,
         on_always: Optional['CallbackFnType'] = None,
+        results_in_order: bool = False,
         **kwargs,
     ):
         """
@@ -32,6 +32,7 @@ class HTTPBaseClient(BaseClient):
         :param on_done: the callback for on_done
         :param on_error: the callback for on_error
         :param on_always: the callback for on_always
+        :param results_in_order: return the responses in the order of the requests
         :param kwargs: kwargs for _get_task_name and _get_requests
         :yields: generator over results
         """
@@ -73,25 +74,17 @@ class HTTPBaseClient(BaseClient):
                     request_handler=_request_handler,
                     result_handler=_result_handler,
                 )
-                async for response in streamer.stream(request_iterator):
+                async for response in streamer.stream(
+                    request_iterator, results_in_order=results_in_order
+                ):
                     r_status = response.status
 
-                    r_str = await response.json()
                     if r_status == 404:
                         raise BadClient(f'no such endpoint {url}')
                     elif r_status < 200 or r_status > 300:
-                        raise ValueError(r_str)
+                        raise ValueError(await response.text())
 
-                    da = None
-                    if 'data' in r_str and r_str['data'] is not None:
-                        from docarray import DocumentArray
-
-                        da = DocumentArray.from_dict(r_str['data'])
-                        del r_str['data']
-
-                    resp = DataRequest(r_str)
-                    if da is not None:
-                        resp.data.docs = da
+                    resp = await iolet.read_response(response)
 
                     callback_exec(
                         response=resp,
@@ -27,6 +27,7 @@ class WebSocketBaseClient(BaseClient):
         on_done: 'CallbackFnType',
         on_error: Optional['CallbackFnType'] = None,
         on_always: Optional['CallbackFnType'] = None,
+        results_in_order: bool = False,
         **kwargs,
     ):
         """
@@ -34,6 +35,7 @@ class WebSocketBaseClient(BaseClient):
         :param on_done: the callback for on_done
         :param on_error: the callback for on_error
         :param on_always: the callback for on_always
+        :param results_in_order: return the responses in the order of the requests
         :param kwargs: kwargs for _get_task_name and _get_requests
         :yields: generator over results
         """
@@ -118,7 +120,9 @@ class WebSocketBaseClient(BaseClient):
                     raise RuntimeError(
                         'receive task not running, can not send messages'
                     )
-                async for response in streamer.stream(request_iterator):
+                async for response in streamer.stream(
+                    request_iterator, results_in_order=results_in_order
+                ):
                     callback_exec(
                         response=response,
                         on_error=on_error,
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from jina.clients.base import CallbackFnType, InputType
     from jina.types.request import Response
     from jina import DocumentArray
+    from jina.enums import CompressAlgo
 
 
 def _include_results_field_in_param(parameters: Optional['Dict']) -> 'Dict':
@@ -44,6 +45,10 @@ class PostMixin:
         request_size: int = 100,
         show_progress: bool = False,
         continue_on_error: bool = False,
+        timeout: Optional[float] = None,
+        compress: Optional[Union[str, 'CompressAlgo']] = None,
+        tensor_columns: bool = False,
+        results_in_order: bool = False,
         **kwargs,
     ) -> Optional[Union['DocumentArray', List['Response']]]:
         """Post a general data request to the Flow.
@@ -58,6 +63,10 @@ class PostMixin:
         :param request_size: the number of Documents per request. <=0 means all inputs in one request.
         :param show_progress: if set, client will show a progress bar on receiving every request.
         :param continue_on_error: if set, a Request that causes callback error will be logged only without blocking the further requests.
+        :param timeout: the seconds after which a request is dropped by the Flow if it was not processed yet. Dropped requests are returned with an error.
+        :param compress: the algorithm the docs are compressed with, e.g. `LZ4`. They stay compressed until an Executor reads them.
+        :param tensor_columns: if set, the `embedding` and `tensor` of the docs in the requests and responses are sent as one contiguous array per request if they are NumPy arrays of the same shape and dtype. All Executors of the Flow must run a Jina version which reads them.
+        :param results_in_order: if set, the responses are returned in the order of the requests instead of the order in which they complete.
         :param kwargs: additional parameters
         :return: None or DocumentArray containing all response Documents
 
@@ -103,6 +112,10 @@ class PostMixin:
             target_executor=target_executor,
             parameters=parameters,
             request_size=request_size,
+            timeout=timeout,
+            compress=compress,
+            tensor_columns=tensor_columns,
+            results_in_order=results_in_order,
             **kwargs,
         )
 
@@ -128,6 +141,10 @@ class AsyncPostMixin:
         request_size: int = 100,
         show_progress: bool = False,
         continue_on_error: bool = False,
+        timeout: Optional[float] = None,
+        compress: Optional[Union[str, 'CompressAlgo']] = None,
+        tensor_columns: bool = False,
+        results_in_order: bool = False,
         **kwargs,
     ) -> AsyncGenerator[None, 'Response']:
         """Post a general data request to the Flow.
@@ -142,6 +159,10 @@ class AsyncPostMixin:
         :param request_size: the number of Documents per request. <=0 means all inputs in one request.
         :param show_progress: if set, client will show a progress bar on receiving every request.
         :param continue_on_error: if set, a Request that causes callback error will be logged only without blocking the further requests.
+        :param timeout: the seconds after which a request is dropped by the Flow if it was not processed yet. Dropped requests are returned with an error.
+        :param compress: the algorithm the docs are compressed with, e.g. `LZ4`. They stay compressed until an Executor reads them.
+        :param tensor_columns: if set, the `embedding` and `tensor` of the docs in the requests and responses are sent as one contiguous array per request if they are NumPy arrays of the same shape and dtype. All Executors of the Flow must run a Jina version which reads them.
+        :param results_in_order: if set, the responses are returned in the order of the requests instead of the order in which they complete.
         :param kwargs: additional parameters
         :yield: Response object
         """
@@ -161,6 +182,10 @@ class AsyncPostMixin:
             target_executor=target_executor,
             parameters=parameters,
             request_size=request_size,
+            timeout=timeout,
+            compress=compress,
+            tensor_columns=tensor_columns,
+            results_in_order=results_in_order,
             **kwargs,
         ):
             yield r
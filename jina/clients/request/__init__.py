@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from docarray.document import DocumentSourceType
     from docarray.document.mixins.content import DocumentContentType
     from jina.types.request import Request
+    from jina.enums import CompressAlgo
 
     SingletonDataType = Union[
         DocumentContentType,
@@ -42,6 +43,9 @@ def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    compress: Optional[Union[str, 'CompressAlgo']] = None,
+    tensor_columns: bool = False,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> Iterator['Request']:
     """Generate a request iterator.
@@ -53,6 +57,9 @@ def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: a dictionary of parameters to be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: the seconds after which a request is dropped by the Flow if it was not processed yet
+    :param compress: the algorithm the docs are compressed with
+    :param tensor_columns: if set, the tensor fields of the docs may be sent as one contiguous array per request
     :param kwargs: additional arguments
     :yield: request
     """
@@ -63,7 +70,11 @@ def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                timeout=timeout,
+                tensor_columns=tensor_columns,
             )
         else:
             if not isinstance(data, Iterable):
@@ -76,6 +87,9 @@ def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    timeout=timeout,
+                    compress=compress,
+                    tensor_columns=tensor_columns,
                 )
 
     except Exception as ex:
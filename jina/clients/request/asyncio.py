@@ -1,6 +1,6 @@
 """Module for async requests generator."""
 
-from typing import AsyncIterator, Optional, Dict, TYPE_CHECKING
+from typing import AsyncIterator, Optional, Dict, TYPE_CHECKING, Union
 
 from jina.clients.request.helper import _new_data_request_from_batch, _new_data_request
 from jina.enums import DataInputType
@@ -10,6 +10,7 @@ from jina.types.request import Request
 
 if TYPE_CHECKING:
     from jina.clients.request import GeneratorSourceType
+    from jina.enums import CompressAlgo
 
 
 async def request_generator(
@@ -19,6 +20,9 @@ async def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_executor: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
+    compress: Optional[Union[str, 'CompressAlgo']] = None,
+    tensor_columns: bool = False,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> AsyncIterator['Request']:
     """An async :function:`request_generator`.
@@ -30,6 +34,9 @@ async def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: the kwargs that will be sent to the executor
     :param target_executor: a regex string. Only matching Executors will process the request.
+    :param timeout: the seconds after which a request is dropped by the Flow if it was not processed yet
+    :param compress: the algorithm the docs are compressed with
+    :param tensor_columns: if set, the tensor fields of the docs may be sent as one contiguous array per request
     :param kwargs: additional arguments
     :yield: request
     """
@@ -40,7 +47,11 @@ async def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_executor, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_executor,
+                parameters=parameters,
+                timeout=timeout,
+                tensor_columns=tensor_columns,
             )
         else:
             with ImportExtensions(required=True):
@@ -54,6 +65,9 @@ async def request_generator(
                     endpoint=exec_endpoint,
                     target=target_executor,
                     parameters=parameters,
+                    timeout=timeout,
+                    compress=compress,
+                    tensor_columns=tensor_columns,
                 )
     except Exception as ex:
         # must be handled here, as grpc channel wont handle Python exception
@@ -1,5 +1,7 @@
 """Module for helper functions for clients."""
-from typing import Tuple
+import math
+import time
+from typing import Optional, Tuple
 
 from docarray import DocumentArray, Document
 
@@ -9,17 +11,31 @@ from jina.types.request.data import DataRequest
 
 
 def _new_data_request_from_batch(
-    _kwargs, batch, data_type, endpoint, target, parameters
+    _kwargs,
+    batch,
+    data_type,
+    endpoint,
+    target,
+    parameters,
+    timeout=None,
+    compress=None,
+    tensor_columns=False,
 ):
-    req = _new_data_request(endpoint, target, parameters)
+    req = _new_data_request(endpoint, target, parameters, timeout, tensor_columns)
 
     # add docs fields
-    _add_docs(req, batch, data_type, _kwargs)
+    _add_docs(req, batch, data_type, _kwargs, compress)
 
     return req
 
 
-def _new_data_request(endpoint, target, parameters):
+def _new_data_request(
+    endpoint,
+    target,
+    parameters,
+    timeout: Optional[float] = None,
+    tensor_columns: bool = False,
+):
     req = DataRequest()
 
     # set up header
@@ -27,6 +43,11 @@ def _new_data_request(endpoint, target, parameters):
         req.header.exec_endpoint = endpoint
     if target:
         req.header.target_executor = target
+    if timeout is not None:
+        # the header holds the deadline in epoch seconds, round up to not drop the request early
+        req.header.timeout = math.ceil(time.time() + timeout)
+    if tensor_columns:
+        req.header.tensor_columns = True
     # add parameters field
     if parameters:
         req.parameters = parameters
@@ -61,7 +82,7 @@ def _new_doc_from_data(
         return _build_doc_from_content()
 
 
-def _add_docs(req, batch, data_type, _kwargs):
+def _add_docs(req, batch, data_type, _kwargs, compress=None):
     da = DocumentArray()
     for content in batch:
         if isinstance(content, tuple) and len(content) == 2:
@@ -71,7 +92,10 @@ def _add_docs(req, batch, data_type, _kwargs):
         else:
             d, data_type = _new_doc_from_data(content, data_type, **_kwargs)
             da.append(d)
-    req.data.docs = da
+    if compress:
+        req.data.set_compressed_docs(da, compress)
+    else:
+        req.data.docs = da
 
 
 def _add_control_propagate(req, kwargs):
@@ -106,6 +106,7 @@ class PollingType(BetterEnum):
     ANY = 1  #: one of the shards will receive the message
     ALL = 2  #: all shards will receive the message, blocked until all done with the message
     ALL_ASYNC = 3  #: (reserved) all replica will receive the message, but any one of them can return, useful in backup
+    HASH = 4  #: every shard will receive the docs whose consistent hash maps to it
 
     @property
     def is_push(self) -> bool:
@@ -126,6 +127,22 @@ class PollingType(BetterEnum):
         return self.value == 2
 
 
+class LoadBalancingType(BetterEnum):
+    """The enum for representing the strategy used to select a replica of a deployment."""
+
+    ROUND_ROBIN = 0  #: replicas are selected in turn
+    LEAST_OUTSTANDING = 1  #: the replica with the least in-flight requests is selected
+    POWER_OF_TWO = 2  #: two random replicas are compared by in-flight requests and latency, the cheaper one is selected
+
+
+class CompressionType(BetterEnum):
+    """The enum for representing the gRPC message compression used between runtimes."""
+
+    NONE = 0  #: messages are sent uncompressed
+    GZIP = 1  #: messages are compressed with gzip
+    DEFLATE = 2  #: messages are compressed with deflate
+
+
 class LogVerbosity(BetterEnum):
     """Verbosity level of the logger."""
 
@@ -199,7 +216,8 @@ class CompressAlgo(BetterEnum):
     The enum of Compress algorithms.
 
     .. note::
-        LZ4 requires additional package, to install it use pip install "jina[lz4]"
+        LZ4 requires additional package, to install it use pip install "jina[lz4]". ZSTD requires the package
+        `zstandard`. Docs are compressed with ZLIB when the package of the algorithm is not installed
 
     .. seealso::
 
@@ -212,6 +230,7 @@ class CompressAlgo(BetterEnum):
     GZIP = 3
     BZ2 = 4
     LZMA = 5
+    ZSTD = 6
 
 
 class OnErrorStrategy(BetterEnum):
@@ -101,3 +101,7 @@ class DaemonInvalidDockerfile(FileNotFoundError, BaseJinaException):
 
 class NoContainerizedError(Exception, BaseJinaException):
     """Raised when trying to use non-containerized Executor in K8s or Docker Compose"""
+
+
+class DeadlineExceeded(Exception, BaseJinaException):
+    """When a request is not processed before the deadline set by the client."""
@@ -835,6 +835,14 @@ class Deployment(BaseDeployment):
             _args.workspace = args.workspace
         return _args
 
+    @staticmethod
+    def _uses_container(args) -> bool:
+        return any(
+            isinstance(getattr(args, param, None), str)
+            and getattr(args, param).startswith(('docker://', 'jinahub+docker://'))
+            for param in ('uses', 'uses_before', 'uses_after')
+        )
+
     def _parse_base_deployment_args(self, args):
         parsed_args = {
             'head': None,
@@ -869,6 +877,9 @@ class Deployment(BaseDeployment):
                 )
 
             parsed_args['head'] = BaseDeployment._copy_to_head_args(args)
+            if self._uses_container(args):
+                # the unix domain sockets inside of containers are not reachable by the head
+                parsed_args['head'].disable_uds = True
         parsed_args['pods'] = self._set_pod_args(args)
 
         return parsed_args
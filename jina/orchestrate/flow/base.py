@@ -125,18 +125,26 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         compress: Optional[str] = 'NONE',
         compress_min_bytes: Optional[int] = 1024,
         compress_min_ratio: Optional[float] = 1.1,
+        compression: Optional[str] = 'NONE',
+        compression_min_bytes: Optional[int] = 1024,
+        concurrency_limit: Optional[str] = None,
         connection_list: Optional[str] = None,
         cors: Optional[bool] = False,
         daemon: Optional[bool] = False,
+        data_streaming: Optional[bool] = False,
         default_swagger_ui: Optional[bool] = False,
         deployments_addresses: Optional[str] = '{}',
         description: Optional[str] = None,
+        disable_uds: Optional[bool] = False,
         env: Optional[dict] = None,
         expose_endpoints: Optional[str] = None,
         expose_public: Optional[bool] = False,
         graph_description: Optional[str] = '{}',
+        hash_key: Optional[str] = None,
+        hedging: Optional[str] = None,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
         name: Optional[str] = 'gateway',
         native: Optional[bool] = False,
@@ -146,15 +154,21 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         port_expose: Optional[int] = None,
         port_in: Optional[int] = None,
         prefetch: Optional[int] = 0,
+        prefetch_window: Optional[str] = None,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
         quiet: Optional[bool] = False,
         quiet_error: Optional[bool] = False,
         replicas: Optional[int] = 1,
+        request_batching: Optional[str] = None,
+        response_cache: Optional[str] = None,
+        retry_policy: Optional[str] = None,
         runtime_backend: Optional[str] = 'PROCESS',
         runtime_cls: Optional[str] = 'GRPCGatewayRuntime',
         shards: Optional[int] = 1,
+        shared_memory: Optional[bool] = False,
+        singleflight_endpoints: Optional[List[str]] = [],
         timeout_ctrl: Optional[int] = 60,
         timeout_ready: Optional[int] = 600000,
         title: Optional[str] = None,
@@ -176,18 +190,38 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`
         :param compress_min_bytes: The original message size must be larger than this number to trigger the compress algorithm, -1 means disable compression.
         :param compress_min_ratio: The compression ratio (uncompressed_size/compressed_size) must be higher than this number to trigger the compress algorithm.
+        :param compression: The gRPC compression of data requests sent to Deployments on other hosts and of the responses sent back to them. Messages smaller than `--compression-min-bytes` are sent uncompressed.
+        :param compression_min_bytes: The minimum size in bytes of a data request or response to be compressed with `--compression`.
+        :param concurrency_limit: JSON dict that enables an adaptive limit of the data requests in flight per Deployment. The limit grows while the
+              latency stays low and shrinks once it rises or the Deployment is overloaded. Requests above the limit wait in a
+              bounded queue and fail with RESOURCE_EXHAUSTED once it is full or they waited longer than `queue_timeout` seconds.
+              Possible keys are `initial_limit`, `min_limit`, `max_limit`, `max_queue_size`, `queue_timeout`,
+              `latency_tolerance` and `backoff_ratio`.
+              {'initial_limit': 20, 'max_queue_size': 100, 'queue_timeout': 1.0}
         :param connection_list: dictionary JSON with a list of connections to configure
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param daemon: The Pod attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pod do not wait on the Runtime when closing
+        :param data_streaming: If set, data requests are multiplexed over a long-lived bidirectional gRPC stream per replica instead of one unary call per request. Replicas which do not support streaming are served with unary calls.
         :param default_swagger_ui: If set, the default swagger ui is used for `/docs` endpoint.
         :param deployments_addresses: dictionary JSON with the input addresses of each Deployment
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
+        :param disable_uds: If set, the runtime does not listen on a unix domain socket next to `port_in` and connects to runtimes on the local host over TCP instead of their unix domain sockets.
         :param env: The map of environment variables that are available inside runtime
         :param expose_endpoints: A JSON string that represents a map from executor endpoints (`@requests(on=...)`) to HTTP endpoints.
         :param expose_public: If set, expose the public IP address to remote when necessary, by default it exposesprivate IP address, which only allows accessing under the same network/subnet. Important to set this to true when the Pod will receive input connections from remote Pods
         :param graph_description: Routing graph for the gateway
+        :param hash_key: The tag of the docs whose value routes them to a shard with `HASH` polling. The id of the docs is used if not set or a doc does not have the tag.
+        :param hedging: JSON dict that enables hedged requests per endpoint, {endpoint: delay}.
+              If a replica did not respond after the delay, a duplicate of the request is sent to another replica and the
+              first response is used. The delay is either given in milliseconds or as a percentile of the latency observed
+              for the deployment, like `p95`. `*` matches all other endpoints.
+              {'/search': 'p95', '/custom': 50}
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
+        :param load_balancing: The strategy used to select the replica a request is sent to.
+              - ROUND_ROBIN: replicas are selected in turn
+              - LEAST_OUTSTANDING: the replica with the least in-flight requests is selected
+              - POWER_OF_TWO: two random replicas are compared by in-flight requests and observed latency, the cheaper one is selected
         :param log_config: The YAML config of the logger used in this object.
         :param name: The name of this object.
 
@@ -208,6 +242,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               Define per Deployment:
               - ANY: only one (whoever is idle) Pod polls the message
               - ALL: all Pods poll the message (like a broadcast)
+              - HASH: the docs are split across the Pods by a consistent hash of their id or `--hash-key` tag
               Define per Endpoint:
               JSON dict, {endpoint: PollingType}
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
@@ -216,6 +251,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param prefetch: Number of requests fetched from the client before feeding into the first Executor.
 
               Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)
+        :param prefetch_window: JSON dict that enables an adaptive window of the requests in flight per client, used instead of `--prefetch`.
+              The window grows while the latency of the requests stays low and shrinks once it rises. Independently of the
+              window, no more requests are fetched from the client once the requests in flight hold `max_bytes`.
+              Possible keys are `initial_size`, `min_size`, `max_size`, `max_bytes`, `latency_tolerance` and `backoff_ratio`.
+              {'initial_size': 10, 'max_size': 1000, 'max_bytes': 268435456}
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the executor
@@ -227,9 +267,27 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param quiet: If set, then no log will be emitted from this object.
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param replicas: The number of replicas in the deployment
+        :param request_batching: JSON dict that enables coalescing the requests of different clients in the gateway before they are sent to the
+              first Executors. Requests to the same endpoint with the same parameters are sent as one request, and the response
+              is split back to the clients by the ids of their Documents.
+              Possible keys are `endpoints`, `max_batch_docs` and `max_wait_ms`.
+              {'endpoints': ['/encode'], 'max_batch_docs': 64, 'max_wait_ms': 5}
+        :param response_cache: JSON dict that enables a cache of the responses to requests to idempotent endpoints in the gateway. Requests with
+              the same endpoint, target executor, parameters and docs are answered from the cache without passing the Executors.
+              Possible keys are `endpoints`, `max_entries`, `max_bytes` and `ttl` in seconds.
+              {'endpoints': ['/search'], 'max_entries': 1000, 'max_bytes': 67108864, 'ttl': 60}
+        :param retry_policy: JSON dict that configures how requests failing with a retryable gRPC status are retried.
+              Possible keys are `max_attempts`, `initial_backoff` and `max_backoff` in seconds, `backoff_multiplier`, `jitter`,
+              `retry_on_different_replica`, `retry_budget` as the share of the traffic of a deployment that may be retried and
+              `retryable_status_codes`.
+              {'max_attempts': 3, 'initial_backoff': 0.05, 'retry_budget': 0.2, 'retryable_status_codes': ['UNAVAILABLE']}
         :param runtime_backend: The parallel backend of the runtime inside the Pod
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/create-flow/#complex-flow-topologies
+        :param shared_memory: If set, the docs of large data requests are passed to Deployments on the same host in shared memory instead of being sent over gRPC. Requires unix domain sockets and a Linux host.
+        :param singleflight_endpoints: The endpoints whose identical requests are collapsed in the gateway. A request with the same endpoint, target
+              executor, parameters and docs as a request in flight is not sent to the Executors, it gets a copy of the response
+              of the request in flight instead.
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
         :param timeout_ready: The timeout in milliseconds of a Pod waits for the runtime to be ready, -1 for waiting forever
         :param title: The title of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -265,6 +323,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         self,
         *,
         env: Optional[dict] = None,
+        hash_key: Optional[str] = None,
         inspect: Optional[str] = 'COLLECT',
         log_config: Optional[str] = None,
         name: Optional[str] = None,
@@ -279,6 +338,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina flow` CLI.
 
         :param env: The map of environment variables that are available inside runtime
+        :param hash_key: The tag of the docs whose value routes them to a shard with `HASH` polling. The id of the docs is used if not set or a doc does not have the tag.
         :param inspect: The strategy on those inspect deployments in the flow.
 
               If `REMOVE` is given then all inspect deployments are removed when building the flow.
@@ -297,6 +357,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               Define per Deployment:
               - ANY: only one (whoever is idle) Pod polls the message
               - ALL: all Pods poll the message (like a broadcast)
+              - HASH: the docs are split across the Pods by a consistent hash of their id or `--hash-key` tag
               Define per Endpoint:
               JSON dict, {endpoint: PollingType}
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
@@ -444,8 +505,20 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         args.noblock_on_start = True
         args.graph_description = json.dumps(graph_description)
         args.deployments_addresses = json.dumps(deployments_addresses)
+        if self._has_local_external_deployments():
+            # external Deployments on this host are not known to listen on a unix domain socket
+            args.disable_uds = True
         self._deployment_nodes[GATEWAY_NAME] = Deployment(args, needs)
 
+    def _has_local_external_deployments(self) -> bool:
+        from jina.serve.networking import GrpcConnectionPool
+
+        return any(
+            v.external
+            and GrpcConnectionPool.get_local_uds_address(f'{v.host}:{v.head_port_in}')
+            for v in self._deployment_nodes.values()
+        )
+
     def _get_deployments_addresses(self) -> Dict[str, List[str]]:
         graph_dict = {}
         for node, v in self._deployment_nodes.items():
@@ -568,8 +641,13 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     def add(
         self,
         *,
+        compression: Optional[str] = 'NONE',
+        compression_min_bytes: Optional[int] = 1024,
+        concurrency_limit: Optional[str] = None,
         connection_list: Optional[str] = None,
         daemon: Optional[bool] = False,
+        data_streaming: Optional[bool] = False,
+        disable_uds: Optional[bool] = False,
         docker_kwargs: Optional[dict] = None,
         entrypoint: Optional[str] = None,
         env: Optional[dict] = None,
@@ -577,9 +655,12 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         external: Optional[bool] = False,
         force_update: Optional[bool] = False,
         gpus: Optional[str] = None,
+        hash_key: Optional[str] = None,
+        hedging: Optional[str] = None,
         host: Optional[str] = '0.0.0.0',
         host_in: Optional[str] = '0.0.0.0',
         install_requirements: Optional[bool] = False,
+        load_balancing: Optional[str] = 'ROUND_ROBIN',
         log_config: Optional[str] = None,
         name: Optional[str] = None,
         native: Optional[bool] = False,
@@ -592,9 +673,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         quiet_error: Optional[bool] = False,
         quiet_remote_logs: Optional[bool] = False,
         replicas: Optional[int] = 1,
+        retry_policy: Optional[str] = None,
         runtime_backend: Optional[str] = 'PROCESS',
         runtime_cls: Optional[str] = 'WorkerRuntime',
         shards: Optional[int] = 1,
+        shared_memory: Optional[bool] = False,
         timeout_ctrl: Optional[int] = 60,
         timeout_ready: Optional[int] = 600000,
         upload_files: Optional[List[str]] = None,
@@ -612,8 +695,18 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ) -> Union['Flow', 'AsyncFlow']:
         """Add an Executor to the current Flow object.
 
+        :param compression: The gRPC compression of data requests sent to Deployments on other hosts and of the responses sent back to them. Messages smaller than `--compression-min-bytes` are sent uncompressed.
+        :param compression_min_bytes: The minimum size in bytes of a data request or response to be compressed with `--compression`.
+        :param concurrency_limit: JSON dict that enables an adaptive limit of the data requests in flight per Deployment. The limit grows while the
+              latency stays low and shrinks once it rises or the Deployment is overloaded. Requests above the limit wait in a
+              bounded queue and fail with RESOURCE_EXHAUSTED once it is full or they waited longer than `queue_timeout` seconds.
+              Possible keys are `initial_limit`, `min_limit`, `max_limit`, `max_queue_size`, `queue_timeout`,
+              `latency_tolerance` and `backoff_ratio`.
+              {'initial_limit': 20, 'max_queue_size': 100, 'queue_timeout': 1.0}
         :param connection_list: dictionary JSON with a list of connections to configure
         :param daemon: The Pod attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pod do not wait on the Runtime when closing
+        :param data_streaming: If set, data requests are multiplexed over a long-lived bidirectional gRPC stream per replica instead of one unary call per request. Replicas which do not support streaming are served with unary calls.
+        :param disable_uds: If set, the runtime does not listen on a unix domain socket next to `port_in` and connects to runtimes on the local host over TCP instead of their unix domain sockets.
         :param docker_kwargs: Dictionary of kwargs arguments that will be passed to Docker SDK when starting the docker '
           container.
 
@@ -631,9 +724,19 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               - To access specified gpus based on device id, use `--gpus device=[YOUR-GPU-DEVICE-ID]`
               - To access specified gpus based on multiple device id, use `--gpus device=[YOUR-GPU-DEVICE-ID1],device=[YOUR-GPU-DEVICE-ID2]`
               - To specify more parameters, use `--gpus device=[YOUR-GPU-DEVICE-ID],runtime=nvidia,capabilities=display
+        :param hash_key: The tag of the docs whose value routes them to a shard with `HASH` polling. The id of the docs is used if not set or a doc does not have the tag.
+        :param hedging: JSON dict that enables hedged requests per endpoint, {endpoint: delay}.
+              If a replica did not respond after the delay, a duplicate of the request is sent to another replica and the
+              first response is used. The delay is either given in milliseconds or as a percentile of the latency observed
+              for the deployment, like `p95`. `*` matches all other endpoints.
+              {'/search': 'p95', '/custom': 50}
         :param host: The host address of the runtime, by default it is 0.0.0.0.
         :param host_in: The host address for binding to, by default it is 0.0.0.0
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle to local
+        :param load_balancing: The strategy used to select the replica a request is sent to.
+              - ROUND_ROBIN: replicas are selected in turn
+              - LEAST_OUTSTANDING: the replica with the least in-flight requests is selected
+              - POWER_OF_TWO: two random replicas are compared by in-flight requests and observed latency, the cheaper one is selected
         :param log_config: The YAML config of the logger used in this object.
         :param name: The name of this object.
 
@@ -650,6 +753,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
               Define per Deployment:
               - ANY: only one (whoever is idle) Pod polls the message
               - ALL: all Pods poll the message (like a broadcast)
+              - HASH: the docs are split across the Pods by a consistent hash of their id or `--hash-key` tag
               Define per Endpoint:
               JSON dict, {endpoint: PollingType}
               {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
@@ -666,9 +770,15 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param quiet_error: If set, then exception stack information will not be added to the log
         :param quiet_remote_logs: Do not display the streaming of remote logs on local console
         :param replicas: The number of replicas in the deployment
+        :param retry_policy: JSON dict that configures how requests failing with a retryable gRPC status are retried.
+              Possible keys are `max_attempts`, `initial_backoff` and `max_backoff` in seconds, `backoff_multiplier`, `jitter`,
+              `retry_on_different_replica`, `retry_budget` as the share of the traffic of a deployment that may be retried and
+              `retryable_status_codes`.
+              {'max_attempts': 3, 'initial_backoff': 0.05, 'retry_budget': 0.2, 'retryable_status_codes': ['UNAVAILABLE']}
         :param runtime_backend: The parallel backend of the runtime inside the Pod
         :param runtime_cls: The runtime class to run inside the Pod
         :param shards: The number of shards in the deployment running at the same time. For more details check https://docs.jina.ai/fundamentals/flow/create-flow/#complex-flow-topologies
+        :param shared_memory: If set, the docs of large data requests are passed to Deployments on the same host in shared memory instead of being sent over gRPC. Requires unix domain sockets and a Linux host.
         :param timeout_ctrl: The timeout in milliseconds of the control request, -1 for waiting forever
         :param timeout_ready: The timeout in milliseconds of a Pod waits for the runtime to be ready, -1 for waiting forever
         :param upload_files: The files on the host to be uploaded to the remote
@@ -116,9 +116,17 @@ When not given, then the default naming strategy will apply.
     Define per Deployment:
     - ANY: only one (whoever is idle) Pod polls the message
     - ALL: all Pods poll the message (like a broadcast)
+    - HASH: the docs are split across the Pods by a consistent hash of their id or `--hash-key` tag
     Define per Endpoint:
     JSON dict, {endpoint: PollingType}
     {'/custom': 'ALL', '/search': 'ANY', '*': 'ANY'}
     
     ''',
     )
+
+    gp.add_argument(
+        '--hash-key',
+        type=str,
+        help='The tag of the docs whose value routes them to a shard with `HASH` polling. The id of the docs is used '
+        'if not set or a doc does not have the tag.',
+    )
@@ -1,3 +1,4 @@
+from jina.enums import CompressionType, LoadBalancingType
 from jina.parsers.helper import add_arg_group
 
 
@@ -25,3 +26,85 @@ def mixin_head_parser(parser):
         type=str,
         help='dictionary JSON with a list of connections to configure',
     )
+
+    gp.add_argument(
+        '--load-balancing',
+        type=LoadBalancingType.from_string,
+        choices=list(LoadBalancingType),
+        default=LoadBalancingType.ROUND_ROBIN,
+        help='''
+    The strategy used to select the replica a request is sent to.
+    - ROUND_ROBIN: replicas are selected in turn
+    - LEAST_OUTSTANDING: the replica with the least in-flight requests is selected
+    - POWER_OF_TWO: two random replicas are compared by in-flight requests and observed latency, the cheaper one is selected
+    ''',
+    )
+
+    gp.add_argument(
+        '--hedging',
+        type=str,
+        help='''
+    JSON dict that enables hedged requests per endpoint, {endpoint: delay}.
+    If a replica did not respond after the delay, a duplicate of the request is sent to another replica and the
+    first response is used. The delay is either given in milliseconds or as a percentile of the latency observed
+    for the deployment, like `p95`. `*` matches all other endpoints.
+    {'/search': 'p95', '/custom': 50}
+    ''',
+    )
+
+    gp.add_argument(
+        '--retry-policy',
+        type=str,
+        help='''
+    JSON dict that configures how requests failing with a retryable gRPC status are retried.
+    Possible keys are `max_attempts`, `initial_backoff` and `max_backoff` in seconds, `backoff_multiplier`, `jitter`,
+    `retry_on_different_replica`, `retry_budget` as the share of the traffic of a deployment that may be retried and
+    `retryable_status_codes`.
+    {'max_attempts': 3, 'initial_backoff': 0.05, 'retry_budget': 0.2, 'retryable_status_codes': ['UNAVAILABLE']}
+    ''',
+    )
+
+    gp.add_argument(
+        '--concurrency-limit',
+        type=str,
+        help='''
+    JSON dict that enables an adaptive limit of the data requests in flight per Deployment. The limit grows while the
+    latency stays low and shrinks once it rises or the Deployment is overloaded. Requests above the limit wait in a
+    bounded queue and fail with RESOURCE_EXHAUSTED once it is full or they waited longer than `queue_timeout` seconds.
+    Possible keys are `initial_limit`, `min_limit`, `max_limit`, `max_queue_size`, `queue_timeout`,
+    `latency_tolerance` and `backoff_ratio`.
+    {'initial_limit': 20, 'max_queue_size': 100, 'queue_timeout': 1.0}
+    ''',
+    )
+
+    gp.add_argument(
+        '--data-streaming',
+        action='store_true',
+        default=False,
+        help='If set, data requests are multiplexed over a long-lived bidirectional gRPC stream per replica instead '
+        'of one unary call per request. Replicas which do not support streaming are served with unary calls.',
+    )
+
+    gp.add_argument(
+        '--shared-memory',
+        action='store_true',
+        default=False,
+        help='If set, the docs of large data requests are passed to Deployments on the same host in shared memory '
+        'instead of being sent over gRPC. Requires unix domain sockets and a Linux host.',
+    )
+
+    gp.add_argument(
+        '--compression',
+        type=CompressionType.from_string,
+        choices=list(CompressionType),
+        default=CompressionType.NONE,
+        help='The gRPC compression of data requests sent to Deployments on other hosts and of the responses sent '
+        'back to them. Messages smaller than `--compression-min-bytes` are sent uncompressed.',
+    )
+
+    gp.add_argument(
+        '--compression-min-bytes',
+        type=int,
+        default=1024,
+        help='The minimum size in bytes of a data request or response to be compressed with `--compression`.',
+    )
@@ -72,6 +72,40 @@ def mixin_gateway_parser(parser):
         default='{}',
     )
 
+    gp.add_argument(
+        '--response-cache',
+        type=str,
+        help='''
+    JSON dict that enables a cache of the responses to requests to idempotent endpoints in the gateway. Requests with
+    the same endpoint, target executor, parameters and docs are answered from the cache without passing the Executors.
+    Possible keys are `endpoints`, `max_entries`, `max_bytes` and `ttl` in seconds.
+    {'endpoints': ['/search'], 'max_entries': 1000, 'max_bytes': 67108864, 'ttl': 60}
+    ''',
+    )
+
+    gp.add_argument(
+        '--request-batching',
+        type=str,
+        help='''
+    JSON dict that enables coalescing the requests of different clients in the gateway before they are sent to the
+    first Executors. Requests to the same endpoint with the same parameters are sent as one request, and the response
+    is split back to the clients by the ids of their Documents.
+    Possible keys are `endpoints`, `max_batch_docs` and `max_wait_ms`.
+    {'endpoints': ['/encode'], 'max_batch_docs': 64, 'max_wait_ms': 5}
+    ''',
+    )
+
+    gp.add_argument(
+        '--singleflight-endpoints',
+        type=str,
+        nargs='*',
+        default=[],
+        help='''
+    The endpoints whose identical requests are collapsed in the gateway. A request with the same endpoint, target
+    executor, parameters and docs as a request in flight is not sent to the Executors, it gets a copy of the response
+    of the request in flight instead.''',
+    )
+
 
 def _add_host(arg_group):
     arg_group.add_argument(
@@ -185,6 +219,18 @@ def mixin_prefetch_parser(parser=None):
     Used to control the speed of data input into a Flow. 0 disables prefetch (disabled by default)''',
     )
 
+    gp.add_argument(
+        '--prefetch-window',
+        type=str,
+        help='''
+    JSON dict that enables an adaptive window of the requests in flight per client, used instead of `--prefetch`.
+    The window grows while the latency of the requests stays low and shrinks once it rises. Independently of the
+    window, no more requests are fetched from the client once the requests in flight hold `max_bytes`.
+    Possible keys are `initial_size`, `min_size`, `max_size`, `max_bytes`, `latency_tolerance` and `backoff_ratio`.
+    {'initial_size': 10, 'max_size': 1000, 'max_bytes': 268435456}
+    ''',
+    )
+
 
 def mixin_compressor_parser(parser=None):
     """Add the options for compressors
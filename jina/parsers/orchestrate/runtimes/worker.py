@@ -85,6 +85,13 @@ which should be structured as a python package. For more details, please see the
         default=__default_host__,
         help=f'The host address for binding to, by default it is {__default_host__}',
     )
+    gp.add_argument(
+        '--disable-uds',
+        action='store_true',
+        default=False,
+        help='If set, the runtime does not listen on a unix domain socket next to `port_in` and connects to runtimes '
+        'on the local host over TCP instead of their unix domain sockets.',
+    )
 
     gp.add_argument(
         '--native',
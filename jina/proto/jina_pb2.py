@@ -17,7 +17,7 @@ from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 import docarray.proto.docarray_pb2 as docarray__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\njina.proto\x12\x04jina\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x0e\x64ocarray.proto\"\x9f\x01\n\nRouteProto\x12\x10\n\x08\x65xecutor\x18\x01 \x01(\t\x12.\n\nstart_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12!\n\x06status\x18\x04 \x01(\x0b\x32\x11.jina.StatusProto\"\xc6\x01\n\x0bHeaderProto\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12!\n\x06status\x18\x02 \x01(\x0b\x32\x11.jina.StatusProto\x12\x1a\n\rexec_endpoint\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x0ftarget_executor\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07timeout\x18\x05 \x01(\rH\x02\x88\x01\x01\x42\x10\n\x0e_exec_endpointB\x12\n\x10_target_executorB\n\n\x08_timeout\"\xcf\x02\n\x0bStatusProto\x12*\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x1c.jina.StatusProto.StatusCode\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x33\n\texception\x18\x03 \x01(\x0b\x32 .jina.StatusProto.ExceptionProto\x1aN\n\x0e\x45xceptionProto\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x02 \x03(\t\x12\x0e\n\x06stacks\x18\x03 \x03(\t\x12\x10\n\x08\x65xecutor\x18\x04 \x01(\t\"z\n\nStatusCode\x12\x0b\n\x07SUCCESS\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\t\n\x05READY\x10\x02\x12\t\n\x05\x45RROR\x10\x03\x12\x13\n\x0f\x45RROR_DUPLICATE\x10\x04\x12\x14\n\x10\x45RROR_NOTALLOWED\x10\x05\x12\x11\n\rERROR_CHAINED\x10\x06\"^\n\rRelatedEntity\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\r\x12\x15\n\x08shard_id\x18\x04 \x01(\rH\x00\x88\x01\x01\x42\x0b\n\t_shard_id\"\xcf\x01\n\x13\x43ontrolRequestProto\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x11.jina.HeaderProto\x12\x32\n\x07\x63ommand\x18\x02 \x01(\x0e\x32!.jina.ControlRequestProto.Command\x12,\n\x0frelatedEntities\x18\x03 \x03(\x0b\x32\x13.jina.RelatedEntity\"3\n\x07\x43ommand\x12\n\n\x06STATUS\x10\x00\x12\x0c\n\x08\x41\x43TIVATE\x10\x01\x12\x0e\n\nDEACTIVATE\x10\x02\"\xa0\x02\n\x10\x44\x61taRequestProto\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x11.jina.HeaderProto\x12+\n\nparameters\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12 \n\x06routes\x18\x03 \x03(\x0b\x32\x10.jina.RouteProto\x12\x35\n\x04\x64\x61ta\x18\x04 \x01(\x0b\x32\'.jina.DataRequestProto.DataContentProto\x1a\x63\n\x10\x44\x61taContentProto\x12,\n\x04\x64ocs\x18\x01 \x01(\x0b\x32\x1c.docarray.DocumentArrayProtoH\x00\x12\x14\n\ndocs_bytes\x18\x02 \x01(\x0cH\x00\x42\x0b\n\tdocuments\"@\n\x14\x44\x61taRequestListProto\x12(\n\x08requests\x18\x01 \x03(\x0b\x32\x16.jina.DataRequestProto2b\n\x15JinaControlRequestRPC\x12I\n\x0fprocess_control\x12\x19.jina.ControlRequestProto\x1a\x19.jina.ControlRequestProto\"\x00\x32Z\n\x12JinaDataRequestRPC\x12\x44\n\x0cprocess_data\x12\x1a.jina.DataRequestListProto\x1a\x16.jina.DataRequestProto\"\x00\x32\x63\n\x18JinaSingleDataRequestRPC\x12G\n\x13process_single_data\x12\x16.jina.DataRequestProto\x1a\x16.jina.DataRequestProto\"\x00\x32G\n\x07JinaRPC\x12<\n\x04\x43\x61ll\x12\x16.jina.DataRequestProto\x1a\x16.jina.DataRequestProto\"\x00(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\njina.proto\x12\x04jina\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x0e\x64ocarray.proto\"\x9f\x01\n\nRouteProto\x12\x10\n\x08\x65xecutor\x18\x01 \x01(\t\x12.\n\nstart_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12!\n\x06status\x18\x04 \x01(\x0b\x32\x11.jina.StatusProto\"\x9e\x02\n\x0bHeaderProto\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12!\n\x06status\x18\x02 \x01(\x0b\x32\x11.jina.StatusProto\x12\x1a\n\rexec_endpoint\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x0ftarget_executor\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07timeout\x18\x05 \x01(\rH\x02\x88\x01\x01\x12\x17\n\ndocs_codec\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x1b\n\x0etensor_columns\x18\x07 \x01(\x08H\x04\x88\x01\x01\x42\x10\n\x0e_exec_endpointB\x12\n\x10_target_executorB\n\n\x08_timeoutB\r\n\x0b_docs_codecB\x11\n\x0f_tensor_columns\"\xcf\x02\n\x0bStatusProto\x12*\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x1c.jina.StatusProto.StatusCode\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x33\n\texception\x18\x03 \x01(\x0b\x32 .jina.StatusProto.ExceptionProto\x1aN\n\x0e\x45xceptionProto\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x02 \x03(\t\x12\x0e\n\x06stacks\x18\x03 \x03(\t\x12\x10\n\x08\x65xecutor\x18\x04 \x01(\t\"z\n\nStatusCode\x12\x0b\n\x07SUCCESS\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\t\n\x05READY\x10\x02\x12\t\n\x05\x45RROR\x10\x03\x12\x13\n\x0f\x45RROR_DUPLICATE\x10\x04\x12\x14\n\x10\x45RROR_NOTALLOWED\x10\x05\x12\x11\n\rERROR_CHAINED\x10\x06\"^\n\rRelatedEntity\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\r\x12\x15\n\x08shard_id\x18\x04 \x01(\rH\x00\x88\x01\x01\x42\x0b\n\t_shard_id\"\xcf\x01\n\x13\x43ontrolRequestProto\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x11.jina.HeaderProto\x12\x32\n\x07\x63ommand\x18\x02 \x01(\x0e\x32!.jina.ControlRequestProto.Command\x12,\n\x0frelatedEntities\x18\x03 \x03(\x0b\x32\x13.jina.RelatedEntity\"3\n\x07\x43ommand\x12\n\n\x06STATUS\x10\x00\x12\x0c\n\x08\x41\x43TIVATE\x10\x01\x12\x0e\n\nDEACTIVATE\x10\x02\"W\n\x11SharedMemoryProto\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x04\x12\x10\n\x08is_proto\x18\x03 \x01(\x08\x12\x14\n\x0cwith_columns\x18\x04 \x01(\x08\"A\n\x11TensorColumnProto\x12\x0e\n\x06\x62uffer\x18\x01 \x01(\x0c\x12\r\n\x05\x64type\x18\x02 \x01(\t\x12\r\n\x05shape\x18\x03 \x03(\x04\"\xde\x03\n\x10\x44\x61taRequestProto\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x11.jina.HeaderProto\x12+\n\nparameters\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12 \n\x06routes\x18\x03 \x03(\x0b\x32\x10.jina.RouteProto\x12\x35\n\x04\x64\x61ta\x18\x04 \x01(\x0b\x32\'.jina.DataRequestProto.DataContentProto\x1a\xa0\x02\n\x10\x44\x61taContentProto\x12,\n\x04\x64ocs\x18\x01 \x01(\x0b\x32\x1c.docarray.DocumentArrayProtoH\x00\x12\x14\n\ndocs_bytes\x18\x02 \x01(\x0cH\x00\x12+\n\x08\x64ocs_shm\x18\x03 \x01(\x0b\x32\x17.jina.SharedMemoryProtoH\x00\x12\x45\n\x07\x63olumns\x18\x04 \x03(\x0b\x32\x34.jina.DataRequestProto.DataContentProto.ColumnsEntry\x1aG\n\x0c\x43olumnsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.jina.TensorColumnProto:\x02\x38\x01\x42\x0b\n\tdocuments\"\x98\x01\n\x16\x44\x61taRequestProtoWoData\x12!\n\x06header\x18\x01 \x01(\x0b\x32\x11.jina.HeaderProto\x12+\n\nparameters\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12 \n\x06routes\x18\x03 \x03(\x0b\x32\x10.jina.RouteProto\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\"@\n\x14\x44\x61taRequestListProto\x12(\n\x08requests\x18\x01 \x03(\x0b\x32\x16.jina.DataRequestProto\"\xb1\x01\n\x16\x44\x61taRequestStreamProto\x12(\n\x08requests\x18\x01 \x03(\x0b\x32\x16.jina.DataRequestProto\x12<\n\x08metadata\x18\x02 \x03(\x0b\x32*.jina.DataRequestStreamProto.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\x62\n\x15JinaControlRequestRPC\x12I\n\x0fprocess_control\x12\x19.jina.ControlRequestProto\x1a\x19.jina.ControlRequestProto\"\x00\x32Z\n\x12JinaDataRequestRPC\x12\x44\n\x0cprocess_data\x12\x1a.jina.DataRequestListProto\x1a\x16.jina.DataRequestProto\"\x00\x32\x63\n\x18JinaSingleDataRequestRPC\x12G\n\x13process_single_data\x12\x16.jina.DataRequestProto\x1a\x16.jina.DataRequestProto\"\x00\x32s\n\x18JinaDataRequestStreamRPC\x12W\n\x13process_data_stream\x12\x1c.jina.DataRequestStreamProto\x1a\x1c.jina.DataRequestStreamProto\"\x00(\x01\x30\x01\x32G\n\x07JinaRPC\x12<\n\x04\x43\x61ll\x12\x16.jina.DataRequestProto\x1a\x16.jina.DataRequestProto\"\x00(\x01\x30\x01\x62\x06proto3')
 
 
 
@@ -27,9 +27,15 @@ _STATUSPROTO = DESCRIPTOR.message_types_by_name['StatusProto']
 _STATUSPROTO_EXCEPTIONPROTO = _STATUSPROTO.nested_types_by_name['ExceptionProto']
 _RELATEDENTITY = DESCRIPTOR.message_types_by_name['RelatedEntity']
 _CONTROLREQUESTPROTO = DESCRIPTOR.message_types_by_name['ControlRequestProto']
+_SHAREDMEMORYPROTO = DESCRIPTOR.message_types_by_name['SharedMemoryProto']
+_TENSORCOLUMNPROTO = DESCRIPTOR.message_types_by_name['TensorColumnProto']
 _DATAREQUESTPROTO = DESCRIPTOR.message_types_by_name['DataRequestProto']
 _DATAREQUESTPROTO_DATACONTENTPROTO = _DATAREQUESTPROTO.nested_types_by_name['DataContentProto']
+_DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY = _DATAREQUESTPROTO_DATACONTENTPROTO.nested_types_by_name['ColumnsEntry']
+_DATAREQUESTPROTOWODATA = DESCRIPTOR.message_types_by_name['DataRequestProtoWoData']
 _DATAREQUESTLISTPROTO = DESCRIPTOR.message_types_by_name['DataRequestListProto']
+_DATAREQUESTSTREAMPROTO = DESCRIPTOR.message_types_by_name['DataRequestStreamProto']
+_DATAREQUESTSTREAMPROTO_METADATAENTRY = _DATAREQUESTSTREAMPROTO.nested_types_by_name['MetadataEntry']
 _STATUSPROTO_STATUSCODE = _STATUSPROTO.enum_types_by_name['StatusCode']
 _CONTROLREQUESTPROTO_COMMAND = _CONTROLREQUESTPROTO.enum_types_by_name['Command']
 RouteProto = _reflection.GeneratedProtocolMessageType('RouteProto', (_message.Message,), {
@@ -75,9 +81,30 @@ ControlRequestProto = _reflection.GeneratedProtocolMessageType('ControlRequestPr
   })
 _sym_db.RegisterMessage(ControlRequestProto)
 
+SharedMemoryProto = _reflection.GeneratedProtocolMessageType('SharedMemoryProto', (_message.Message,), {
+  'DESCRIPTOR' : _SHAREDMEMORYPROTO,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.SharedMemoryProto)
+  })
+_sym_db.RegisterMessage(SharedMemoryProto)
+
+TensorColumnProto = _reflection.GeneratedProtocolMessageType('TensorColumnProto', (_message.Message,), {
+  'DESCRIPTOR' : _TENSORCOLUMNPROTO,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.TensorColumnProto)
+  })
+_sym_db.RegisterMessage(TensorColumnProto)
+
 DataRequestProto = _reflection.GeneratedProtocolMessageType('DataRequestProto', (_message.Message,), {
 
   'DataContentProto' : _reflection.GeneratedProtocolMessageType('DataContentProto', (_message.Message,), {
+
+    'ColumnsEntry' : _reflection.GeneratedProtocolMessageType('ColumnsEntry', (_message.Message,), {
+      'DESCRIPTOR' : _DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY,
+      '__module__' : 'jina_pb2'
+      # @@protoc_insertion_point(class_scope:jina.DataRequestProto.DataContentProto.ColumnsEntry)
+      })
+    ,
     'DESCRIPTOR' : _DATAREQUESTPROTO_DATACONTENTPROTO,
     '__module__' : 'jina_pb2'
     # @@protoc_insertion_point(class_scope:jina.DataRequestProto.DataContentProto)
@@ -89,6 +116,14 @@ DataRequestProto = _reflection.GeneratedProtocolMessageType('DataRequestProto',
   })
 _sym_db.RegisterMessage(DataRequestProto)
 _sym_db.RegisterMessage(DataRequestProto.DataContentProto)
+_sym_db.RegisterMessage(DataRequestProto.DataContentProto.ColumnsEntry)
+
+DataRequestProtoWoData = _reflection.GeneratedProtocolMessageType('DataRequestProtoWoData', (_message.Message,), {
+  'DESCRIPTOR' : _DATAREQUESTPROTOWODATA,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.DataRequestProtoWoData)
+  })
+_sym_db.RegisterMessage(DataRequestProtoWoData)
 
 DataRequestListProto = _reflection.GeneratedProtocolMessageType('DataRequestListProto', (_message.Message,), {
   'DESCRIPTOR' : _DATAREQUESTLISTPROTO,
@@ -97,41 +132,75 @@ DataRequestListProto = _reflection.GeneratedProtocolMessageType('DataRequestList
   })
 _sym_db.RegisterMessage(DataRequestListProto)
 
+DataRequestStreamProto = _reflection.GeneratedProtocolMessageType('DataRequestStreamProto', (_message.Message,), {
+
+  'MetadataEntry' : _reflection.GeneratedProtocolMessageType('MetadataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _DATAREQUESTSTREAMPROTO_METADATAENTRY,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.DataRequestStreamProto.MetadataEntry)
+    })
+  ,
+  'DESCRIPTOR' : _DATAREQUESTSTREAMPROTO,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.DataRequestStreamProto)
+  })
+_sym_db.RegisterMessage(DataRequestStreamProto)
+_sym_db.RegisterMessage(DataRequestStreamProto.MetadataEntry)
+
 _JINACONTROLREQUESTRPC = DESCRIPTOR.services_by_name['JinaControlRequestRPC']
 _JINADATAREQUESTRPC = DESCRIPTOR.services_by_name['JinaDataRequestRPC']
 _JINASINGLEDATAREQUESTRPC = DESCRIPTOR.services_by_name['JinaSingleDataRequestRPC']
+_JINADATAREQUESTSTREAMRPC = DESCRIPTOR.services_by_name['JinaDataRequestStreamRPC']
 _JINARPC = DESCRIPTOR.services_by_name['JinaRPC']
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
+  _DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY._options = None
+  _DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY._serialized_options = b'8\001'
+  _DATAREQUESTSTREAMPROTO_METADATAENTRY._options = None
+  _DATAREQUESTSTREAMPROTO_METADATAENTRY._serialized_options = b'8\001'
   _ROUTEPROTO._serialized_start=100
   _ROUTEPROTO._serialized_end=259
   _HEADERPROTO._serialized_start=262
-  _HEADERPROTO._serialized_end=460
-  _STATUSPROTO._serialized_start=463
-  _STATUSPROTO._serialized_end=798
-  _STATUSPROTO_EXCEPTIONPROTO._serialized_start=596
-  _STATUSPROTO_EXCEPTIONPROTO._serialized_end=674
-  _STATUSPROTO_STATUSCODE._serialized_start=676
-  _STATUSPROTO_STATUSCODE._serialized_end=798
-  _RELATEDENTITY._serialized_start=800
-  _RELATEDENTITY._serialized_end=894
-  _CONTROLREQUESTPROTO._serialized_start=897
-  _CONTROLREQUESTPROTO._serialized_end=1104
-  _CONTROLREQUESTPROTO_COMMAND._serialized_start=1053
-  _CONTROLREQUESTPROTO_COMMAND._serialized_end=1104
-  _DATAREQUESTPROTO._serialized_start=1107
-  _DATAREQUESTPROTO._serialized_end=1395
-  _DATAREQUESTPROTO_DATACONTENTPROTO._serialized_start=1296
-  _DATAREQUESTPROTO_DATACONTENTPROTO._serialized_end=1395
-  _DATAREQUESTLISTPROTO._serialized_start=1397
-  _DATAREQUESTLISTPROTO._serialized_end=1461
-  _JINACONTROLREQUESTRPC._serialized_start=1463
-  _JINACONTROLREQUESTRPC._serialized_end=1561
-  _JINADATAREQUESTRPC._serialized_start=1563
-  _JINADATAREQUESTRPC._serialized_end=1653
-  _JINASINGLEDATAREQUESTRPC._serialized_start=1655
-  _JINASINGLEDATAREQUESTRPC._serialized_end=1754
-  _JINARPC._serialized_start=1756
-  _JINARPC._serialized_end=1827
+  _HEADERPROTO._serialized_end=548
+  _STATUSPROTO._serialized_start=551
+  _STATUSPROTO._serialized_end=886
+  _STATUSPROTO_EXCEPTIONPROTO._serialized_start=684
+  _STATUSPROTO_EXCEPTIONPROTO._serialized_end=762
+  _STATUSPROTO_STATUSCODE._serialized_start=764
+  _STATUSPROTO_STATUSCODE._serialized_end=886
+  _RELATEDENTITY._serialized_start=888
+  _RELATEDENTITY._serialized_end=982
+  _CONTROLREQUESTPROTO._serialized_start=985
+  _CONTROLREQUESTPROTO._serialized_end=1192
+  _CONTROLREQUESTPROTO_COMMAND._serialized_start=1141
+  _CONTROLREQUESTPROTO_COMMAND._serialized_end=1192
+  _SHAREDMEMORYPROTO._serialized_start=1194
+  _SHAREDMEMORYPROTO._serialized_end=1281
+  _TENSORCOLUMNPROTO._serialized_start=1283
+  _TENSORCOLUMNPROTO._serialized_end=1348
+  _DATAREQUESTPROTO._serialized_start=1351
+  _DATAREQUESTPROTO._serialized_end=1829
+  _DATAREQUESTPROTO_DATACONTENTPROTO._serialized_start=1541
+  _DATAREQUESTPROTO_DATACONTENTPROTO._serialized_end=1829
+  _DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY._serialized_start=1745
+  _DATAREQUESTPROTO_DATACONTENTPROTO_COLUMNSENTRY._serialized_end=1816
+  _DATAREQUESTPROTOWODATA._serialized_start=1832
+  _DATAREQUESTPROTOWODATA._serialized_end=1984
+  _DATAREQUESTLISTPROTO._serialized_start=1986
+  _DATAREQUESTLISTPROTO._serialized_end=2050
+  _DATAREQUESTSTREAMPROTO._serialized_start=2053
+  _DATAREQUESTSTREAMPROTO._serialized_end=2230
+  _DATAREQUESTSTREAMPROTO_METADATAENTRY._serialized_start=2183
+  _DATAREQUESTSTREAMPROTO_METADATAENTRY._serialized_end=2230
+  _JINACONTROLREQUESTRPC._serialized_start=2232
+  _JINACONTROLREQUESTRPC._serialized_end=2330
+  _JINADATAREQUESTRPC._serialized_start=2332
+  _JINADATAREQUESTRPC._serialized_end=2422
+  _JINASINGLEDATAREQUESTRPC._serialized_start=2424
+  _JINASINGLEDATAREQUESTRPC._serialized_end=2523
+  _JINADATAREQUESTSTREAMRPC._serialized_start=2525
+  _JINADATAREQUESTSTREAMRPC._serialized_end=2640
+  _JINARPC._serialized_start=2642
+  _JINARPC._serialized_end=2713
 # @@protoc_insertion_point(module_scope)
@@ -212,6 +212,80 @@ class JinaSingleDataRequestRPC(object):
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
+class JinaDataRequestStreamRPCStub(object):
+    """*
+    jina gRPC service for DataRequests.
+    This is used to send many concurrent requests to Executors over a single long-lived stream,
+    responses are matched to requests by their request_id
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.process_data_stream = channel.stream_stream(
+                '/jina.JinaDataRequestStreamRPC/process_data_stream',
+                request_serializer=jina__pb2.DataRequestStreamProto.SerializeToString,
+                response_deserializer=jina__pb2.DataRequestStreamProto.FromString,
+                )
+
+
+class JinaDataRequestStreamRPCServicer(object):
+    """*
+    jina gRPC service for DataRequests.
+    This is used to send many concurrent requests to Executors over a single long-lived stream,
+    responses are matched to requests by their request_id
+    """
+
+    def process_data_stream(self, request_iterator, context):
+        """Used for passing DataRequests to the Executors
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_JinaDataRequestStreamRPCServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'process_data_stream': grpc.stream_stream_rpc_method_handler(
+                    servicer.process_data_stream,
+                    request_deserializer=jina__pb2.DataRequestStreamProto.FromString,
+                    response_serializer=jina__pb2.DataRequestStreamProto.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'jina.JinaDataRequestStreamRPC', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class JinaDataRequestStreamRPC(object):
+    """*
+    jina gRPC service for DataRequests.
+    This is used to send many concurrent requests to Executors over a single long-lived stream,
+    responses are matched to requests by their request_id
+    """
+
+    @staticmethod
+    def process_data_stream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/jina.JinaDataRequestStreamRPC/process_data_stream',
+            jina__pb2.DataRequestStreamProto.SerializeToString,
+            jina__pb2.DataRequestStreamProto.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+
 class JinaRPCStub(object):
     """*
     jina Gateway gRPC service.
@@ -1,9 +1,75 @@
-from typing import List, Union, Iterable
+from typing import Dict, List, Tuple, Union, Iterable
 
 from jina.proto import jina_pb2
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
 
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_FIXED64 = 1
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+_WIRE_TYPE_FIXED32 = 5
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value, shift = 0, 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _serialize_requests(field_number: int, requests: List[DataRequest]) -> bytes:
+    # a repeated message field is the concatenation of its length prefixed messages, requests which were not
+    # deserialized are written as they were received
+    tag = _encode_varint(field_number << 3 | _WIRE_TYPE_LENGTH_DELIMITED)
+    chunks = []
+    for request in requests:
+        payload = request.to_bytes()
+        chunks.extend((tag, _encode_varint(len(payload)), payload))
+    return b''.join(chunks)
+
+
+def _deserialize_requests(
+    field_number: int, data: bytes
+) -> Tuple[List[DataRequest], bytes]:
+    # splits the requests of a repeated message field from the other fields without parsing them
+    requests, other_fields = [], []
+    view = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        start = pos
+        key, pos = _decode_varint(data, pos)
+        wire_type = key & 0x7
+        if wire_type == _WIRE_TYPE_VARINT:
+            _, pos = _decode_varint(data, pos)
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            pos += 8
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            pos += 4
+        elif wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, pos = _decode_varint(data, pos)
+            if key >> 3 == field_number:
+                requests.append(DataRequest(bytes(view[pos : pos + length])))
+                pos += length
+                continue
+            pos += length
+        else:
+            raise ValueError(f'unsupported wire type {wire_type}')
+        other_fields.append(view[start:pos])
+    return requests, b''.join(other_fields)
+
 
 class ControlRequestProto:
     """This class is a drop-in replacement for gRPC default serializer.
@@ -48,9 +114,7 @@ class DataRequestProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        if not x.is_decompressed:
-            return x.buffer
-        return x.proto.SerializePartialToString()
+        return x.to_bytes()
 
     @staticmethod
     def FromString(x: bytes):
@@ -67,7 +131,9 @@ class DataRequestListProto:
     """This class is a drop-in replacement for gRPC default serializer.
     It replace default serializer to make sure the message sending interface is convenient.
     It can handle sending single messages or a list of messages. It also returns a list of messages.
-    Effectively this is hiding MessageListProto from the consumer
+    Effectively this is hiding MessageListProto from the consumer.
+    Requests which were not deserialized are sent as they were received, received requests are only parsed when
+    they are accessed
     """
 
     @staticmethod
@@ -77,14 +143,39 @@ class DataRequestListProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        protos = []
         if not isinstance(x, Iterable):
-            protos.append(x.proto)
-        else:
-            for r in x:
-                protos.append(r.proto)
+            x = [x]
+        return _serialize_requests(1, x)
+
+    @staticmethod
+    def FromString(x: bytes):
+        """
+        # noqa: DAR101
+        # noqa: DAR102
+        # noqa: DAR201
+        """
+        requests, _ = _deserialize_requests(1, x)
+        return requests
+
+
+class DataRequestStreamProto:
+    """This class is a drop-in replacement for gRPC default serializer.
+    It replace default serializer to make sure the messages of a data request stream are convenient to handle.
+    A message is a tuple of the list of requests and the metadata that would be sent with a unary call.
+    """
 
-        return jina_pb2.DataRequestListProto(requests=protos).SerializeToString()
+    @staticmethod
+    def SerializeToString(x: 'Tuple[List[DataRequest], Dict[str, str]]'):
+        """
+        # noqa: DAR101
+        # noqa: DAR102
+        # noqa: DAR201
+        """
+        requests, metadata = x
+        return (
+            _serialize_requests(1, requests)
+            + jina_pb2.DataRequestStreamProto(metadata=metadata).SerializeToString()
+        )
 
     @staticmethod
     def FromString(x: bytes):
@@ -93,10 +184,8 @@ class DataRequestListProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        rlp = jina_pb2.DataRequestListProto()
-        rlp.ParseFromString(x)
-        requests = []
-        for request in rlp.requests:
-            requests.append(DataRequest.from_proto(request))
+        requests, other_fields = _deserialize_requests(1, x)
+        message = jina_pb2.DataRequestStreamProto()
+        message.ParseFromString(other_fields)
 
-        return requests
+        return requests, dict(message.metadata)
@@ -0,0 +1,214 @@
+import functools
+import importlib.util
+import zlib
+from typing import List, Optional, Union
+
+import grpc
+
+from jina.enums import CompressAlgo, CompressionType
+from jina.logging.predefined import default_logger
+from jina.types.request.data import DataRequest
+
+_GRPC_COMPRESSION = {
+    CompressionType.GZIP: grpc.Compression.Gzip,
+    CompressionType.DEFLATE: grpc.Compression.Deflate,
+}
+
+
+def get_message_size(request: DataRequest) -> int:
+    """
+    Returns the size of the serialized request without serializing a request which was not deserialized
+
+    :param request: the request
+    :return: the size in bytes
+    """
+    if getattr(request, 'buffer', None) is not None:
+        return len(request.buffer)
+    return request.proto_wo_data.ByteSize()
+
+
+class MessageCompression:
+    """
+    Decides per call whether the messages are compressed and records how many bytes were sent compressed and
+    uncompressed. gRPC does not expose the size of compressed messages, so it is estimated from the compression ratio
+    of every `SAMPLE_INTERVAL`-th compressed message, which is compressed once more in process
+
+    :param compression: the compression algorithm
+    :param min_bytes: messages smaller than this number of bytes are sent uncompressed
+    """
+
+    MIN_BYTES = 1024
+    SAMPLE_INTERVAL = 20
+    # only the beginning of a sampled message is compressed, which is enough to estimate the ratio
+    SAMPLE_BYTES = 256 * 1024
+
+    def __init__(
+        self,
+        compression: CompressionType = CompressionType.NONE,
+        min_bytes: int = MIN_BYTES,
+    ):
+        self._compression = _GRPC_COMPRESSION.get(compression)
+        self._min_bytes = min_bytes
+        self._compressed_messages = 0
+        self._raw_bytes = 0
+        self._uncompressed_bytes = 0
+        self._sampled_raw_bytes = 0
+        self._sampled_compressed_bytes = 0
+
+    def __bool__(self):
+        return self._compression is not None
+
+    def get_compression(
+        self, requests: List[DataRequest]
+    ) -> Optional[grpc.Compression]:
+        """
+        Returns the compression of the call sending the requests and records their size
+
+        :param requests: the requests sent in one message
+        :return: the compression to pass to the call, None if the message is sent uncompressed
+        """
+        if self._compression is None:
+            return None
+        size = sum(get_message_size(r) for r in requests)
+        if size < self._min_bytes:
+            self._uncompressed_bytes += size
+            return None
+        if self._compressed_messages % self.SAMPLE_INTERVAL == 0:
+            self._sample(requests)
+        self._compressed_messages += 1
+        self._raw_bytes += size
+        return self._compression
+
+    def _sample(self, requests: List[DataRequest]):
+        sample, remaining = [], self.SAMPLE_BYTES
+        for request in requests:
+            if remaining <= 0:
+                break
+            payload = request.to_bytes()[:remaining]
+            sample.append(payload)
+            remaining -= len(payload)
+        sample = b''.join(sample)
+        self._sampled_raw_bytes += len(sample)
+        self._sampled_compressed_bytes += len(zlib.compress(sample))
+
+    @property
+    def raw_bytes(self) -> int:
+        """
+        Number of bytes of the messages which were sent compressed, before compression
+
+        :return: the number of bytes
+        """
+        return self._raw_bytes
+
+    @property
+    def compressed_bytes(self) -> int:
+        """
+        Estimated number of bytes of the messages which were sent compressed, after compression
+
+        :return: the number of bytes
+        """
+        if not self._sampled_raw_bytes:
+            return self._raw_bytes
+        return int(
+            self._raw_bytes * self._sampled_compressed_bytes / self._sampled_raw_bytes
+        )
+
+    @property
+    def uncompressed_bytes(self) -> int:
+        """
+        Number of bytes of the messages which were sent uncompressed because they were smaller than the threshold
+
+        :return: the number of bytes
+        """
+        return self._uncompressed_bytes
+
+
+# the packages of the algorithms which are not in the standard library
+_COMPRESS_ALGO_PACKAGES = {CompressAlgo.LZ4: 'lz4', CompressAlgo.ZSTD: 'zstandard'}
+
+
+@functools.lru_cache()
+def get_compress_algo(algorithm: Union[str, CompressAlgo]) -> CompressAlgo:
+    """
+    Returns the algorithm docs are compressed with, zlib if the package of the requested one is not installed
+
+    :param algorithm: the requested algorithm
+    :return: the algorithm to use
+    """
+    if isinstance(algorithm, str):
+        algorithm = CompressAlgo.from_string(algorithm)
+    package = _COMPRESS_ALGO_PACKAGES.get(algorithm)
+    if package and importlib.util.find_spec(package) is None:
+        default_logger.warning(
+            f'`{package}` is not installed, docs are compressed with {CompressAlgo.ZLIB} instead of {algorithm}'
+        )
+        return CompressAlgo.ZLIB
+    return algorithm
+
+
+def compress_bytes(data: bytes, algorithm: CompressAlgo) -> bytes:
+    """
+    Compresses serialized docs
+
+    :param data: the serialized docs
+    :param algorithm: the algorithm, its package has to be installed
+    :return: the compressed docs
+    """
+    if algorithm == CompressAlgo.LZ4:
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    elif algorithm == CompressAlgo.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    elif algorithm == CompressAlgo.ZLIB:
+        return zlib.compress(data)
+    elif algorithm == CompressAlgo.GZIP:
+        import gzip
+
+        return gzip.compress(data)
+    elif algorithm == CompressAlgo.BZ2:
+        import bz2
+
+        return bz2.compress(data)
+    elif algorithm == CompressAlgo.LZMA:
+        import lzma
+
+        return lzma.compress(data)
+    return data
+
+
+def decompress_bytes(data: bytes, algorithm: Union[str, CompressAlgo]) -> bytes:
+    """
+    Decompresses serialized docs
+
+    :param data: the compressed docs
+    :param algorithm: the algorithm the docs were compressed with
+    :return: the serialized docs
+    """
+    if isinstance(algorithm, str):
+        algorithm = CompressAlgo.from_string(algorithm)
+    if algorithm == CompressAlgo.LZ4:
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+    elif algorithm == CompressAlgo.ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif algorithm == CompressAlgo.ZLIB:
+        return zlib.decompress(data)
+    elif algorithm == CompressAlgo.GZIP:
+        import gzip
+
+        return gzip.decompress(data)
+    elif algorithm == CompressAlgo.BZ2:
+        import bz2
+
+        return bz2.decompress(data)
+    elif algorithm == CompressAlgo.LZMA:
+        import lzma
+
+        return lzma.decompress(data)
+    return data
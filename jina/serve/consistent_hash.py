@@ -0,0 +1,90 @@
+import bisect
+import hashlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from docarray import DocumentArray
+
+from jina.serve.shared_memory import _copy_without_docs
+from jina.types.request.data import DataRequest
+
+if TYPE_CHECKING:
+    from docarray import Document
+
+
+def _hash(key: str) -> int:
+    # the builtin hash of strings is salted per process, every head has to map a key to the same shard
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], 'big')
+
+
+class ConsistentHashRing:
+    """
+    Maps keys to shards. Every shard owns `virtual_nodes` points on a ring of hashes, a key belongs to the shard owning
+    the first point after the hash of the key. When a shard is added or removed, only the keys of the points it gains
+    or loses move, about `1 / number of shards` of all keys
+
+    :param shard_ids: the ids of the shards
+    :param virtual_nodes: the number of points per shard, more points spread the keys more evenly
+    """
+
+    VIRTUAL_NODES = 160
+
+    def __init__(self, shard_ids: Iterable[int], virtual_nodes: int = VIRTUAL_NODES):
+        self.shard_ids = tuple(sorted(shard_ids))
+        points = sorted(
+            (_hash(f'{shard_id}-{i}'), shard_id)
+            for shard_id in self.shard_ids
+            for i in range(virtual_nodes)
+        )
+        self._hashes = [point[0] for point in points]
+        self._shard_ids = [point[1] for point in points]
+
+    def get_shard_id(self, key: str) -> int:
+        """
+        Returns the shard a key belongs to
+
+        :param key: the key
+        :return: the id of the shard
+        """
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._shard_ids[index]
+
+
+def get_hash_key(doc: 'Document', hash_key: Optional[str] = None) -> str:
+    """
+    Returns the key a document is routed by
+
+    :param doc: the document
+    :param hash_key: the tag holding the key, the id of the document is used if not given or the tag is not set
+    :return: the key
+    """
+    if hash_key:
+        value = doc.tags.get(hash_key)
+        if value is not None:
+            return str(value)
+    return doc.id
+
+
+def split_requests_by_shard(
+    requests: List[DataRequest],
+    ring: ConsistentHashRing,
+    hash_key: Optional[str] = None,
+) -> Dict[int, List[DataRequest]]:
+    """
+    Splits the docs of the requests across shards, every shard gets requests holding only the docs belonging to it
+
+    :param requests: the requests
+    :param ring: the ring mapping keys to shards
+    :param hash_key: the tag of the docs which is hashed instead of their id
+    :return: the requests to send to every shard which owns at least one of the docs
+    """
+    shard_requests = defaultdict(list)
+    for request in requests:
+        shard_docs = defaultdict(list)
+        for doc in request.docs:
+            shard_docs[ring.get_shard_id(get_hash_key(doc, hash_key))].append(doc)
+        for shard_id, docs in shard_docs.items():
+            shard_request = DataRequest(_copy_without_docs(request.proto))
+            shard_request.data.docs = DocumentArray(docs)
+            shard_requests[shard_id].append(shard_request)
+    return dict(shard_requests)
@@ -0,0 +1,103 @@
+import importlib.util
+from typing import Optional, Tuple
+
+from jina.importer import ImportExtensions
+from jina.types.request.data import DataRequest
+
+JSON_MEDIA_TYPE = 'application/json'
+# the serialized DataRequestProto
+PROTOBUF_MEDIA_TYPE = 'application/x-protobuf'
+# the DataRequest in the form of the JSON responses, encoded with msgpack
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+
+def get_binary_media_types() -> Tuple[str, ...]:
+    """
+    Get the binary media types DataRequests can be sent with, msgpack requires the `msgpack` package
+
+    :return: the media types
+    """
+    if importlib.util.find_spec('msgpack') is None:
+        return (PROTOBUF_MEDIA_TYPE,)
+    return PROTOBUF_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+
+
+def get_media_type(content_type: Optional[str]) -> Optional[str]:
+    """
+    Get the media type of a `Content-Type` header without its parameters
+
+    :param content_type: the value of the header
+    :return: the media type, None if the header is not set
+    """
+    if not content_type:
+        return None
+    return content_type.split(';', 1)[0].strip().lower()
+
+
+def get_accepted_media_type(accept: Optional[str], default: str) -> str:
+    """
+    Get the first media type of an `Accept` header which a DataRequest can be sent with
+
+    :param accept: the value of the header
+    :param default: the media type used if the header accepts any media type or none which is supported
+    :return: the media type
+    """
+    if accept:
+        supported = (JSON_MEDIA_TYPE,) + get_binary_media_types()
+        for media_type in accept.split(','):
+            media_type = get_media_type(media_type)
+            if media_type in supported:
+                return media_type
+    return default
+
+
+def request_to_bytes(request: DataRequest, media_type: str) -> bytes:
+    """
+    Serialize a DataRequest with a binary media type
+
+    :param request: the request
+    :param media_type: `application/x-protobuf` or `application/msgpack`
+    :return: the serialized request
+    """
+    if media_type == PROTOBUF_MEDIA_TYPE:
+        return request.to_bytes()
+    if media_type == MSGPACK_MEDIA_TYPE:
+        with ImportExtensions(required=True):
+            import msgpack
+
+        return msgpack.packb(request.to_dict())
+    raise ValueError(f'{media_type} is not a binary media type of DataRequests')
+
+
+def request_from_bytes(value: bytes, media_type: str) -> DataRequest:
+    """
+    Deserialize a DataRequest sent with a binary media type
+
+    :param value: the serialized request
+    :param media_type: `application/x-protobuf` or `application/msgpack`
+    :return: the request
+    """
+    if media_type == PROTOBUF_MEDIA_TYPE:
+        return DataRequest(value)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        with ImportExtensions(required=True):
+            import msgpack
+
+        return request_from_dict(msgpack.unpackb(value))
+    raise ValueError(f'{media_type} is not a binary media type of DataRequests')
+
+
+def request_from_dict(value: dict) -> DataRequest:
+    """
+    Create a DataRequest from its form in the JSON responses, see :meth:`DataRequest.to_dict`
+
+    :param value: the request as dict
+    :return: the request
+    """
+    from docarray import DocumentArray
+
+    docs = value.pop('data', None)
+    request = DataRequest(value)
+    if docs is not None:
+        request.data.docs = DocumentArray.from_dict(docs)
+    return request
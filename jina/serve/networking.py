@@ -1,8 +1,15 @@
 import os
 import asyncio
+import functools
 import ipaddress
-from threading import Thread
-from typing import Optional, List, Dict, TYPE_CHECKING, Tuple
+import math
+import random
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Thread, Lock
+from typing import Optional, List, Dict, TYPE_CHECKING, Tuple, Union
 from urllib.parse import urlparse
 
 import grpc
@@ -10,8 +17,14 @@ from grpc.aio import AioRpcError
 
 from jina.logging.logger import JinaLogger
 from jina.proto import jina_pb2_grpc
-from jina.enums import PollingType
+from jina.enums import CompressionType, PollingType, LoadBalancingType
 from jina.helper import get_or_reuse_loop
+from jina.serve.compression import MessageCompression
+from jina.serve.shared_memory import (
+    SharedMemorySegments,
+    inline_shared_memory_docs,
+    is_shared_memory_supported,
+)
 from jina.types.request import Request
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
@@ -20,16 +33,755 @@ if TYPE_CHECKING:
     import kubernetes
 
 
-class ReplicaList:
+def _get_remaining_time(requests: List[Request]) -> Optional[float]:
+    remaining = [
+        r.remaining_time
+        for r in requests
+        if type(r) == DataRequest and r.remaining_time is not None
+    ]
+    return min(remaining) if remaining else None
+
+
+def _deadline_exceeded(details: str) -> AioRpcError:
+    return AioRpcError(
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.aio.Metadata(),
+        grpc.aio.Metadata(),
+        details=details,
+    )
+
+
+class _ConnectionStats:
     """
-    Maintains a list of connections to replicas and uses round robin for selecting a replica
+    Book-keeping of the requests in flight, the observed latency and the health of a single connection
     """
 
+    # weight of the latest observation in the exponentially weighted moving average of the latency
+    EWMA_ALPHA = 0.3
+    # number of the most recent request outcomes used to compute the error rate
+    OUTCOME_WINDOW_SIZE = 20
+
     def __init__(self):
+        self.in_flight = 0
+        self.ewma_latency = 0.0
+        self.consecutive_failures = 0
+        self.consecutive_successes = 0
+        self.outcomes = deque(maxlen=self.OUTCOME_WINDOW_SIZE)
+        # the connection is ejected until this time, None if it is healthy
+        self.ejected_until: Optional[float] = None
+        self.ejection_count = 0
+        # True while the single probe request of a half-open connection is in flight
+        self.probing = False
+
+    def update_latency(self, latency: float):
+        """
+        Update the moving average of the latency with a new observation
+
+        :param latency: the observed latency in seconds
+        """
+        if self.ewma_latency == 0.0:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = (
+                self.EWMA_ALPHA * latency + (1 - self.EWMA_ALPHA) * self.ewma_latency
+            )
+
+    @property
+    def cost(self) -> float:
+        """
+        Expected cost of sending one more request over this connection. Connections without latency observations are
+        only weighted by the number of requests in flight
+
+        :return: the cost of this connection
+        """
+        return (self.in_flight + 1) * (self.ewma_latency or 1.0)
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Share of failed requests among the most recent requests sent over this connection
+
+        :return: the error rate between 0 and 1
+        """
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def is_ejected(self) -> bool:
+        """
+        Checks if the connection is currently ejected or half-open
+
+        :return: True if the connection is not considered healthy
+        """
+        return self.ejected_until is not None
+
+    def is_available(self, now: float) -> bool:
+        """
+        Checks if a request may be sent over this connection. Once the cooldown of an ejected connection expired,
+        the connection is half-open and accepts a single probe request
+
+        :param now: the current time, as returned by `time.monotonic`
+        :return: True if the connection can be selected
+        """
+        if self.ejected_until is None:
+            return True
+        return now >= self.ejected_until and not self.probing
+
+
+class RetryPolicy:
+    """
+    Defines how requests which failed with a retryable gRPC status are retried
+
+    :param max_attempts: the maximal number of attempts of a request, including the first one
+    :param initial_backoff: the backoff before the first retry in seconds
+    :param max_backoff: the upper bound of the backoff in seconds
+    :param backoff_multiplier: the factor the backoff grows with after every retry
+    :param jitter: if True, the backoff is drawn uniformly between 0 and the exponential backoff
+    :param retry_on_different_replica: if True, a retry is sent to another replica of the deployment if there is one
+    :param retry_budget: the share of the traffic of a deployment which may be retries, None disables the budget
+    :param retryable_status_codes: the names of the gRPC status codes which are retried
+    """
+
+    # a retry budget allows this many retries before any request has been observed
+    RETRY_BUDGET_BURST = 10
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.05,
+        max_backoff: float = 1.0,
+        backoff_multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_on_different_replica: bool = True,
+        retry_budget: Optional[float] = 0.2,
+        retryable_status_codes: Optional[List[str]] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f'max_attempts must be at least 1, got {max_attempts}')
+        if retry_budget is not None and retry_budget < 0:
+            raise ValueError(f'retry_budget must not be negative, got {retry_budget}')
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter = jitter
+        self.retry_on_different_replica = retry_on_different_replica
+        self.retry_budget = retry_budget
+        try:
+            self.retryable_status_codes = {
+                grpc.StatusCode[code.upper()]
+                for code in (retryable_status_codes or ['UNAVAILABLE'])
+            }
+        except KeyError as e:
+            raise ValueError(f'{e} is not a valid gRPC status code')
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Checks if a request which failed with the given error may be retried
+
+        :param error: the error raised by the grpc call
+        :return: True if the error has a retryable status code
+        """
+        return (
+            isinstance(error, grpc.RpcError)
+            and error.code() in self.retryable_status_codes
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Computes the time to wait before the next attempt
+
+        :param attempt: the number of the attempt that failed, starting at 0
+        :return: the backoff in seconds
+        """
+        backoff = min(
+            self.max_backoff, self.initial_backoff * self.backoff_multiplier**attempt
+        )
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def create_budget(self) -> Optional['_RetryBudget']:
+        """
+        Creates the retry budget of a single deployment
+
+        :return: the budget or None if the policy does not limit retries
+        """
+        if self.retry_budget is None:
+            return None
+        return _RetryBudget(self.retry_budget, self.RETRY_BUDGET_BURST)
+
+
+class _RetryBudget:
+    """
+    Token bucket which limits the retries of a deployment to a share of its requests. Every request deposits the
+    share, every retry withdraws a full token
+
+    :param ratio: the share of the requests which may be retried
+    :param max_tokens: the capacity of the bucket, which bounds bursts of retries
+    """
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+
+    def record_request(self):
+        """
+        Registers a new request, which allows more retries
+        """
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_retry(self) -> bool:
+        """
+        Withdraws the cost of a retry if the budget allows it
+
+        :return: True if the retry may be sent
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class ConcurrencyLimitPolicy:
+    """
+    Defines the adaptive limit of the data requests a deployment processes concurrently. The limit grows additively
+    while the latency stays close to the lowest latency observed recently and shrinks multiplicatively once the latency
+    rises above it or the deployment fails with an overload status (AIMD). Requests above the limit wait in a bounded
+    queue, or fail fast with RESOURCE_EXHAUSTED if the queue is full
+
+    :param initial_limit: the limit before any latency has been observed
+    :param min_limit: the lower bound of the limit
+    :param max_limit: the upper bound of the limit
+    :param max_queue_size: the maximal number of requests waiting for the limit, 0 rejects requests above the limit
+    :param queue_timeout: the maximal time in seconds a request waits for the limit, None waits without bound
+    :param latency_tolerance: the limit shrinks once the latency exceeds the lowest latency by this factor
+    :param backoff_ratio: the factor the limit shrinks with
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        max_queue_size: int = 100,
+        queue_timeout: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                f'the limits must fulfill 1 <= min_limit <= initial_limit <= max_limit, got {min_limit}, '
+                f'{initial_limit} and {max_limit}'
+            )
+        if max_queue_size < 0:
+            raise ValueError(
+                f'max_queue_size must not be negative, got {max_queue_size}'
+            )
+        if latency_tolerance <= 1:
+            raise ValueError(
+                f'latency_tolerance must be greater than 1, got {latency_tolerance}'
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(
+                f'backoff_ratio must be between 0 and 1, got {backoff_ratio}'
+            )
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+
+    def create_limiter(self) -> '_ConcurrencyLimiter':
+        """
+        Creates the concurrency limiter of a single deployment
+
+        :return: the limiter
+        """
+        return _ConcurrencyLimiter(self)
+
+
+class _ConcurrencyLimiter:
+    """
+    Adaptive limit of the data requests a single deployment processes concurrently, see :class:`ConcurrencyLimitPolicy`
+
+    :param policy: the policy defining the limit
+    """
+
+    # the lowest latency is taken over this many requests, so that it follows a deployment which got slower
+    LATENCY_WINDOW_SIZE = 500
+    # gRPC status codes of a call which indicate that the deployment is overloaded
+    OVERLOAD_STATUS_CODES = {
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    }
+
+    def __init__(self, policy: ConcurrencyLimitPolicy):
+        self._policy = policy
+        self._limit = float(policy.initial_limit)
+        self.in_flight = 0
+        self._waiters = deque()
+        self._min_latency: Optional[float] = None
+        self._window_min_latency = math.inf
+        self._window_count = 0
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """
+        The number of requests which may currently be in flight
+
+        :return: the limit
+        """
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of requests waiting for the limit
+
+        :return: the queue depth
+        """
+        return len(self._waiters)
+
+    async def acquire(self):
+        """
+        Waits until the request may be sent. Every successful call has to be matched by a call to :meth:`release`
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        if len(self._waiters) >= self._policy.max_queue_size:
+            raise self._resource_exhausted(
+                'the request queue of the deployment is full'
+            )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=self._policy.queue_timeout
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted while the request gave up waiting, pass it on
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._resource_exhausted(
+                    'the request waited too long for the concurrency limit of the deployment'
+                )
+            raise
+
+    def release(
+        self, latency: Optional[float] = None, error: Optional[BaseException] = None
+    ):
+        """
+        Releases the slot of a request and adapts the limit to its outcome
+
+        :param latency: the latency of the request in seconds, None if it did not complete
+        :param error: the error the request failed with
+        """
+        self.in_flight -= 1
+        if (
+            isinstance(error, grpc.RpcError)
+            and error.code() in self.OVERLOAD_STATUS_CODES
+        ):
+            self._decrease()
+        elif latency is not None:
+            self._update_latency(latency)
+        self._wake_waiters()
+
+    def _update_latency(self, latency: float):
+        self._window_min_latency = min(self._window_min_latency, latency)
+        self._window_count += 1
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self._window_count >= self.LATENCY_WINDOW_SIZE:
+            self._min_latency = self._window_min_latency
+            self._window_min_latency = math.inf
+            self._window_count = 0
+
+        if latency > self._min_latency * self._policy.latency_tolerance:
+            self._decrease()
+        elif self.in_flight + 1 >= self._limit / 2:
+            # only grow the limit if it is actually used
+            self._limit = min(self._policy.max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self):
+        now = time.monotonic()
+        # requests in flight while the limit shrank report the same overload, shrink once per latency
+        if (
+            self._min_latency is not None
+            and now - self._last_decrease
+            < self._min_latency * self._policy.latency_tolerance
+        ):
+            return
+        self._last_decrease = now
+        self._limit = max(
+            self._policy.min_limit, self._limit * self._policy.backoff_ratio
+        )
+
+    def _wake_waiters(self):
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    @staticmethod
+    def _resource_exhausted(details: str) -> AioRpcError:
+        return AioRpcError(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            grpc.aio.Metadata(),
+            grpc.aio.Metadata(),
+            details=details,
+        )
+
+
+class _CachedChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.ref_count = 0
+        self.last_used = time.monotonic()
+        self.discarded = False
+
+
+class _ChannelCache:
+    """
+    Process-wide cache of the blocking grpc channels used for control requests, readiness checks and other one-shot
+    sends. Channels are reference counted while in use and closed once they were idle for `IDLE_TIMEOUT` seconds.
+    A channel whose call failed as unavailable is discarded, so that the next call does not wait for the reconnect
+    backoff of the broken channel.
+
+    Asyncio channels are not cached: they keep the grpc asyncio poller of the process alive, which lets grpc servers
+    hang in pods forked later on
+    """
+
+    IDLE_TIMEOUT = 60.0
+    # status codes which indicate that the channel may be broken
+    DISCARD_STATUS_CODES = {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    }
+
+    def __init__(self):
+        self._channels: Dict[Tuple, _CachedChannel] = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._channels)
+
+    @contextmanager
+    def channel(
+        self,
+        address: str,
+        https: bool = False,
+        root_certificates: Optional[str] = None,
+        options: Optional[list] = None,
+    ) -> grpc.Channel:
+        """
+        Provides a cached channel to the address
+
+        :param address: The address to connect to, format is <host>:<port>
+        :param https: If True, use https for the grpc channel
+        :param root_certificates: The path to the root certificates for https, only used if https is True
+        :param options: A list of options to pass to the grpc channel
+        :yields: the grpc channel, it must not be closed by the caller
+        """
+        key = (
+            address,
+            https,
+            root_certificates,
+            tuple(tuple(option) for option in options) if options else None,
+        )
+        with self._lock:
+            to_close = self._evict_idle()
+            entry = self._channels.get(key)
+            if entry is None:
+                entry = _CachedChannel(
+                    GrpcConnectionPool.get_grpc_channel(
+                        address,
+                        options=options,
+                        https=https,
+                        root_certificates=root_certificates,
+                    )
+                )
+                self._channels[key] = entry
+            entry.ref_count += 1
+        for channel in to_close:
+            channel.close()
+
+        try:
+            yield entry.channel
+        except grpc.RpcError as e:
+            if e.code() in self.DISCARD_STATUS_CODES:
+                with self._lock:
+                    entry.discarded = True
+                    if self._channels.get(key) is entry:
+                        del self._channels[key]
+            raise
+        finally:
+            with self._lock:
+                entry.ref_count -= 1
+                entry.last_used = time.monotonic()
+                close = entry.discarded and entry.ref_count == 0
+            if close:
+                entry.channel.close()
+
+    def clear(self):
+        """
+        Closes all cached channels which are not in use, the others are closed once released
+        """
+        with self._lock:
+            entries = list(self._channels.values())
+            self._channels.clear()
+            for entry in entries:
+                entry.discarded = True
+            to_close = [entry.channel for entry in entries if entry.ref_count == 0]
+        for channel in to_close:
+            channel.close()
+
+    def _reset_after_fork(self):
+        # channels inherited from the parent process can not be used after a fork, they must not be closed either
+        self._channels = {}
+        self._lock = Lock()
+
+    def _evict_idle(self) -> List[grpc.Channel]:
+        now = time.monotonic()
+        to_close = []
+        for key, entry in list(self._channels.items()):
+            if entry.ref_count == 0 and now - entry.last_used > self.IDLE_TIMEOUT:
+                del self._channels[key]
+                entry.discarded = True
+                to_close.append(entry.channel)
+        return to_close
+
+
+_channel_cache = _ChannelCache()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_channel_cache._reset_after_fork)
+
+
+class _DataRequestStream:
+    """
+    Long-lived bidirectional stream to a single replica which multiplexes many concurrent data requests. Responses
+    are matched to their requests by request_id. The stream is opened lazily and reopened after it ended
+
+    :param stub: the stub of the data request stream service of the replica
+    """
+
+    # metadata keys of a streamed response which carry the error that a unary call would have failed with
+    ERROR_CODE = 'stream-error-code'
+    ERROR_DETAILS = 'stream-error-details'
+    # seconds to wait for the responses to the requests in flight when the stream is closed
+    CLOSE_TIMEOUT = 5.0
+
+    def __init__(self, stub: jina_pb2_grpc.JinaDataRequestStreamRPCStub):
+        self._stub = stub
+        self._call = None
+        self._reader = None
+        self._write_lock = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        # a newly opened stream carries a single request until the first response proves the replica serves it
+        self._established = False
+        self._failed_to_establish = False
+        # False once the replica turned out to not serve the stream
+        self.supported = True
+
+    async def send(
+        self, requests: List[DataRequest], metadata: Optional[Tuple]
+    ) -> Optional[Tuple[DataRequest, 'grpc.aio.Metadata']]:
+        """
+        Sends the requests over the stream and waits for the response
+
+        :param requests: the requests to process together
+        :param metadata: the metadata that would be sent with a unary call
+        :return: the response and its metadata, None if the requests must be sent with a unary call instead because
+            the stream is not established or a request with the same request_id is already in flight on it
+        """
+        request_id = requests[0].header.request_id
+        if request_id in self._pending or (self._pending and not self._established):
+            return None
+        if self._call is None:
+            self._open()
+        call = self._call
+        established = self._established
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            async with self._write_lock:
+                try:
+                    await call.write((requests, dict(metadata or ())))
+                except (asyncio.InvalidStateError, AioRpcError):
+                    # the stream ended before the requests could be written, fail like the stream did
+                    raise AioRpcError(
+                        await call.code(),
+                        grpc.aio.Metadata(),
+                        grpc.aio.Metadata(),
+                        details=await call.details(),
+                    )
+            return await future
+        except AioRpcError as e:
+            if established:
+                raise
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                self.supported = False
+            # the replica never answered over this stream, it is either unavailable or does not serve streams.
+            # The unary call tells which one
+            self._failed_to_establish = True
+            return None
+        finally:
+            if self._pending.get(request_id) is future:
+                del self._pending[request_id]
+            # a raised exception references this frame, drop the future and the call to not create a reference cycle
+            # which keeps the grpc call alive
+            del future, call
+
+    def record_unary_success(self):
+        """
+        Records that a unary call to the replica succeeded. If the stream failed before it could be established, the
+        replica does not serve it
+        """
+        if self._failed_to_establish:
+            self.supported = False
+
+    def _open(self):
+        self._call = self._stub.process_data_stream()
+        self._write_lock = asyncio.Lock()
+        self._established = False
+        self._reader = asyncio.create_task(self._read(self._call))
+
+    async def _read(self, call):
+        error = None
+        try:
+            while True:
+                message = await call.read()
+                if message is grpc.aio.EOF:
+                    break
+                self._established = True
+                self._failed_to_establish = False
+                responses, metadata = message
+                future = self._pending.pop(responses[0].header.request_id, None)
+                if future is None or future.done():
+                    # the request was cancelled, e.g. a hedged request which lost
+                    continue
+                if self.ERROR_CODE in metadata:
+                    future.set_exception(
+                        AioRpcError(
+                            grpc.StatusCode[metadata[self.ERROR_CODE]],
+                            grpc.aio.Metadata(),
+                            grpc.aio.Metadata(),
+                            details=metadata.get(self.ERROR_DETAILS),
+                        )
+                    )
+                else:
+                    future.set_result(
+                        (responses[0], grpc.aio.Metadata(*metadata.items()))
+                    )
+        except AioRpcError as e:
+            error = e
+        except asyncio.CancelledError:
+            error = AioRpcError(
+                grpc.StatusCode.CANCELLED, grpc.aio.Metadata(), grpc.aio.Metadata()
+            )
+        finally:
+            if self._call is call:
+                self._call = None
+            # requests in flight can not be answered anymore, fail them like their unary calls would have failed
+            error = error or AioRpcError(
+                grpc.StatusCode.UNAVAILABLE,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                details='data request stream ended',
+            )
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+            # the error references this frame, drop it to not create a reference cycle which keeps the grpc call alive
+            del error
+
+    async def close(self):
+        """
+        Closes the stream after the responses to the requests in flight were received
+        """
+        call, reader = self._call, self._reader
+        self._call, self._reader = None, None
+        if call is not None:
+            await call.done_writing()
+        if reader is not None:
+            try:
+                await asyncio.wait_for(reader, timeout=self.CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                call.cancel()
+            except Exception:
+                pass
+
+
+class ReplicaList:
+    """
+    Maintains a list of connections to replicas and selects a replica according to the load balancing strategy,
+    round robin by default
+
+    :param load_balancing: the strategy used to select a replica
+    :param retry_budget: limits the retries of requests sent to this list, shared by all lists of a deployment
+    :param streaming: if True, data requests are sent over a long-lived stream to every replica
+    :param uds: if True, replicas on the local host are connected over their unix domain socket instead of TCP
+    :param concurrency_limiter: limits the data requests in flight to this list, shared by all lists of a deployment
+    """
+
+    # number of the most recent latencies of all replicas used to compute latency percentiles
+    LATENCY_WINDOW_SIZE = 1000
+    # a replica is ejected after this many consecutive failed requests
+    EJECTION_CONSECUTIVE_FAILURES = 5
+    # a replica is ejected if the share of failed recent requests reaches this rate ...
+    EJECTION_ERROR_RATE = 0.5
+    # ... and at least this many recent requests were observed
+    EJECTION_MIN_REQUESTS = 10
+    # the cooldown of an ejected replica in seconds, doubled on every ejection up to the maximum
+    EJECTION_BASE_TIME = 1.0
+    EJECTION_MAX_TIME = 60.0
+    # gRPC status codes of a call which count as a failure of the replica
+    FAILURE_STATUS_CODES = {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.INTERNAL,
+        grpc.StatusCode.UNKNOWN,
+    }
+
+    def __init__(
+        self,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        retry_budget: Optional[_RetryBudget] = None,
+        streaming: bool = False,
+        uds: bool = False,
+        concurrency_limiter: Optional[_ConcurrencyLimiter] = None,
+    ):
         self._connections = []
         self._address_to_connection_idx = {}
         self._address_to_channel = {}
+        self._connection_stats: Dict[Tuple, _ConnectionStats] = {}
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW_SIZE)
         self._rr_counter = 0
+        self._load_balancing = load_balancing
+        self.retry_budget = retry_budget
+        self._streaming = streaming
+        self._connection_streams: Dict[Tuple, _DataRequestStream] = {}
+        self._uds = uds
+        self._uds_connections = set()
+        # the connections over unix domain sockets which answered a call, they do not fall back to TCP anymore
+        self._verified_uds_connections = set()
+        # maps the connections over unix domain sockets which fell back to TCP to their TCP connections
+        self._tcp_fallbacks = {}
+        self.concurrency_limiter = concurrency_limiter
 
     def add_connection(self, address: str):
         """
@@ -45,15 +797,82 @@ class ReplicaList:
                 use_https = False
 
             self._address_to_connection_idx[address] = len(self._connections)
-            (
-                single_data_stub,
-                data_stub,
-                control_stub,
-                channel,
-            ) = GrpcConnectionPool.create_async_channel_stub(address, https=use_https)
-            self._address_to_channel[address] = channel
+            self._connections.append(
+                self._create_connection(
+                    address, self._get_channel_target(address, use_https), use_https
+                )
+            )
+
+    def _create_connection(self, address: str, target: str, https: bool):
+        (
+            single_data_stub,
+            data_stub,
+            control_stub,
+            channel,
+        ) = GrpcConnectionPool.create_async_channel_stub(target, https=https)
+        self._address_to_channel[address] = channel
+
+        connection = (single_data_stub, data_stub, control_stub)
+        if target != address:
+            self._uds_connections.add(connection)
+        self._connection_stats[connection] = _ConnectionStats()
+        if self._streaming:
+            self._connection_streams[connection] = _DataRequestStream(
+                jina_pb2_grpc.JinaDataRequestStreamRPCStub(channel)
+            )
+        return connection
 
-            self._connections.append((single_data_stub, data_stub, control_stub))
+    def _get_channel_target(self, address: str, https: bool) -> str:
+        # the address stays the identity of the connection, only the channel uses the socket
+        if self._uds and not https:
+            uds_address = GrpcConnectionPool.get_local_uds_address(address)
+            # runtimes started with `--disable-uds` or by older versions do not listen on the socket
+            if uds_address and os.path.exists(uds_address[len('unix:') :]):
+                return uds_address
+        return address
+
+    def should_fall_back_to_tcp(self, connection, error: BaseException) -> bool:
+        """
+        Checks if a connection over a unix domain socket should be replaced by a TCP connection, because its first
+        call failed as the replica does not listen on the socket
+
+        :param connection: the connection the call was sent to
+        :param error: the error raised by the call
+        :returns: True if the connection should fall back to TCP
+        """
+        return (
+            connection in self._uds_connections
+            and connection not in self._verified_uds_connections
+            and isinstance(error, AioRpcError)
+            and error.code() == grpc.StatusCode.UNAVAILABLE
+        )
+
+    async def fall_back_to_tcp(self, connection):
+        """
+        Replaces a connection over a unix domain socket by a connection to the TCP address of the replica
+
+        :param connection: the connection over the unix domain socket
+        :returns: the TCP connection, None if the connection was removed from the list
+        """
+        if connection in self._tcp_fallbacks:
+            # another call failing on the socket replaced the connection already
+            return self._tcp_fallbacks[connection]
+        for address, idx in self._address_to_connection_idx.items():
+            if self._connections[idx] is connection:
+                break
+        else:
+            return None
+        channel = self._address_to_channel[address]
+        tcp_connection = self._create_connection(address, address, https=False)
+        self._connections[idx] = tcp_connection
+        self._tcp_fallbacks[connection] = tcp_connection
+        self._connection_stats.pop(connection, None)
+        self._uds_connections.discard(connection)
+        stream = self._connection_streams.pop(connection, None)
+        if stream:
+            await stream.close()
+        await channel.close(0.5)
+        return tcp_connection
 
     async def remove_connection(self, address: str):
         """
@@ -70,6 +889,17 @@ class ReplicaList:
             idx_to_delete = self._address_to_connection_idx.pop(address)
 
             popped_connection = self._connections.pop(idx_to_delete)
+            self._connection_stats.pop(popped_connection, None)
+            self._uds_connections.discard(popped_connection)
+            self._verified_uds_connections.discard(popped_connection)
+            self._tcp_fallbacks = {
+                uds_connection: tcp_connection
+                for uds_connection, tcp_connection in self._tcp_fallbacks.items()
+                if tcp_connection is not popped_connection
+            }
+            stream = self._connection_streams.pop(popped_connection, None)
+            if stream:
+                await stream.close()
             # we should handle graceful termination better, 0.5 is a rather random number here
             await self._address_to_channel[address].close(0.5)
             del self._address_to_channel[address]
@@ -84,18 +914,228 @@ class ReplicaList:
 
     def get_next_connection(self):
         """
-        Returns a connection from the list. Strategy is round robin
+        Returns a connection from the list. Strategy is defined by the load balancing type of this list.
+        Ejected replicas are skipped unless no other replica is available
         :returns: A connection from the pool
         """
-        try:
-            connection = self._connections[self._rr_counter]
-        except IndexError:
-            # This can happen as a race condition while removing connections
-            self._rr_counter = 0
-            connection = self._connections[self._rr_counter]
-        self._rr_counter = (self._rr_counter + 1) % len(self._connections)
+        if self._load_balancing == LoadBalancingType.LEAST_OUTSTANDING:
+            return self._get_least_outstanding_connection()
+        elif self._load_balancing == LoadBalancingType.POWER_OF_TWO:
+            return self._get_power_of_two_connection()
+        return self._get_round_robin_connection()
+
+    def _is_available(self, connection, now: float) -> bool:
+        stats = self._connection_stats.get(connection)
+        return stats is None or stats.is_available(now)
+
+    def _get_available_connections(self) -> List:
+        now = time.monotonic()
+        available = [c for c in self._connections if self._is_available(c, now)]
+        # if every replica is ejected, sending somewhere is still better than failing the request right away
+        return available or self._connections
+
+    def _get_round_robin_connection(self):
+        now = time.monotonic()
+        for _ in range(len(self._connections)):
+            try:
+                connection = self._connections[self._rr_counter]
+            except IndexError:
+                # This can happen as a race condition while removing connections
+                self._rr_counter = 0
+                connection = self._connections[self._rr_counter]
+            self._rr_counter = (self._rr_counter + 1) % len(self._connections)
+            if self._is_available(connection, now):
+                return connection
         return connection
 
+    def _get_least_outstanding_connection(self):
+        connections = self._get_available_connections()
+        num_connections = len(connections)
+        # start the scan at a rotating offset so that ties are not always resolved in favour of the first replica
+        start = self._rr_counter % num_connections
+        self._rr_counter = (start + 1) % num_connections
+        best_connection = None
+        best_stats = None
+        for i in range(num_connections):
+            connection = connections[(start + i) % num_connections]
+            stats = self._connection_stats[connection]
+            if (
+                best_stats is None
+                or stats.in_flight < best_stats.in_flight
+                or (
+                    stats.in_flight == best_stats.in_flight
+                    and stats.ewma_latency < best_stats.ewma_latency
+                )
+            ):
+                best_connection, best_stats = connection, stats
+        return best_connection
+
+    def _get_power_of_two_connection(self):
+        connections = self._get_available_connections()
+        if len(connections) == 1:
+            return connections[0]
+        first, second = random.sample(connections, 2)
+        if self._connection_stats[second].cost < self._connection_stats[first].cost:
+            return second
+        return first
+
+    def record_request_start(self, connection):
+        """
+        Registers that a request was sent over the connection
+
+        :param connection: the connection the request is sent to
+        """
+        stats = self._connection_stats.get(connection)
+        if stats:
+            stats.in_flight += 1
+            if stats.is_ejected and not stats.probing:
+                # the cooldown expired, this request probes if the replica recovered
+                stats.probing = True
+
+    def record_request_end(
+        self,
+        connection,
+        latency: Optional[float] = None,
+        failed: bool = False,
+    ):
+        """
+        Registers that a request sent over the connection returned
+
+        :param connection: the connection the request was sent to
+        :param latency: the observed latency of the request in seconds, None if the request did not succeed
+        :param failed: True if the request failed because of the replica, requests which got cancelled are neither
+            counted as success nor as failure
+        """
+        stats = self._connection_stats.get(connection)
+        if latency is not None and connection in self._uds_connections:
+            self._verified_uds_connections.add(connection)
+        if stats:
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if latency is not None:
+                stats.update_latency(latency)
+                self._latencies.append(latency)
+                self._record_success(stats)
+            elif failed:
+                self._record_failure(stats)
+            elif stats.probing:
+                # the probe got cancelled, let another request probe the replica
+                stats.probing = False
+
+    def _record_success(self, stats: _ConnectionStats):
+        stats.outcomes.append(True)
+        stats.consecutive_failures = 0
+        stats.consecutive_successes += 1
+        if stats.is_ejected:
+            if not stats.probing:
+                # a late response of a request sent before the ejection
+                return
+            # the probe succeeded, the replica returns to the rotation
+            stats.ejected_until = None
+            stats.probing = False
+            stats.outcomes.clear()
+            stats.consecutive_successes = 0
+        elif stats.consecutive_successes >= stats.OUTCOME_WINDOW_SIZE:
+            # the replica was healthy for a while, start over with the shortest cooldown
+            stats.ejection_count = 0
+
+    def _record_failure(self, stats: _ConnectionStats):
+        stats.outcomes.append(False)
+        stats.consecutive_failures += 1
+        stats.consecutive_successes = 0
+        if stats.is_ejected:
+            if stats.probing:
+                # the probe failed, eject the replica again for a longer time
+                self._eject(stats)
+        elif (
+            stats.consecutive_failures >= self.EJECTION_CONSECUTIVE_FAILURES
+            or (
+                len(stats.outcomes) >= self.EJECTION_MIN_REQUESTS
+                and stats.error_rate >= self.EJECTION_ERROR_RATE
+            )
+        ) and any(
+            not other.is_ejected
+            for other in self._connection_stats.values()
+            if other is not stats
+        ):
+            # the last healthy replica is never ejected
+            self._eject(stats)
+
+    def _eject(self, stats: _ConnectionStats):
+        cooldown = min(
+            self.EJECTION_BASE_TIME * 2**stats.ejection_count, self.EJECTION_MAX_TIME
+        )
+        stats.ejected_until = time.monotonic() + cooldown
+        stats.ejection_count += 1
+        stats.probing = False
+
+    def is_failure(self, error: BaseException) -> bool:
+        """
+        Checks if an error raised by a call indicates that the replica is unhealthy
+
+        :param error: the error raised by the grpc call
+        :returns: True if the error counts as a failure of the replica
+        """
+        return (
+            isinstance(error, AioRpcError) and error.code() in self.FAILURE_STATUS_CODES
+        )
+
+    @property
+    def num_ejected(self) -> int:
+        """
+        Number of replicas which are currently ejected or half-open
+
+        :return: the number of ejected replicas
+        """
+        return sum(1 for stats in self._connection_stats.values() if stats.is_ejected)
+
+    def get_latency_percentile(
+        self, percentile: float, min_samples: int = 20
+    ) -> Optional[float]:
+        """
+        Returns a percentile of the latencies recently observed over all connections of this list
+
+        :param percentile: the percentile to compute, between 0 and 100
+        :param min_samples: the minimal number of observations needed to compute the percentile
+        :returns: the latency percentile in seconds or None if there are not enough observations yet
+        """
+        if len(self._latencies) < max(min_samples, 1):
+            return None
+        latencies = sorted(self._latencies)
+        idx = min(
+            len(latencies) - 1, max(0, math.ceil(percentile / 100 * len(latencies)) - 1)
+        )
+        return latencies[idx]
+
+    def get_connection_stats(self, connection) -> Optional[_ConnectionStats]:
+        """
+        Returns the in-flight and latency statistics of a connection
+
+        :param connection: the connection to get the statistics for
+        :returns: the statistics or None if the connection is not part of this list
+        """
+        return self._connection_stats.get(connection)
+
+    def get_stream(self, connection) -> Optional[_DataRequestStream]:
+        """
+        Returns the data request stream to the replica of a connection
+
+        :param connection: the connection to get the stream for
+        :returns: the stream or None if streaming is disabled or the replica does not support it
+        """
+        stream = self._connection_streams.get(connection)
+        if stream is not None and stream.supported:
+            return stream
+        return None
+
+    def is_uds_connection(self, connection) -> bool:
+        """
+        Checks if a connection goes to a replica on the local host over its unix domain socket
+
+        :param connection: the connection to check
+        :returns: True if the connection uses the unix domain socket of the replica
+        """
+        return connection in self._uds_connections
+
     def get_all_connections(self):
         """
         Returns all available connections
@@ -122,11 +1162,19 @@ class ReplicaList:
         """
         Close all connections and clean up internal state
         """
+        for stream in self._connection_streams.values():
+            await stream.close()
+        self._connection_streams.clear()
         for address in self._address_to_channel:
             await self._address_to_channel[address].close(0.5)
         self._address_to_channel.clear()
         self._address_to_connection_idx.clear()
         self._connections.clear()
+        self._connection_stats.clear()
+        self._uds_connections.clear()
+        self._verified_uds_connections.clear()
+        self._tcp_fallbacks.clear()
+        self._latencies.clear()
         self._rr_counter = 0
 
 
@@ -135,11 +1183,38 @@ class GrpcConnectionPool:
     Manages a list of grpc connections.
 
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param hedging: maps endpoints to the delay after which a duplicate of a request is sent to another replica.
+        The delay is either given in milliseconds or as a percentile of the observed latency, like `p95`
+    :param retry_policy: defines how failed requests are retried, the default policy if None
+    :param data_streaming: if True, data requests are multiplexed over a long-lived bidirectional stream per replica
+    :param uds: if True, replicas on the local host are connected over their unix domain socket instead of TCP
+    :param shared_memory: if True, large docs are passed to replicas connected over a unix domain socket in shared memory
+    :param compression: the compression of data requests sent to replicas which are not connected over a unix domain socket
+    :param compression_min_bytes: data requests smaller than this number of bytes are sent uncompressed
+    :param concurrency_limit: defines the adaptive limit of the data requests in flight per deployment, None disables it
     """
 
     class _ConnectionPoolMap:
-        def __init__(self, logger: Optional[JinaLogger]):
+        def __init__(
+            self,
+            logger: Optional[JinaLogger],
+            load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+            retry_policy: Optional[RetryPolicy] = None,
+            data_streaming: bool = False,
+            uds: bool = False,
+            concurrency_limit: Optional[ConcurrencyLimitPolicy] = None,
+        ):
             self._logger = logger
+            self._load_balancing = load_balancing
+            self._retry_policy = retry_policy or RetryPolicy()
+            self._data_streaming = data_streaming
+            self._uds = uds
+            self._concurrency_limit = concurrency_limit
+            # the retry budget of every deployment is shared by all its shards and heads
+            self._retry_budgets: Dict[str, Optional[_RetryBudget]] = {}
+            # so is the concurrency limiter
+            self.concurrency_limiters: Dict[str, _ConcurrencyLimiter] = {}
             # this maps deployments to shards or heads
             self._deployments: Dict[str, Dict[str, Dict[int, ReplicaList]]] = {}
             # dict stores last entity id used for a particular deployment, used for round robin
@@ -171,6 +1246,11 @@ class GrpcConnectionPool:
                 )
                 return None
 
+        def get_shard_ids(self, deployment: str) -> List[int]:
+            if deployment in self._deployments:
+                return list(self._deployments[deployment]['shards'])
+            return []
+
         def get_replicas_all_shards(self, deployment: str) -> List[ReplicaList]:
             replicas = []
             if deployment in self._deployments:
@@ -221,6 +1301,11 @@ class GrpcConnectionPool:
             if deployment not in self._deployments:
                 self._deployments[deployment] = {'shards': {}, 'heads': {}}
                 self._access_count[deployment] = 0
+                self._retry_budgets[deployment] = self._retry_policy.create_budget()
+                if self._concurrency_limit:
+                    self.concurrency_limiters[
+                        deployment
+                    ] = self._concurrency_limit.create_limiter()
 
         def _add_connection(
             self,
@@ -231,7 +1316,13 @@ class GrpcConnectionPool:
         ):
             self._add_deployment(deployment)
             if entity_id not in self._deployments[deployment][type]:
-                connection_list = ReplicaList()
+                connection_list = ReplicaList(
+                    load_balancing=self._load_balancing,
+                    retry_budget=self._retry_budgets[deployment],
+                    streaming=self._data_streaming,
+                    uds=self._uds,
+                    concurrency_limiter=self.concurrency_limiters.get(deployment),
+                )
                 self._deployments[deployment][type][entity_id] = connection_list
 
             if not self._deployments[deployment][type][entity_id].has_connection(
@@ -272,9 +1363,120 @@ class GrpcConnectionPool:
                 return connection
             return None
 
-    def __init__(self, logger: Optional[JinaLogger] = None):
+    def __init__(
+        self,
+        logger: Optional[JinaLogger] = None,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        hedging: Optional[Dict[str, Union[float, str]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        data_streaming: bool = False,
+        uds: bool = False,
+        shared_memory: bool = False,
+        compression: CompressionType = CompressionType.NONE,
+        compression_min_bytes: int = MessageCompression.MIN_BYTES,
+        concurrency_limit: Optional[ConcurrencyLimitPolicy] = None,
+    ):
         self._logger = logger or JinaLogger(self.__class__.__name__)
-        self._connections = self._ConnectionPoolMap(self._logger)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._connections = self._ConnectionPoolMap(
+            self._logger,
+            load_balancing,
+            self._retry_policy,
+            data_streaming,
+            uds,
+            concurrency_limit,
+        )
+        self._hedging = self._parse_hedging(hedging)
+        self._shared_memory_segments = (
+            SharedMemorySegments()
+            if shared_memory and is_shared_memory_supported()
+            else None
+        )
+        self._compression = MessageCompression(compression, compression_min_bytes)
+        self._hedges_issued = 0
+        self._hedges_won = 0
+        self._retries = 0
+        self._retries_rejected = 0
+
+    @staticmethod
+    def _parse_hedging(
+        hedging: Optional[Dict[str, Union[float, str]]]
+    ) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        # every endpoint maps to a tuple of (fixed delay in seconds, latency percentile)
+        parsed = {}
+        for endpoint, delay in (hedging or {}).items():
+            if isinstance(delay, str) and delay.lower().startswith('p'):
+                percentile = float(delay[1:])
+                if not 0 < percentile <= 100:
+                    raise ValueError(
+                        f'Invalid hedging percentile {delay} for endpoint {endpoint}'
+                    )
+                parsed[endpoint] = (None, percentile)
+            else:
+                parsed[endpoint] = (float(delay) / 1000, None)
+        return parsed
+
+    @property
+    def hedges_issued(self) -> int:
+        """
+        Number of duplicate requests sent because a replica did not answer within the hedging delay
+
+        :return: the number of hedged requests
+        """
+        return self._hedges_issued
+
+    @property
+    def hedges_won(self) -> int:
+        """
+        Number of hedged requests whose duplicate answered before the original request
+
+        :return: the number of hedged requests won by the duplicate
+        """
+        return self._hedges_won
+
+    @property
+    def retries(self) -> int:
+        """
+        Number of requests which were sent again after a retryable failure
+
+        :return: the number of retries
+        """
+        return self._retries
+
+    @property
+    def retries_rejected(self) -> int:
+        """
+        Number of retries which were not sent because the retry budget of the deployment was exhausted
+
+        :return: the number of rejected retries
+        """
+        return self._retries_rejected
+
+    @property
+    def concurrency_limits(self) -> Dict[str, Dict[str, int]]:
+        """
+        The current concurrency limit, the data requests in flight and the data requests waiting for the limit of every
+        deployment, empty if the concurrency is not limited
+
+        :return: maps every deployment to its `limit`, `in_flight` and `queue_depth`
+        """
+        return {
+            deployment: {
+                'limit': limiter.limit,
+                'in_flight': limiter.in_flight,
+                'queue_depth': limiter.queue_depth,
+            }
+            for deployment, limiter in self._connections.concurrency_limiters.items()
+        }
+
+    @property
+    def compression(self) -> MessageCompression:
+        """
+        The compression of the data requests sent by this pool, which records the bytes sent compressed and uncompressed
+
+        :return: the message compression
+        """
+        return self._compression
 
     def send_request(
         self,
@@ -323,24 +1525,31 @@ class GrpcConnectionPool:
         :return: list of asyncio.Task items for each send call
         """
         results = []
-        connections = []
+        connection_lists = []
         if polling_type == PollingType.ANY:
             connection_list = self._connections.get_replicas(deployment, head, shard_id)
             if connection_list:
-                connections.append(connection_list.get_next_connection())
+                connection_lists.append(connection_list)
         elif polling_type == PollingType.ALL:
             connection_lists = self._connections.get_replicas_all_shards(deployment)
-            for connection_list in connection_lists:
-                connections.append(connection_list.get_next_connection())
         else:
             raise ValueError(f'Unsupported polling type {polling_type}')
 
-        for connection in connections:
-            task = self._send_requests(requests, connection, endpoint)
+        for connection_list in connection_lists:
+            task = self._send_requests(requests, connection_list, endpoint)
             results.append(task)
 
         return results
 
+    def get_shard_ids(self, deployment: str) -> List[int]:
+        """
+        Returns the ids of the shards of a deployment which have at least one connection
+
+        :param deployment: name of the Jina deployment
+        :return: the shard ids
+        """
+        return self._connections.get_shard_ids(deployment)
+
     def send_request_once(
         self,
         request: Request,
@@ -378,8 +1587,7 @@ class GrpcConnectionPool:
         """
         replicas = self._connections.get_replicas(deployment, head, shard_id)
         if replicas:
-            connection = replicas.get_next_connection()
-            return self._send_requests(requests, connection, endpoint)
+            return self._send_requests(requests, replicas, endpoint)
         else:
             self._logger.debug(
                 f'No available connections for deployment {deployment} and shard {shard_id}'
@@ -442,57 +1650,269 @@ class GrpcConnectionPool:
         Closes the connection pool
         """
         await self._connections.close()
+        if self._shared_memory_segments:
+            self._shared_memory_segments.close()
+        if self._compression:
+            self._logger.debug(
+                f'sent {self._compression.raw_bytes} bytes of data requests compressed to approximately '
+                f'{self._compression.compressed_bytes} bytes and {self._compression.uncompressed_bytes} bytes '
+                f'uncompressed'
+            )
+
+    def _get_hedging_delay(
+        self, connection_list: ReplicaList, endpoint: Optional[str]
+    ) -> Optional[float]:
+        if not self._hedging or len(connection_list.get_all_connections()) < 2:
+            return None
+        hedging = self._hedging.get(endpoint, self._hedging.get('*'))
+        if hedging is None:
+            return None
+        delay, percentile = hedging
+        if percentile is not None:
+            return connection_list.get_latency_percentile(percentile)
+        return delay
+
+    async def _send_to_connection(
+        self,
+        requests: List[Request],
+        connection_list: ReplicaList,
+        stubs,
+        metadata: Optional[Tuple],
+    ) -> Tuple[Request, 'grpc.aio.Metadata']:
+        try:
+            return await self._send_to_replica(
+                requests, connection_list, stubs, metadata
+            )
+        except AioRpcError as e:
+            if not connection_list.should_fall_back_to_tcp(stubs, e):
+                raise
+            tcp_stubs = await connection_list.fall_back_to_tcp(stubs)
+            if tcp_stubs is None:
+                raise
+            self._logger.debug(
+                f'replica is not reachable over its unix domain socket, falling back to TCP'
+            )
+            return await self._send_to_replica(
+                requests, connection_list, tcp_stubs, metadata
+            )
+
+    async def _send_to_replica(
+        self,
+        requests: List[Request],
+        connection_list: ReplicaList,
+        stubs,
+        metadata: Optional[Tuple],
+    ) -> Tuple[Request, 'grpc.aio.Metadata']:
+        connection_list.record_request_start(stubs)
+        start = time.perf_counter()
+        latency = None
+        failed = False
+        shared_memory_requests = []
+        try:
+            request_type = type(requests[0])
+            stream = None
+            compression = None
+            if request_type == DataRequest:
+                requests, shared_memory_requests = self._prepare_data_requests(
+                    requests, connection_list, stubs
+                )
+                if not connection_list.is_uds_connection(stubs):
+                    compression = self._compression.get_compression(requests)
+                if compression is None:
+                    # the compression is set per call, so compressed requests are sent with a unary call instead of the stream
+                    stream = connection_list.get_stream(stubs)
+            remaining = _get_remaining_time(requests)
+            if stream is not None:
+                try:
+                    result = await asyncio.wait_for(
+                        stream.send(requests, metadata), remaining
+                    )
+                except asyncio.TimeoutError:
+                    raise _deadline_exceeded('deadline of the request expired')
+                if result is not None:
+                    latency = time.perf_counter() - start
+                    if shared_memory_requests:
+                        result = (inline_shared_memory_docs(result[0]), result[1])
+                    return result
+            call_options = {'compression': compression} if compression else {}
+            if remaining is not None:
+                call_options['timeout'] = max(remaining, 0)
+            if request_type == DataRequest and len(requests) == 1:
+                call_result = stubs[0].process_single_data(
+                    requests[0], metadata=metadata, **call_options
+                )
+            elif request_type == DataRequest and len(requests) > 1:
+                call_result = stubs[1].process_data(
+                    requests, metadata=metadata, **call_options
+                )
+            elif request_type == ControlRequest:
+                call_result = stubs[2].process_control(requests[0])
+            else:
+                raise ValueError(f'Unsupported request type {type(requests[0])}')
+            metadata, response = (
+                await call_result.trailing_metadata(),
+                await call_result,
+            )
+            latency = time.perf_counter() - start
+            if stream is not None:
+                stream.record_unary_success()
+            if shared_memory_requests:
+                # the segments are removed below, so a response still referencing one has to hold its docs itself
+                response = inline_shared_memory_docs(response)
+            return response, metadata
+        except Exception as e:
+            failed = connection_list.is_failure(e)
+            raise
+        finally:
+            for request in shared_memory_requests:
+                self._shared_memory_segments.release(request)
+            connection_list.record_request_end(stubs, latency, failed)
+
+    def _prepare_data_requests(
+        self, requests: List[DataRequest], connection_list: ReplicaList, stubs
+    ) -> Tuple[List[DataRequest], List[DataRequest]]:
+        # returns the requests to send and the requests whose docs were moved into shared memory
+        if not connection_list.is_uds_connection(stubs):
+            # the replica can not access shared memory of this host
+            return [inline_shared_memory_docs(r) for r in requests], []
+        if self._shared_memory_segments is None:
+            return requests, []
+        sent_requests, shared_memory_requests = [], []
+        for request in requests:
+            sent_request = self._shared_memory_segments.acquire(request)
+            sent_requests.append(sent_request)
+            if sent_request is not request:
+                shared_memory_requests.append(request)
+        return sent_requests, shared_memory_requests
+
+    async def _send_hedged(
+        self,
+        requests: List[Request],
+        connection_list: ReplicaList,
+        stubs,
+        metadata: Optional[Tuple],
+        delay: float,
+    ) -> Tuple[Request, 'grpc.aio.Metadata']:
+        primary = asyncio.create_task(
+            self._send_to_connection(requests, connection_list, stubs, metadata)
+        )
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge_stubs = self._get_other_connection(connection_list, stubs)
+        if hedge_stubs is stubs:
+            return await primary
+
+        self._hedges_issued += 1
+        self._logger.debug(
+            f'no response after {delay * 1000:.1f}ms, sending hedged request'
+        )
+        hedge = asyncio.create_task(
+            self._send_to_connection(requests, connection_list, hedge_stubs, metadata)
+        )
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # prefer a successful response, only fail if both calls failed
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        if task is hedge:
+                            self._hedges_won += 1
+                        return task.result()
+            return await primary
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _get_other_connection(connection_list: ReplicaList, stubs):
+        # a single extra selection is enough to move on from the previous replica with every load balancing type,
+        # except if it is the only one left
+        other_stubs = connection_list.get_next_connection()
+        if other_stubs is stubs:
+            other_stubs = connection_list.get_next_connection()
+        return other_stubs
 
     def _send_requests(
-        self, requests: List[Request], connection, endpoint: Optional[str] = None
+        self,
+        requests: List[Request],
+        connection_list: ReplicaList,
+        endpoint: Optional[str] = None,
     ) -> asyncio.Task:
         # this wraps the awaitable object from grpc as a coroutine so it can be used as a task
         # the grpc call function is not a coroutine but some _AioCall
-        async def task_wrapper(requests, stubs, endpoint):
+        async def task_wrapper(requests, connection_list, endpoint):
             metadata = (('endpoint', endpoint),) if endpoint else None
-            for i in range(3):
+            stubs = connection_list.get_next_connection()
+            hedging_delay = (
+                self._get_hedging_delay(connection_list, endpoint)
+                if type(requests[0]) == DataRequest
+                else None
+            )
+            policy = self._retry_policy
+            budget = connection_list.retry_budget
+            if budget:
+                budget.record_request()
+            limiter = (
+                connection_list.concurrency_limiter
+                if type(requests[0]) == DataRequest
+                else None
+            )
+            for attempt in range(policy.max_attempts):
+                remaining = _get_remaining_time(requests)
+                if remaining is not None and remaining <= 0:
+                    # raised outside of the try, an expired request is neither retried nor counted as a failure
+                    raise _deadline_exceeded(
+                        f'deadline of the request expired {-remaining:.3f}s ago'
+                    )
+                if limiter:
+                    await limiter.acquire()
+                start = time.perf_counter()
                 try:
-                    request_type = type(requests[0])
-                    if request_type == DataRequest and len(requests) == 1:
-
-                        call_result = stubs[0].process_single_data(
-                            requests[0], metadata=metadata
-                        )
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
-                        )
-                        return response, metadata
-                    if request_type == DataRequest and len(requests) > 1:
-                        call_result = stubs[1].process_data(requests, metadata=metadata)
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
+                    if hedging_delay is not None:
+                        result = await self._send_hedged(
+                            requests, connection_list, stubs, metadata, hedging_delay
                         )
-                        return response, metadata
-                    elif request_type == ControlRequest:
-                        call_result = stubs[2].process_control(requests[0])
-                        metadata, response = (
-                            await call_result.trailing_metadata(),
-                            await call_result,
-                        )
-                        return response, metadata
                     else:
-                        raise ValueError(
-                            f'Unsupported request type {type(requests[0])}'
+                        result = await self._send_to_connection(
+                            requests, connection_list, stubs, metadata
                         )
+                    if limiter:
+                        limiter.release(latency=time.perf_counter() - start)
+                    return result
                 except AioRpcError as e:
-                    if e.code() != grpc.StatusCode.UNAVAILABLE:
+                    if limiter:
+                        # the slot is not held during the backoff
+                        limiter.release(error=e)
+                    if not policy.is_retryable(e):
                         raise
-                    elif e.code() == grpc.StatusCode.UNAVAILABLE and i == 2:
+                    elif attempt == policy.max_attempts - 1:
                         self._logger.debug(f'GRPC call failed, retries exhausted')
                         raise
+                    elif budget and not budget.try_retry():
+                        self._retries_rejected += 1
+                        self._logger.debug(
+                            f'GRPC call failed with {e.code()}, retry budget exhausted'
+                        )
+                        raise
                     else:
+                        self._retries += 1
                         self._logger.debug(
-                            f'GRPC call failed with StatusCode.UNAVAILABLE, retry attempt {i+1}/3'
+                            f'GRPC call failed with {e.code()}, retry attempt {attempt + 1}/{policy.max_attempts - 1}'
                         )
+                        await asyncio.sleep(policy.get_backoff(attempt))
+                        if policy.retry_on_different_replica:
+                            stubs = self._get_other_connection(connection_list, stubs)
+                except BaseException:
+                    if limiter:
+                        limiter.release()
+                    raise
 
-        return asyncio.create_task(task_wrapper(requests, connection, endpoint))
+        return asyncio.create_task(task_wrapper(requests, connection_list, endpoint))
 
     @staticmethod
     def get_grpc_channel(
@@ -533,6 +1953,36 @@ class GrpcConnectionPool:
 
         return insecure_channel(address, options)
 
+    @staticmethod
+    def get_uds_address(port: Union[int, str]) -> Optional[str]:
+        """
+        Returns the address of the unix domain socket a runtime listens on next to its TCP port
+
+        :param port: the TCP port of the runtime
+        :return: the address in the format unix:<path>, None if unix domain sockets are not supported on this platform
+        """
+        if os.name == 'nt':
+            return None
+        return f'unix:{os.path.join(tempfile.gettempdir(), f"jina-{port}.sock")}'
+
+    @staticmethod
+    def get_local_uds_address(address: str) -> Optional[str]:
+        """
+        Returns the address of the unix domain socket of a runtime if it runs on the local host
+
+        :param address: the TCP address of the runtime, format is <host>:<port>
+        :return: the address in the format unix:<path>, None if the runtime is not local
+        """
+        host, _, port = address.rpartition(':')
+        if not port.isdigit():
+            return None
+        try:
+            is_local = host_is_local(host)
+        except ValueError:
+            # host names which do not resolve to localhost
+            is_local = False
+        return GrpcConnectionPool.get_uds_address(port) if is_local else None
+
     @staticmethod
     def activate_worker_sync(
         worker_host: str,
@@ -616,9 +2066,10 @@ class GrpcConnectionPool:
         https=False,
         root_certificates: Optional[str] = None,
         endpoint: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Request:
         """
-        Sends a request synchronically to the target via grpc
+        Sends a request synchronically to the target via grpc, the channel to the target is cached and reused
 
         :param request: the request to send
         :param target: where to send the request to, like 127.0.0.1:8080
@@ -626,13 +2077,14 @@ class GrpcConnectionPool:
         :param https: if True, use https for the grpc channel
         :param root_certificates: the path to the root certificates for https, only used if https is True
         :param endpoint: endpoint to target with the request
+        :param retry_policy: defines how failed requests are retried, the default policy if None
 
         :returns: the response request
         """
-
-        for i in range(3):
+        retry_policy = retry_policy or RetryPolicy()
+        for attempt in range(retry_policy.max_attempts):
             try:
-                with GrpcConnectionPool.get_grpc_channel(
+                with _channel_cache.channel(
                     target,
                     https=https,
                     root_certificates=root_certificates,
@@ -648,8 +2100,12 @@ class GrpcConnectionPool:
                         response = stub.process_control(request, timeout=timeout)
                     return response
             except grpc.RpcError as e:
-                if e.code() != grpc.StatusCode.UNAVAILABLE or i == 2:
+                if (
+                    not retry_policy.is_retryable(e)
+                    or attempt == retry_policy.max_attempts - 1
+                ):
                     raise
+                time.sleep(retry_policy.get_backoff(attempt))
 
     @staticmethod
     def get_default_grpc_options():
@@ -672,7 +2128,8 @@ class GrpcConnectionPool:
         root_certificates: Optional[str] = None,
     ) -> Request:
         """
-        Sends a request asynchronously to the target via grpc
+        Sends a request asynchronously to the target via grpc. The blocking call over the cached channel to the target
+        runs in the default executor of the event loop
 
         :param request: the request to send
         :param target: where to send the request to, like 127.0.0.1:8080
@@ -683,18 +2140,18 @@ class GrpcConnectionPool:
         :returns: the response request
         """
 
-        async with GrpcConnectionPool.get_grpc_channel(
-            target,
-            asyncio=True,
-            https=https,
-            root_certificates=root_certificates,
-        ) as channel:
-            if type(request) == DataRequest:
-                stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
-                return await stub.process_single_data(request, timeout=timeout)
-            elif type(request) == ControlRequest:
-                stub = jina_pb2_grpc.JinaControlRequestRPCStub(channel)
-                return await stub.process_control(request, timeout=timeout)
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                GrpcConnectionPool.send_request_sync,
+                request,
+                target,
+                timeout=timeout,
+                https=https,
+                root_certificates=root_certificates,
+                retry_policy=RetryPolicy(max_attempts=1),
+            ),
+        )
 
     @staticmethod
     def create_async_channel_stub(
@@ -738,6 +2195,15 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
     :param namespace: K8s namespace to operate in
     :param client: K8s client
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param hedging: maps endpoints to the delay after which a duplicate of a request is sent to another replica
+    :param retry_policy: defines how failed requests are retried, the default policy if None
+    :param data_streaming: if True, data requests are multiplexed over a long-lived bidirectional stream per replica
+    :param uds: if True, replicas on the local host are connected over their unix domain socket instead of TCP
+    :param shared_memory: if True, large docs are passed to replicas connected over a unix domain socket in shared memory
+    :param compression: the compression of data requests sent to replicas which are not connected over a unix domain socket
+    :param compression_min_bytes: data requests smaller than this number of bytes are sent uncompressed
+    :param concurrency_limit: defines the adaptive limit of the data requests in flight per deployment, None disables it
     """
 
     K8S_PORT_EXPOSE = 8080
@@ -750,8 +2216,28 @@ class K8sGrpcConnectionPool(GrpcConnectionPool):
         namespace: str,
         client: 'kubernetes.client.CoreV1Api',
         logger: JinaLogger = None,
+        load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+        hedging: Optional[Dict[str, Union[float, str]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        data_streaming: bool = False,
+        uds: bool = False,
+        shared_memory: bool = False,
+        compression: CompressionType = CompressionType.NONE,
+        compression_min_bytes: int = MessageCompression.MIN_BYTES,
+        concurrency_limit: Optional[ConcurrencyLimitPolicy] = None,
     ):
-        super().__init__(logger=logger)
+        super().__init__(
+            logger=logger,
+            load_balancing=load_balancing,
+            hedging=hedging,
+            retry_policy=retry_policy,
+            data_streaming=data_streaming,
+            uds=uds,
+            shared_memory=shared_memory,
+            compression=compression,
+            compression_min_bytes=compression_min_bytes,
+            concurrency_limit=concurrency_limit,
+        )
 
         self._namespace = namespace
         self._process_events_task = None
@@ -903,12 +2389,30 @@ def create_connection_pool(
     k8s_connection_pool: bool = False,
     k8s_namespace: Optional[str] = None,
     logger: Optional[JinaLogger] = None,
+    load_balancing: LoadBalancingType = LoadBalancingType.ROUND_ROBIN,
+    hedging: Optional[Dict[str, Union[float, str]]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    data_streaming: bool = False,
+    uds: bool = False,
+    shared_memory: bool = False,
+    compression: CompressionType = CompressionType.NONE,
+    compression_min_bytes: int = MessageCompression.MIN_BYTES,
+    concurrency_limit: Optional[ConcurrencyLimitPolicy] = None,
 ) -> GrpcConnectionPool:
     """
     Creates the appropriate connection pool based on parameters
     :param k8s_namespace: k8s namespace the pool will live in, None if outside K8s
     :param k8s_connection_pool: flag to indicate if K8sGrpcConnectionPool should be used, defaults to true in K8s
     :param logger: the logger to use
+    :param load_balancing: the strategy used to select a replica of a deployment
+    :param hedging: maps endpoints to the delay after which a duplicate of a request is sent to another replica
+    :param retry_policy: defines how failed requests are retried, the default policy if None
+    :param data_streaming: if True, data requests are multiplexed over a long-lived bidirectional stream per replica
+    :param uds: if True, replicas on the local host are connected over their unix domain socket instead of TCP
+    :param shared_memory: if True, large docs are passed to replicas connected over a unix domain socket in shared memory
+    :param compression: the compression of data requests sent to replicas which are not connected over a unix domain socket
+    :param compression_min_bytes: data requests smaller than this number of bytes are sent uncompressed
+    :param concurrency_limit: defines the adaptive limit of the data requests in flight per deployment, None disables it
     :return: A connection pool object
     """
     if k8s_connection_pool and k8s_namespace:
@@ -920,10 +2424,32 @@ def create_connection_pool(
         k8s_client = client.ApiClient()
         core_client = client.CoreV1Api(api_client=k8s_client)
         return K8sGrpcConnectionPool(
-            namespace=k8s_namespace, client=core_client, logger=logger
+            namespace=k8s_namespace,
+            client=core_client,
+            logger=logger,
+            load_balancing=load_balancing,
+            hedging=hedging,
+            retry_policy=retry_policy,
+            data_streaming=data_streaming,
+            uds=uds,
+            shared_memory=shared_memory,
+            compression=compression,
+            compression_min_bytes=compression_min_bytes,
+            concurrency_limit=concurrency_limit,
         )
     else:
-        return GrpcConnectionPool(logger=logger)
+        return GrpcConnectionPool(
+            logger=logger,
+            load_balancing=load_balancing,
+            hedging=hedging,
+            retry_policy=retry_policy,
+            data_streaming=data_streaming,
+            uds=uds,
+            shared_memory=shared_memory,
+            compression=compression,
+            compression_min_bytes=compression_min_bytes,
+            concurrency_limit=concurrency_limit,
+        )
 
 
 def host_is_local(hostname):
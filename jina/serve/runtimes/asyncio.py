@@ -1,17 +1,21 @@
 import argparse
 import asyncio
+import os
 import signal
 import time
 from abc import ABC, abstractmethod
-from typing import Union, Optional, TYPE_CHECKING
+from typing import Union, Optional, TYPE_CHECKING, Dict, List
 
+import grpc
 from grpc import RpcError
 
 from jina.serve.runtimes.base import BaseRuntime
 from jina import __windows__
 from jina.importer import ImportExtensions
 
-from jina.serve.networking import GrpcConnectionPool
+from jina.enums import CompressionType
+from jina.serve.compression import MessageCompression
+from jina.serve.networking import GrpcConnectionPool, _DataRequestStream
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
 
@@ -37,6 +41,10 @@ class AsyncNewLoopRuntime(BaseRuntime, ABC):
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         self.is_cancel = cancel_event or asyncio.Event()
+        self._response_compression = MessageCompression(
+            getattr(args, 'compression', CompressionType.NONE),
+            getattr(args, 'compression_min_bytes', MessageCompression.MIN_BYTES),
+        )
 
         if not __windows__:
             # TODO: windows event loops don't support signal handlers
@@ -178,6 +186,52 @@ class AsyncNewLoopRuntime(BaseRuntime, ABC):
             time.sleep(0.1)
         return False
 
+    def _add_uds_port(self, server: 'grpc.aio.Server'):
+        """
+        Let the grpc server also listen on the unix domain socket belonging to `port_in`,
+        connection pools on the same host use it instead of TCP
+
+        :param server: the grpc server
+        """
+        self._uds_path = None
+        uds_address = GrpcConnectionPool.get_uds_address(self.args.port_in)
+        if not uds_address or getattr(self.args, 'disable_uds', False):
+            return
+        try:
+            server.add_insecure_port(uds_address)
+        except RuntimeError as ex:
+            self.logger.warning(
+                f'Could not listen on {uds_address}, only TCP is used: {ex!r}'
+            )
+            return
+        self._uds_path = uds_address[len('unix:') :]
+        self.logger.debug(f'Start listening on {uds_address}')
+
+    def _set_response_compression(self, context, response: DataRequest):
+        """
+        Compress the response of a unary call if it is large enough and not sent over a unix domain socket
+
+        :param context: grpc context
+        :param response: the response request
+        """
+        if not self._response_compression or isinstance(
+            context, _DataRequestStreamContext
+        ):
+            return
+        if context.peer().startswith('unix:'):
+            return
+        compression = self._response_compression.get_compression([response])
+        if compression is not None:
+            context.set_compression(compression)
+
+    def _remove_uds(self):
+        if getattr(self, '_uds_path', None):
+            try:
+                os.unlink(self._uds_path)
+            except FileNotFoundError:
+                pass
+            self._uds_path = None
+
     def _log_info_msg(self, request: Union[ControlRequest, DataRequest]):
         if type(request) == DataRequest:
             self._log_data_request(request)
@@ -193,3 +247,83 @@ class AsyncNewLoopRuntime(BaseRuntime, ABC):
         info_msg = f'recv DataRequest '
         info_msg += f'({request.header.exec_endpoint}) - ({request.header.request_id}) '
         self.logger.debug(info_msg)
+
+
+class _DataRequestStreamContext:
+    """
+    Stands in for the grpc context of a unary call when a request was received over a data request stream
+    """
+
+    def __init__(self, metadata: Dict[str, str]):
+        self._metadata = metadata
+        self.trailing_metadata = {}
+
+    def invocation_metadata(self):
+        """
+        Returns the metadata sent together with the request
+
+        :return: the metadata as key-value pairs
+        """
+        return list(self._metadata.items())
+
+    def set_trailing_metadata(self, trailing_metadata):
+        """
+        Sets the metadata sent together with the response
+
+        :param trailing_metadata: the metadata as key-value pairs
+        """
+        self.trailing_metadata = dict(trailing_metadata)
+
+
+class DataRequestStreamMixin:
+    """
+    Serves the data request stream on top of the unary `process_data` of a runtime. Requests received over the stream
+    are processed concurrently, their responses are sent back in the order they complete
+    """
+
+    async def process_data_stream(self, request_iterator, context):
+        """
+        Process the requests received over the stream and send back their results
+
+        :param request_iterator: the messages received over the stream, tuples of requests and metadata
+        :param context: grpc context
+        :yields: tuples of a response request and its metadata
+        """
+        responses = asyncio.Queue()
+        pending = set()
+
+        async def _handle(requests: List[DataRequest], metadata: Dict[str, str]):
+            stream_context = _DataRequestStreamContext(metadata)
+            try:
+                response = await self.process_data(requests, stream_context)
+                response_metadata = stream_context.trailing_metadata
+            except Exception as ex:
+                response = requests[0]
+                response_metadata = {
+                    _DataRequestStream.ERROR_CODE: grpc.StatusCode.UNKNOWN.name,
+                    _DataRequestStream.ERROR_DETAILS: f'{ex!r}',
+                }
+            responses.put_nowait(([response], response_metadata))
+
+        async def _read():
+            try:
+                async for requests, metadata in request_iterator:
+                    task = asyncio.create_task(_handle(requests, metadata))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                if pending:
+                    await asyncio.wait(set(pending))
+            finally:
+                responses.put_nowait(None)
+
+        reader = asyncio.create_task(_read())
+        try:
+            while True:
+                response = await responses.get()
+                if response is None:
+                    break
+                yield response
+        finally:
+            reader.cancel()
+            for task in list(pending):
+                task.cancel()
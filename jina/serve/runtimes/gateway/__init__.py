@@ -1,7 +1,18 @@
 from abc import ABC
+from typing import Optional
 
+from jina.serve.runtimes.gateway.batching import BatchingPolicy, RequestBatcher
 from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
-from jina.serve.networking import create_connection_pool
+from jina.serve.runtimes.gateway.response_cache import (
+    ResponseCache,
+    ResponseCachePolicy,
+)
+from jina.serve.runtimes.gateway.singleflight import Singleflight
+from jina.serve.networking import (
+    create_connection_pool,
+    ConcurrencyLimitPolicy,
+    RetryPolicy,
+)
 
 from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
 
@@ -18,6 +29,49 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
         graph_description = json.loads(self.args.graph_description)
         self._topology_graph = TopologyGraph(graph_description)
 
+    def _set_response_cache(self):
+        import json
+
+        self._response_cache = (
+            ResponseCache(ResponseCachePolicy(**json.loads(self.args.response_cache)))
+            if self.args.response_cache
+            else None
+        )
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        The cache of the responses to requests to idempotent endpoints, its `stats` hold the hits and misses
+
+        :return: the response cache, None if responses are not cached
+        """
+        return self._response_cache
+
+    def _set_request_batcher(self):
+        import json
+
+        self._request_batcher = (
+            RequestBatcher(BatchingPolicy(**json.loads(self.args.request_batching)))
+            if self.args.request_batching
+            else None
+        )
+
+    def _set_singleflight(self):
+        self._singleflight = (
+            Singleflight(self.args.singleflight_endpoints)
+            if self.args.singleflight_endpoints
+            else None
+        )
+
+    @property
+    def singleflight(self) -> Optional[Singleflight]:
+        """
+        The collapsing of identical requests in flight, its `stats` hold the number of collapsed requests
+
+        :return: the singleflight, None if no requests are collapsed
+        """
+        return self._singleflight
+
     def _set_connection_pool(self):
         import json
 
@@ -27,6 +81,21 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=self.args.k8s_connection_pool,
             k8s_namespace=self.args.k8s_namespace,
+            load_balancing=self.args.load_balancing,
+            hedging=json.loads(self.args.hedging) if self.args.hedging else None,
+            retry_policy=RetryPolicy(**json.loads(self.args.retry_policy))
+            if self.args.retry_policy
+            else None,
+            data_streaming=self.args.data_streaming,
+            uds=not self.args.disable_uds,
+            shared_memory=self.args.shared_memory,
+            compression=self.args.compression,
+            compression_min_bytes=self.args.compression_min_bytes,
+            concurrency_limit=ConcurrencyLimitPolicy(
+                **json.loads(self.args.concurrency_limit)
+            )
+            if self.args.concurrency_limit
+            else None,
         )
         for deployment_name, addresses in deployments_addresses.items():
             for address in addresses:
@@ -0,0 +1,181 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from docarray import DocumentArray
+
+from jina.types.request.data import DataRequest
+
+if TYPE_CHECKING:
+    from jina.types.request import Request
+
+SendBatch = Callable[['DataRequest'], Awaitable[Tuple['DataRequest', Dict]]]
+
+
+class BatchingPolicy:
+    """
+    Defines which requests the gateway coalesces into one request before it sends them to the Flow. Requests to the
+    same endpoint with the same parameters are coalesced until they hold `max_batch_docs` Documents or the first of
+    them waited `max_wait_ms`
+
+    :param endpoints: the endpoints whose requests are coalesced, the Executors must keep the ids of the Documents
+    :param max_batch_docs: the maximal number of Documents of a coalesced request
+    :param max_wait_ms: the maximal milliseconds a request waits for other requests to be coalesced with
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        max_batch_docs: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        if max_batch_docs < 1:
+            raise ValueError(f'max_batch_docs must be at least 1, got {max_batch_docs}')
+        if max_wait_ms < 0:
+            raise ValueError(f'max_wait_ms must not be negative, got {max_wait_ms}')
+        self.endpoints = frozenset(endpoints)
+        self.max_batch_docs = max_batch_docs
+        self.max_wait_ms = max_wait_ms
+
+
+class _Batch:
+    __slots__ = ('requests', 'doc_ids', 'all_doc_ids', 'futures', 'num_docs', 'timer')
+
+    def __init__(self):
+        self.requests: List['DataRequest'] = []
+        # the ids of the docs of every request, the response is split back by them
+        self.doc_ids: List[List[str]] = []
+        self.all_doc_ids: Set[str] = set()
+        self.futures: List[asyncio.Future] = []
+        self.num_docs = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class RequestBatcher:
+    """
+    Coalesces concurrent requests of different clients into one request, so that the Executors process their Documents
+    as one batch, and splits the response back to the clients by the ids of their Documents
+
+    :param policy: the policy of the batching
+    """
+
+    def __init__(self, policy: BatchingPolicy):
+        self._policy = policy
+        self._batches: Dict[Hashable, _Batch] = {}
+
+    def submit(self, request: 'Request', send: SendBatch) -> Optional['asyncio.Future']:
+        """
+        Adds the request to the batch of its endpoint and parameters. The batch is sent once it is full or its first
+        request waited `max_wait_ms`
+
+        :param request: the request
+        :param send: sends a request through the Flow and returns its response and metadata
+        :return: a future of the response and metadata for the request, None if the request is not batched, because
+            its endpoint is not batched or its docs do not have unique ids
+        """
+        header = request.header
+        if header.exec_endpoint not in self._policy.endpoints:
+            return None
+        doc_ids = [doc.id for doc in request.docs]
+        unique_ids = set(doc_ids)
+        if not doc_ids or len(unique_ids) < len(doc_ids):
+            return None
+        key = (
+            header.exec_endpoint,
+            request.proto_wo_data.parameters.SerializeToString(deterministic=True),
+        )
+        batch = self._batches.get(key)
+        if batch is not None and (
+            batch.num_docs + len(doc_ids) > self._policy.max_batch_docs
+            or not unique_ids.isdisjoint(batch.all_doc_ids)
+        ):
+            # the docs of the request do not fit into the batch or could not be told apart in its response
+            self._flush(key, send)
+            batch = None
+        if batch is None:
+            batch = _Batch()
+            self._batches[key] = batch
+            batch.timer = asyncio.get_event_loop().call_later(
+                self._policy.max_wait_ms / 1000, self._flush, key, send
+            )
+        future = asyncio.get_event_loop().create_future()
+        batch.requests.append(request)
+        batch.doc_ids.append(doc_ids)
+        batch.all_doc_ids.update(unique_ids)
+        batch.futures.append(future)
+        batch.num_docs += len(doc_ids)
+        if batch.num_docs >= self._policy.max_batch_docs:
+            self._flush(key, send)
+        return future
+
+    def _flush(self, key: Hashable, send: SendBatch):
+        batch = self._batches.pop(key)
+        batch.timer.cancel()
+        if len(batch.requests) == 1:
+            # a request which was not coalesced is sent as it is
+            task = asyncio.ensure_future(send(batch.requests[0]))
+            task.add_done_callback(lambda t: _set_future_from(batch.futures[0], t))
+            return
+        task = asyncio.ensure_future(send(_merge(batch.requests)))
+        task.add_done_callback(lambda t: _split(batch, t))
+
+
+def _set_future_from(future: asyncio.Future, task: asyncio.Task):
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+def _merge(requests: List['DataRequest']) -> 'DataRequest':
+    first = requests[0]
+    merged = DataRequest()
+    merged.header.exec_endpoint = first.header.exec_endpoint
+    merged.proto_wo_data.parameters.CopyFrom(first.proto_wo_data.parameters)
+    deadlines = [
+        request.header.timeout
+        for request in requests
+        if request.header.HasField('timeout')
+    ]
+    if deadlines:
+        # the coalesced request expires with the first of its requests
+        merged.header.timeout = min(deadlines)
+    docs = DocumentArray()
+    for request in requests:
+        docs.extend(request.docs)
+    merged.data.docs = docs
+    return merged
+
+
+def _split(batch: _Batch, task: asyncio.Task):
+    if task.cancelled() or task.exception() is not None:
+        for future in batch.futures:
+            _set_future_from(future, task)
+        return
+    response, metadata = task.result()
+    docs_by_id = {doc.id: doc for doc in response.docs}
+    for request, doc_ids, future in zip(batch.requests, batch.doc_ids, batch.futures):
+        if future.done():
+            continue
+        # the request is answered with its own header and routes, extended by those of the coalesced response
+        request.data.docs = DocumentArray(
+            [docs_by_id[doc_id] for doc_id in doc_ids if doc_id in docs_by_id]
+        )
+        request.header.status.CopyFrom(response.header.status)
+        request.proto_wo_data.parameters.CopyFrom(response.proto_wo_data.parameters)
+        request.routes.extend(response.routes)
+        future.set_result((request, metadata))
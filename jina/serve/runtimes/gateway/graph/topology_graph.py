@@ -2,11 +2,14 @@ import asyncio
 
 from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
 
 from jina.serve.networking import GrpcConnectionPool
 from jina.types.request.data import DataRequest
 
+if TYPE_CHECKING:
+    from jina.proto import jina_pb2
+
 
 class TopologyGraph:
     """
@@ -19,135 +22,54 @@ class TopologyGraph:
     """
 
     class _ReqReplyNode:
-        def __init__(self, name: str, number_of_parts: int = 1, hanging: bool = False):
+        def __init__(
+            self, name: str, index: int, number_of_parts: int = 1, hanging: bool = False
+        ):
             self.name = name
+            # the position of the node in the per request state
+            self.index = index
             self.outgoing_nodes = []
             self.number_of_parts = number_of_parts
             self.hanging = hanging
-            self.parts_to_send = []
-            self.start_time = None
-            self.end_time = None
-            self.status = None
 
         @property
         def leaf(self):
             return len(self.outgoing_nodes) == 0
 
-        async def _wait_previous_and_send(
+    class _Segment:
+        """
+        A linear chain of nodes, where every node but the first receives the response of its predecessor only. The
+        nodes of a segment are sent the request one after the other by a single coroutine.
+        """
+
+        __slots__ = ('nodes', 'predecessors', 'from_gateway', 'leaf', 'hanging')
+
+        def __init__(
             self,
-            request: DataRequest,
-            previous_task: Optional[asyncio.Task],
-            connection_pool: GrpcConnectionPool,
-            endpoint: Optional[str],
+            nodes: List['TopologyGraph._ReqReplyNode'],
+            predecessors: Tuple[int, ...],
+            from_gateway: bool,
         ):
-            metadata = {}
-            if previous_task is not None:
-                result = await previous_task
-                request, metadata = result[0], result[1]
-            if 'is-error' in metadata:
-                return request, metadata
-            elif request is not None:
-                self.parts_to_send.append(request)
-                # this is a specific needs
-                if len(self.parts_to_send) == self.number_of_parts:
-                    self.start_time = datetime.utcnow()
-                    resp, metadata = await connection_pool.send_requests_once(
-                        requests=self.parts_to_send,
-                        deployment=self.name,
-                        head=True,
-                        endpoint=endpoint,
-                    )
-                    self.end_time = datetime.utcnow()
-                    if 'is-error' in metadata:
-                        self.status = resp.header.status
-                    return resp, metadata
-            return None, {}
+            self.nodes = nodes
+            # the indices of the segments whose responses are the parts received by the first node
+            self.predecessors = predecessors
+            self.from_gateway = from_gateway
+            self.leaf = nodes[-1].leaf
+            self.hanging = nodes[-1].hanging
 
-        def get_leaf_tasks(
-            self,
-            connection_pool: GrpcConnectionPool,
-            request_to_send: Optional[DataRequest],
-            previous_task: Optional[asyncio.Task],
-            endpoint: Optional[str] = None,
-        ) -> List[Tuple[bool, asyncio.Task]]:
-            """
-            Gets all the tasks corresponding from all the subgraphs born from this node
-
-            :param connection_pool: The connection_pool need to actually send the requests
-            :param request_to_send: Optional request to be sent when the node is an origin of a graph
-            :param previous_task: Optional task coming from the predecessor of the Node
-            :param endpoint: Optional string defining the endpoint of this request
-
-            .. note:
-                deployment1 -> outgoing_nodes: deployment2
-                deployment2 -> outgoing_nodes: deployment4
-                deployment3 -> outgoing_nodes: deployment4
-                deployment4 -> outgoing_nodes: deployment6
-                deployment5 -> outgoing_nodes: deployment6
-                deployment6 -> outgoing_nodes: []
-
-                |-> deployment1 -> deployment2 -->
-                |                   | -> deployment4 --->
-                |-> deployment3 ---------->             | -> deployment6
-                |-> deployment5 ------------------------>
-
-                Let's imagine a graph from this. Node corresponding to Deployment6 will receive 2 calls from deployment4 and deployment5.
-                The task returned by `deployment6` will backpropagated to the caller of deployment1.get_leaf_tasks, deployment3.get_leaf_tasks and deployment5.get_leaf_tasks.
-
-                When the caller of these methods await them, they will fire the logic of sending requests and responses from and to every deployment
-
-            :return: Return a list of tuples, where tasks corresponding to the leafs of all the subgraphs born from this node are in each tuple.
-                These tasks will be based on awaiting for the task from previous_node and sending a request to the corresponding node. The other member of the pair
-                is a flag indicating if the task is to be awaited by the gateway or not.
-            """
-            wait_previous_and_send_task = asyncio.create_task(
-                self._wait_previous_and_send(
-                    request_to_send, previous_task, connection_pool, endpoint=endpoint
-                )
-            )
-            if self.leaf:  # I am like a leaf
-                return [
-                    (not self.hanging, wait_previous_and_send_task)
-                ]  # I am the last in the chain
-            hanging_tasks_tuples = []
-            for outgoing_node in self.outgoing_nodes:
-                t = outgoing_node.get_leaf_tasks(
-                    connection_pool,
-                    None,
-                    wait_previous_and_send_task,
-                    endpoint=endpoint,
-                )
-                # We are interested in the last one, that will be the task that awaits all the previous
-                hanging_tasks_tuples.extend(t)
-
-            return hanging_tasks_tuples
-
-        def add_route(self, request: 'DataRequest'):
-            """
-             Add routes to the DataRequest based on the state of request processing
-
-             :param request: the request to add the routes to
-            :return: modified request with added routes
-            """
-
-            def _find_route(request):
-                for r in request.routes:
-                    if r.executor == self.name:
-                        return r
-                return None
-
-            r = _find_route(request)
-            if r is None and self.start_time:
-                r = request.routes.add()
-                r.executor = self.name
-                r.start_time.FromDatetime(self.start_time)
-                if self.end_time:
-                    r.end_time.FromDatetime(self.end_time)
-                if self.status:
-                    r.status.CopyFrom(self.status)
-            for outgoing_node in self.outgoing_nodes:
-                request = outgoing_node.add_route(request=request)
-            return request
+    class RequestState:
+        """
+        The state of a single request routed through the graph, the graph itself is shared by all requests
+
+        :param num_nodes: the number of nodes of the graph
+        """
+
+        __slots__ = ('start_times', 'end_times', 'statuses')
+
+        def __init__(self, num_nodes: int):
+            self.start_times: List[Optional[datetime]] = [None] * num_nodes
+            self.end_times: List[Optional[datetime]] = [None] * num_nodes
+            self.statuses: List[Optional['jina_pb2.StatusProto']] = [None] * num_nodes
 
     def __init__(self, graph_representation: Dict, *args, **kwargs):
         num_parts_per_node = defaultdict(int)
@@ -168,9 +90,10 @@ class TopologyGraph:
                     num_parts_per_node[out_node_name] += 1
 
         nodes = {}
-        for node_name in node_set:
+        for index, node_name in enumerate(node_set):
             nodes[node_name] = self._ReqReplyNode(
                 name=node_name,
+                index=index,
                 number_of_parts=num_parts_per_node[node_name]
                 if num_parts_per_node[node_name] > 0
                 else 1,
@@ -183,17 +106,188 @@ class TopologyGraph:
                     if out_node_name not in ['start-gateway', 'end-gateway']:
                         nodes[node_name].outgoing_nodes.append(nodes[out_node_name])
 
+        self._nodes = list(nodes.values())
         self._origin_nodes = [nodes[node_name] for node_name in origin_node_names]
+        self._segments, self._leaf_segments = self._compile()
+
+    def _compile(self) -> Tuple[List['TopologyGraph._Segment'], List[int]]:
+        # splits the nodes reachable from the gateway into segments, sorted such that every segment comes after its
+        # predecessors, and returns them with the indices of the segments ending in a leaf in depth first order
+        reachable = []
+        incoming = defaultdict(list)
+        stack = list(reversed(self._origin_nodes))
+        visited = set()
+        while stack:
+            node = stack.pop()
+            if node.index in visited:
+                continue
+            visited.add(node.index)
+            reachable.append(node)
+            stack.extend(reversed(node.outgoing_nodes))
+        self._nodes_depth_first = reachable
+        for node in reachable:
+            for outgoing_node in node.outgoing_nodes:
+                incoming[outgoing_node.index].append(node)
+        origin_indices = {node.index for node in self._origin_nodes}
+
+        def _starts_segment(node) -> bool:
+            predecessors = incoming[node.index]
+            return (
+                node.index in origin_indices
+                or len(predecessors) != 1
+                or len(predecessors[0].outgoing_nodes) != 1
+            )
+
+        chains = {}
+        for node in reachable:
+            if _starts_segment(node):
+                chain = [node]
+                while len(chain[-1].outgoing_nodes) == 1 and not _starts_segment(
+                    chain[-1].outgoing_nodes[0]
+                ):
+                    chain.append(chain[-1].outgoing_nodes[0])
+                chains[node.index] = chain
+        segment_of_last_node = {
+            chain[-1].index: first for first, chain in chains.items()
+        }
+
+        # topological order of the segments
+        order = []
+        placed = set()
+        pending = list(chains)
+        while pending:
+            first = pending.pop(0)
+            predecessors = {
+                segment_of_last_node[node.index] for node in incoming[first]
+            }
+            if predecessors <= placed:
+                order.append(first)
+                placed.add(first)
+            else:
+                pending.append(first)
+        position = {first: i for i, first in enumerate(order)}
+        segments = [
+            self._Segment(
+                nodes=chains[first],
+                predecessors=tuple(
+                    position[segment_of_last_node[node.index]]
+                    for node in incoming[first]
+                ),
+                from_gateway=first in origin_indices,
+            )
+            for first in order
+        ]
+        leaf_segments = [
+            position[segment_of_last_node[node.index]]
+            for node in reachable
+            if node.leaf
+        ]
+        return segments, leaf_segments
+
+    def create_request_state(self) -> 'TopologyGraph.RequestState':
+        """
+        Creates the state of a new request routed through the graph
+
+        :return: the request state
+        """
+        return self.RequestState(len(self._nodes))
+
+    async def _send_segment(
+        self,
+        segment: '_Segment',
+        request: Optional[DataRequest],
+        previous_tasks: List[asyncio.Task],
+        connection_pool: GrpcConnectionPool,
+        endpoint: Optional[str],
+        state: 'RequestState',
+    ):
+        parts = [request] if request is not None else []
+        if len(previous_tasks) > 1:
+            # the parts are sent in the order in which the responses of the predecessors arrive
+            previous_tasks = asyncio.as_completed(previous_tasks)
+        for previous_task in previous_tasks:
+            response, metadata = await previous_task
+            if 'is-error' in metadata:
+                return response, metadata
+            if response is not None:
+                parts.append(response)
+        if not parts:
+            return None, {}
+        for node in segment.nodes:
+            state.start_times[node.index] = datetime.utcnow()
+            response, metadata = await connection_pool.send_requests_once(
+                requests=parts,
+                deployment=node.name,
+                head=True,
+                endpoint=endpoint,
+            )
+            state.end_times[node.index] = datetime.utcnow()
+            if 'is-error' in metadata:
+                state.statuses[node.index] = response.header.status
+                return response, metadata
+            parts = [response]
+        return response, metadata
+
+    def get_leaf_tasks(
+        self,
+        connection_pool: GrpcConnectionPool,
+        request_to_send: DataRequest,
+        state: 'RequestState',
+        endpoint: Optional[str] = None,
+    ) -> List[Tuple[bool, asyncio.Task]]:
+        """
+        Starts routing a request through the graph. Every segment of the graph is sent the request by one task, which
+        awaits the tasks of the segments whose responses it receives
+
+        :param connection_pool: The connection_pool need to actually send the requests
+        :param request_to_send: the request received by the gateway
+        :param state: the state of the request, see :meth:`create_request_state`
+        :param endpoint: Optional string defining the endpoint of this request
+        :return: Return a list of tuples, with the tasks of the segments which end in a leaf of the graph. The other
+            member of the pair is a flag indicating if the task is to be awaited by the gateway or not, tasks of
+            hanging deployments are not.
+        """
+        tasks = []
+        for segment in self._segments:
+            tasks.append(
+                asyncio.create_task(
+                    self._send_segment(
+                        segment,
+                        request_to_send if segment.from_gateway else None,
+                        [tasks[i] for i in segment.predecessors],
+                        connection_pool,
+                        endpoint,
+                        state,
+                    )
+                )
+            )
+        return [
+            (not self._segments[i].hanging, tasks[i]) for i in self._leaf_segments
+        ]
 
-    def add_routes(self, request: 'DataRequest'):
+    def add_routes(self, request: 'DataRequest', state: 'RequestState'):
         """
         Add routes to the DataRequest based on the state of request processing
 
         :param request: the request to add the routes to
+        :param state: the state of the request
         :return: modified request with added routes
         """
-        for node in self._origin_nodes:
-            request = node.add_route(request=request)
+        existing_routes = {route.executor for route in request.routes}
+        for node in self._nodes_depth_first:
+            start_time = state.start_times[node.index]
+            if node.name in existing_routes or start_time is None:
+                continue
+            r = request.routes.add()
+            r.executor = node.name
+            r.start_time.FromDatetime(start_time)
+            end_time = state.end_times[node.index]
+            if end_time:
+                r.end_time.FromDatetime(end_time)
+            status = state.statuses[node.index]
+            if status:
+                r.status.CopyFrom(status)
+            existing_routes.add(node.name)
         return request
 
     @property
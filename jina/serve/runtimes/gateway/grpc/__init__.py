@@ -35,11 +35,18 @@ class GRPCGatewayRuntime(GatewayRuntime):
         )
         self._set_topology_graph()
         self._set_connection_pool()
+        self._set_response_cache()
+        self._set_request_batcher()
+        self._set_singleflight()
 
         self.streamer = RequestStreamer(
             args=self.args,
             request_handler=handle_request(
-                graph=self._topology_graph, connection_pool=self._connection_pool
+                graph=self._topology_graph,
+                connection_pool=self._connection_pool,
+                response_cache=self._response_cache,
+                request_batcher=self._request_batcher,
+                singleflight=self._singleflight,
             ),
             result_handler=handle_result,
         )
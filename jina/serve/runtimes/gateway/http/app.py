@@ -1,10 +1,10 @@
 import argparse
 import json
-from typing import Dict, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 
 from jina import __version__
 from jina.clients.request import request_generator
-from jina.helper import get_full_version
+from jina.helper import get_full_version, random_identity
 from jina.importer import ImportExtensions
 from jina.logging.logger import JinaLogger
 from jina.logging.profile import used_memory_readable
@@ -12,6 +12,9 @@ from jina.logging.profile import used_memory_readable
 if TYPE_CHECKING:
     from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
     from jina.serve.networking import GrpcConnectionPool
+    from jina.serve.runtimes.gateway.batching import RequestBatcher
+    from jina.serve.runtimes.gateway.response_cache import ResponseCache
+    from jina.serve.runtimes.gateway.singleflight import Singleflight
 
 
 def get_fastapi_app(
@@ -19,6 +22,9 @@ def get_fastapi_app(
     topology_graph: 'TopologyGraph',
     connection_pool: 'GrpcConnectionPool',
     logger: 'JinaLogger',
+    response_cache: Optional['ResponseCache'] = None,
+    request_batcher: Optional['RequestBatcher'] = None,
+    singleflight: Optional['Singleflight'] = None,
 ):
     """
     Get the app from FastAPI as the REST interface.
@@ -27,12 +33,15 @@ def get_fastapi_app(
     :param topology_graph: topology graph that manages the logic of sending to the proper executors.
     :param connection_pool: Connection Pool to handle multiple replicas and sending to different of them
     :param logger: Jina logger.
+    :param response_cache: Optional cache of the responses to requests to idempotent endpoints
+    :param request_batcher: Optional batcher which coalesces the requests of different clients
+    :param singleflight: Optional collapsing of identical requests which arrive while the first of them is in flight
     :return: fastapi app
     """
     with ImportExtensions(required=True):
         from fastapi import FastAPI
         from starlette.requests import Request
-        from fastapi.responses import HTMLResponse
+        from fastapi.responses import HTMLResponse, JSONResponse, Response
         from fastapi.middleware.cors import CORSMiddleware
         from jina.serve.runtimes.gateway.http.models import (
             JinaStatusModel,
@@ -72,7 +81,11 @@ def get_fastapi_app(
     streamer = RequestStreamer(
         args=args,
         request_handler=handle_request(
-            graph=topology_graph, connection_pool=connection_pool
+            graph=topology_graph,
+            connection_pool=connection_pool,
+            response_cache=response_cache,
+            request_batcher=request_batcher,
+            singleflight=singleflight,
         ),
         result_handler=handle_result,
     )
@@ -82,6 +95,9 @@ def get_fastapi_app(
     async def _shutdown():
         await connection_pool.close()
 
+    # maps the paths which accept binary DataRequests to their executor endpoint, None to take it from the request
+    binary_endpoints = {}  # type: Dict[str, Optional[str]]
+
     openapi_tags = []
     if not args.no_debug_endpoints:
         openapi_tags.append(
@@ -150,6 +166,8 @@ def get_fastapi_app(
             )
             return result
 
+        binary_endpoints['/post'] = None
+
     def expose_executor_endpoint(exec_endpoint, http_path=None, **kwargs):
         """Exposing an executor endpoint to http endpoint
         :param exec_endpoint: the executor endpoint
@@ -184,6 +202,8 @@ def get_fastapi_app(
             )
             return result
 
+        binary_endpoints[http_path or exec_endpoint] = exec_endpoint
+
     if not args.no_crud_endpoints:
         openapi_tags.append(
             {
@@ -238,4 +258,53 @@ def get_fastapi_app(
             request_dict = k.to_dict()
             return request_dict
 
+    from jina.serve.media_types import (
+        JSON_MEDIA_TYPE,
+        get_accepted_media_type,
+        get_binary_media_types,
+        get_media_type,
+        request_from_bytes,
+        request_to_bytes,
+    )
+
+    binary_media_types = get_binary_media_types()
+
+    @app.middleware('http')
+    async def _binary_requests(request: Request, call_next):
+        """
+        Answers the DataRequests sent as `application/x-protobuf` or `application/msgpack` to the endpoints of the
+        Flow, they are not validated by the JSON models. The response is sent with the media type the request
+        accepts, with the media type of the request by default.
+
+        .. # noqa: DAR101
+        .. # noqa: DAR201
+        """
+        content_type = get_media_type(request.headers.get('content-type'))
+        path = request.url.path
+        if content_type not in binary_media_types or path not in binary_endpoints:
+            return await call_next(request)
+        try:
+            data_request = request_from_bytes(await request.body(), content_type)
+            header = data_request.header
+        except Exception as ex:
+            return JSONResponse(
+                {
+                    'detail': f'the body is not a DataRequest sent as {content_type}: {ex!r}'
+                },
+                status_code=400,
+            )
+        if binary_endpoints[path] is not None:
+            header.exec_endpoint = binary_endpoints[path]
+        if not header.request_id:
+            header.request_id = random_identity()
+        async for result in streamer.stream(request_iterator=iter([data_request])):
+            media_type = get_accepted_media_type(
+                request.headers.get('accept'), default=content_type
+            )
+            if media_type == JSON_MEDIA_TYPE:
+                return JSONResponse(result.to_dict())
+            return Response(
+                content=request_to_bytes(result, media_type), media_type=media_type
+            )
+
     return app
@@ -1,38 +1,110 @@
-import copy
 import asyncio
 
-from typing import List, TYPE_CHECKING, Callable
+from typing import List, TYPE_CHECKING, Callable, Optional
 
+import grpc
+from grpc.aio import AioRpcError
+
+from jina.excepts import DeadlineExceeded
 from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
 from jina.serve.networking import GrpcConnectionPool
 
 if TYPE_CHECKING:
     from jina.types.request import Request
+    from jina.serve.runtimes.gateway.batching import RequestBatcher
+    from jina.serve.runtimes.gateway.response_cache import ResponseCache
+    from jina.serve.runtimes.gateway.singleflight import Singleflight
 
 
 def handle_request(
-    graph: 'TopologyGraph', connection_pool: 'GrpcConnectionPool'
+    graph: 'TopologyGraph',
+    connection_pool: 'GrpcConnectionPool',
+    response_cache: Optional['ResponseCache'] = None,
+    request_batcher: Optional['RequestBatcher'] = None,
+    singleflight: Optional['Singleflight'] = None,
 ) -> Callable[['Request'], 'asyncio.Future']:
     """
     Function that handles the requests arriving to the gateway. This will be passed to the streamer.
 
     :param graph: The TopologyGraph of the Flow.
     :param connection_pool: The connection pool to be used to send messages to specific nodes of the graph
+    :param response_cache: Optional cache of the responses to requests to idempotent endpoints
+    :param request_batcher: Optional batcher which coalesces the requests of different clients
+    :param singleflight: Optional collapsing of identical requests which arrive while the first of them is in flight
     :return: Return a Function that given a Request will return a Future from where to extract the response
     """
 
+    async def _send_batch(request: 'Request'):
+        # sends a request coalesced from the requests of several clients through the graph
+        request_state = graph.create_request_state()
+        leaf_tasks = graph.get_leaf_tasks(
+            connection_pool,
+            request,
+            request_state,
+            endpoint=request.header.exec_endpoint,
+        )
+        partial_responses = await asyncio.gather(
+            *[task for ret, task in leaf_tasks if ret]
+        )
+        response, metadata = [
+            (response, metadata)
+            for response, metadata in partial_responses
+            if response is not None
+        ][0]
+        graph.add_routes(response, request_state)
+        return response, metadata
+
     def _handle_request(request: 'Request') -> 'asyncio.Future':
 
-        request_graph = copy.deepcopy(graph)
-        # important that the gateway needs to have an instance of the graph per request
+        # the graph is shared by all requests, what happens to this request is kept in its own state
+        request_state = graph.create_request_state()
         tasks_to_respond = []
         tasks_to_ignore = []
         endpoint = request.header.exec_endpoint
         r = request.routes.add()
         r.executor = 'gateway'
         r.start_time.GetCurrentTime()
+        remaining_time = request.remaining_time
+        cache_key = None
+        if response_cache is not None and (
+            remaining_time is None or remaining_time > 0
+        ):
+            cache_key = response_cache.key(request)
+            if cache_key is not None:
+                cached_response = response_cache.get(cache_key, request)
+                if cached_response is not None:
+                    future = asyncio.Future()
+                    future.set_result(cached_response)
+                    return future
+        flight_key = None
+        if singleflight is not None and (remaining_time is None or remaining_time > 0):
+            flight_key = singleflight.key(request)
+            if flight_key is not None:
+                # an identical request is in flight, its response is copied for this request
+                in_flight = singleflight.join(flight_key, request)
+                if in_flight is not None:
+                    return in_flight
+        batch_task = None
+        if (
+            request_batcher is not None
+            and graph.origin_nodes
+            and not request.header.target_executor
+            and (remaining_time is None or remaining_time > 0)
+        ):
+            batch_task = request_batcher.submit(request, _send_batch)
+        if remaining_time is not None and remaining_time <= 0:
+            # the request expired before it reached the gateway, it is answered without being sent to the Executors
+            request.add_exception(
+                DeadlineExceeded(
+                    f'request {request.header.request_id} expired {-remaining_time:.3f}s ago'
+                )
+            )
+        elif batch_task is not None:
+            # the request is sent coalesced with the requests of other clients, its future resolves to its part of the
+            # response
+            tasks_to_respond.append(batch_task)
         # If the request is targeting a specific deployment, we can send directly to the deployment instead of querying the graph
-        if request.header.target_executor:
+        elif request.header.target_executor:
             tasks_to_respond.extend(
                 connection_pool.send_request(
                     request=request,
@@ -42,28 +114,36 @@ def handle_request(
                 )
             )
         else:
-            for origin_node in request_graph.origin_nodes:
-                leaf_tasks = origin_node.get_leaf_tasks(
-                    connection_pool, request, None, endpoint=endpoint
-                )
-                # Every origin node returns a set of tasks that are the ones corresponding to the leafs of each of their
-                # subtrees that unwrap all the previous tasks. It starts like a chain of waiting for tasks from previous
-                # nodes
-                tasks_to_respond.extend([task for ret, task in leaf_tasks if ret])
-                tasks_to_ignore.extend([task for ret, task in leaf_tasks if not ret])
+            leaf_tasks = graph.get_leaf_tasks(
+                connection_pool, request, request_state, endpoint=endpoint
+            )
+            # The tasks of the leafs of the graph unwrap all the previous tasks. It starts like a chain of waiting for
+            # tasks from previous nodes
+            tasks_to_respond.extend([task for ret, task in leaf_tasks if ret])
+            tasks_to_ignore.extend([task for ret, task in leaf_tasks if not ret])
 
         async def _process_results_at_end_gateway(
-            tasks: List[asyncio.Task], request_graph: TopologyGraph
+            tasks: List[asyncio.Task], request_state: 'TopologyGraph.RequestState'
         ) -> asyncio.Future:
 
-            partial_responses = await asyncio.gather(*tasks)
+            try:
+                partial_responses = await asyncio.gather(*tasks)
+            except AioRpcError as ex:
+                if ex.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
+                    raise
+                # an expired request is answered with the error instead of failing the stream of the client
+                request.add_exception(DeadlineExceeded(ex.details()))
+                r.end_time.GetCurrentTime()
+                return request
             partial_responses, metadatas = zip(*partial_responses)
             filtered_partial_responses = list(
                 filter(lambda x: x is not None, partial_responses)
             )
 
             response = filtered_partial_responses[0]
-            request_graph.add_routes(response)
+            graph.add_routes(response, request_state)
+            if cache_key is not None:
+                response_cache.put(cache_key, request, response)
 
             return response
 
@@ -73,9 +153,14 @@ def handle_request(
             future = asyncio.Future()
             future.set_result((request, {}))
             tasks_to_respond.append(future)
-        return asyncio.ensure_future(
-            _process_results_at_end_gateway(tasks_to_respond, request_graph)
+        future = asyncio.ensure_future(
+            _process_results_at_end_gateway(tasks_to_respond, request_state)
         )
+        if flight_key is not None:
+            singleflight.lead(flight_key, future, request)
+            # the client of this request may go away, the requests which joined it still wait for the response
+            return asyncio.shield(future)
+        return future
 
     return _handle_request
 
@@ -0,0 +1,215 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from jina.proto import jina_pb2
+
+if TYPE_CHECKING:
+    from jina.types.request.data import DataRequest
+
+
+def _get_docs_proto(request: 'DataRequest'):
+    data = request.proto.data
+    if data.WhichOneof('documents') in (None, 'docs'):
+        return data.docs
+    return request.docs.to_protobuf()
+
+
+def get_request_key(request: 'DataRequest') -> Hashable:
+    """
+    Get a key which is equal for requests with the same endpoint, target executor, parameters and docs. The ids of the
+    docs are not part of the key, so equal queries of different clients have the same key
+
+    :param request: the request
+    :return: the key
+    """
+    header = request.header
+    data = jina_pb2.DataRequestProto.DataContentProto()
+    data.docs.CopyFrom(_get_docs_proto(request))
+    for doc in data.docs.docs:
+        doc.ClearField('id')
+    for field, column in request.proto.data.columns.items():
+        data.columns[field].CopyFrom(column)
+    return (
+        header.exec_endpoint,
+        header.target_executor,
+        # deterministic serialization orders the keys of the Struct, so equal parameters are equal bytes
+        request.proto.parameters.SerializeToString(deterministic=True),
+        hashlib.blake2b(
+            data.SerializeToString(deterministic=True), digest_size=16
+        ).digest(),
+    )
+
+
+def get_doc_ids(request: 'DataRequest') -> List[str]:
+    """
+    Get the ids of the docs of a request without converting them to a DocumentArray
+
+    :param request: the request
+    :return: the ids
+    """
+    return [doc.id for doc in _get_docs_proto(request).docs]
+
+
+def replace_doc_ids(
+    response: 'DataRequest', doc_ids: Sequence[str], new_doc_ids: Sequence[str]
+):
+    """
+    Replace the ids of the docs of a response to a request with the ids of the docs of an equal request
+
+    :param response: the response
+    :param doc_ids: the ids of the docs of the request the response answers
+    :param new_doc_ids: the ids of the docs of the equal request, in the same order
+    """
+    new_ids = {
+        doc_id: new_doc_id
+        for doc_id, new_doc_id in zip(doc_ids, new_doc_ids)
+        if doc_id != new_doc_id
+    }
+    if not new_ids:
+        return
+    docs = response.docs
+    for doc in docs:
+        if doc.id in new_ids:
+            doc.id = new_ids[doc.id]
+    response.data.docs = docs
+
+
+class ResponseCachePolicy:
+    """
+    Defines which responses the gateway caches and for how long. Responses are cached per endpoint, target executor,
+    parameters and docs of the request, the least recently used ones are evicted once the cache is full
+
+    :param endpoints: the endpoints whose responses are cached, they must not change the state of the Executors
+    :param max_entries: the maximal number of cached responses
+    :param max_bytes: the maximal serialized size of all cached responses
+    :param ttl: the seconds a response stays cached, None keeps it until it is evicted
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str] = ('/search',),
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = 60.0,
+    ):
+        if max_entries < 1:
+            raise ValueError(f'max_entries must be at least 1, got {max_entries}')
+        if max_bytes < 1:
+            raise ValueError(f'max_bytes must be at least 1, got {max_bytes}')
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f'ttl must be positive, got {ttl}')
+        self.endpoints = frozenset(endpoints)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+
+class ResponseCache:
+    """
+    A LRU cache of the serialized responses the gateway returned for requests to idempotent endpoints. A cached
+    response is returned with the header, routes and doc ids of the new request, it does not claim to have passed the
+    Executors
+
+    :param policy: the policy of the cache
+    """
+
+    def __init__(self, policy: Optional[ResponseCachePolicy] = None):
+        self._policy = policy or ResponseCachePolicy()
+        # maps the key of a request to the time its response expires, the serialized response and the ids of the docs
+        # of the request
+        self._entries: 'OrderedDict[Hashable, Tuple[float, bytes, List[str]]]' = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def key(self, request: 'DataRequest') -> Optional[Hashable]:
+        """
+        Get the key the response of the request is cached with, see :func:`get_request_key`
+
+        :param request: the request
+        :return: the key, None if the endpoint of the request is not cached
+        """
+        if request.header.exec_endpoint not in self._policy.endpoints:
+            return None
+        return get_request_key(request)
+
+    def get(self, key: Hashable, request: 'DataRequest') -> Optional['DataRequest']:
+        """
+        Get the cached response for the request
+
+        :param key: the key of the request, see :meth:`key`
+        :param request: the request, its header, routes and doc ids are set in the response
+        :return: the response, None if it is not cached or expired
+        """
+        from jina.types.request.data import DataRequest
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        response = DataRequest(entry[1])
+        response.header.request_id = request.header.request_id
+        # the Executors were not passed by this request, only the route of the gateway is kept
+        del response.routes[:]
+        response.routes.extend(request.routes)
+        replace_doc_ids(response, entry[2], get_doc_ids(request))
+        return response
+
+    def put(self, key: Hashable, request: 'DataRequest', response: 'DataRequest'):
+        """
+        Cache the response of a request, unless it failed or is larger than the cache
+
+        :param key: the key of the request, see :meth:`key`
+        :param request: the request
+        :param response: the response
+        """
+        if response.header.status.code != jina_pb2.StatusProto.SUCCESS:
+            return
+        value = response.to_bytes()
+        if len(value) > self._policy.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        ttl = self._policy.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float('inf')
+        self._entries[key] = (expires_at, value, get_doc_ids(request))
+        self._nbytes += len(value)
+        while (
+            len(self._entries) > self._policy.max_entries
+            or self._nbytes > self._policy.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        _, value, _ = self._entries.pop(key)
+        self._nbytes -= len(value)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        The hits and misses of the cache, the responses evicted because the cache was full or because they expired,
+        and the number and serialized size of the cached responses
+
+        :return: maps `hits`, `misses`, `evictions`, `expirations`, `entries` and `bytes` to their values
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+            'bytes': self._nbytes,
+        }
@@ -0,0 +1,116 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from jina.proto import jina_pb2
+from jina.serve.runtimes.gateway.response_cache import (
+    get_doc_ids,
+    get_request_key,
+    replace_doc_ids,
+)
+
+if TYPE_CHECKING:
+    from jina.types.request.data import DataRequest
+
+
+class Singleflight:
+    """
+    Collapses identical requests which arrive while the first of them is in flight. Requests with the same endpoint,
+    target executor, parameters and docs wait for the response of the first one and get a copy of it with their own
+    request id, gateway route and doc ids
+
+    :param endpoints: the endpoints whose identical requests are collapsed, they must not change the state of the
+        Executors
+    """
+
+    def __init__(self, endpoints: Sequence[str]):
+        self._endpoints = frozenset(endpoints)
+        # maps the key of every request in flight to the ids of its docs and the requests and futures of the requests
+        # waiting for it
+        self._in_flight: Dict[
+            Hashable, Tuple[List[str], List[Tuple['DataRequest', asyncio.Future]]]
+        ] = {}
+        self.collapsed = 0
+
+    def key(self, request: 'DataRequest') -> Optional[Hashable]:
+        """
+        Get the key identical requests are collapsed by
+
+        :param request: the request
+        :return: the key, None if the endpoint of the request is not collapsed
+        """
+        if request.header.exec_endpoint not in self._endpoints:
+            return None
+        return get_request_key(request)
+
+    def join(self, key: Hashable, request: 'DataRequest') -> Optional[asyncio.Future]:
+        """
+        Let the request wait for an identical request in flight
+
+        :param key: the key of the request, see :meth:`key`
+        :param request: the request
+        :return: a future of the response for the request, None if no identical request is in flight
+        """
+        if key not in self._in_flight:
+            return None
+        _, waiting = self._in_flight[key]
+        future = asyncio.get_event_loop().create_future()
+        waiting.append((request, future))
+        self.collapsed += 1
+        return future
+
+    def lead(self, key: Hashable, future: asyncio.Future, request: 'DataRequest'):
+        """
+        Register the future of the response of a request in flight, the requests joining it until it is done get a
+        copy of its response. The future must not be cancelled when the client of the request goes away, see
+        :func:`asyncio.shield`
+
+        :param key: the key of the request, see :meth:`key`
+        :param future: the future of the response
+        :param request: the request
+        """
+        self._in_flight[key] = (get_doc_ids(request), [])
+        future.add_done_callback(lambda f: self._land(key, f))
+
+    def _land(self, key: Hashable, future: asyncio.Future):
+        from jina.types.request.data import DataRequest
+
+        doc_ids, waiting = self._in_flight.pop(key)
+        if not waiting:
+            return
+        if future.cancelled() or future.exception() is not None:
+            # the leading request is shielded from its client, it is only cancelled if the gateway shuts down
+            for _, waiting_future in waiting:
+                if waiting_future.done():
+                    continue
+                if future.cancelled():
+                    waiting_future.cancel()
+                else:
+                    waiting_future.set_exception(future.exception())
+            return
+        response = future.result()
+        value = response.to_bytes()
+        for request, waiting_future in waiting:
+            if waiting_future.done():
+                continue
+            copy = DataRequest(value)
+            copy.header.request_id = request.header.request_id
+            # the request waited for the Executors, but it arrived at the gateway on its own
+            routes = list(request.routes)
+            for route in copy.routes:
+                if route.executor != 'gateway':
+                    routes.append(jina_pb2.RouteProto())
+                    routes[-1].CopyFrom(route)
+            del copy.routes[:]
+            copy.routes.extend(routes)
+            replace_doc_ids(copy, doc_ids, get_doc_ids(request))
+            waiting_future.set_result(copy)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        The number of requests which were collapsed into an identical request and of the requests in flight which can
+        be joined
+
+        :return: maps `collapsed` and `in_flight` to their values
+        """
+        return {'collapsed': self.collapsed, 'in_flight': len(self._in_flight)}
@@ -53,6 +53,9 @@ class WebSocketGatewayRuntime(GatewayRuntime):
         uvicorn_kwargs = self.args.uvicorn_kwargs or {}
         self._set_topology_graph()
         self._set_connection_pool()
+        self._set_response_cache()
+        self._set_request_batcher()
+        self._set_singleflight()
         self._server = UviServer(
             config=Config(
                 app=extend_rest_interface(
@@ -61,6 +64,9 @@ class WebSocketGatewayRuntime(GatewayRuntime):
                         topology_graph=self._topology_graph,
                         connection_pool=self._connection_pool,
                         logger=self.logger,
+                        response_cache=self._response_cache,
+                        request_batcher=self._request_batcher,
+                        singleflight=self._singleflight,
                     )
                 ),
                 host=__default_host__,
@@ -1,5 +1,5 @@
 import argparse
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from jina.importer import ImportExtensions
 from jina.logging.logger import JinaLogger
@@ -8,6 +8,9 @@ from jina.types.request.data import DataRequest
 if TYPE_CHECKING:
     from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
     from jina.serve.networking import GrpcConnectionPool
+    from jina.serve.runtimes.gateway.batching import RequestBatcher
+    from jina.serve.runtimes.gateway.response_cache import ResponseCache
+    from jina.serve.runtimes.gateway.singleflight import Singleflight
 
 
 def get_fastapi_app(
@@ -15,6 +18,9 @@ def get_fastapi_app(
     topology_graph: 'TopologyGraph',
     connection_pool: 'GrpcConnectionPool',
     logger: 'JinaLogger',
+    response_cache: Optional['ResponseCache'] = None,
+    request_batcher: Optional['RequestBatcher'] = None,
+    singleflight: Optional['Singleflight'] = None,
 ):
     """
     Get the app from FastAPI as the Websocket interface.
@@ -23,6 +29,9 @@ def get_fastapi_app(
     :param topology_graph: topology graph that manages the logic of sending to the proper executors.
     :param connection_pool: Connection Pool to handle multiple replicas and sending to different of them
     :param logger: Jina logger.
+    :param response_cache: Optional cache of the responses to requests to idempotent endpoints
+    :param request_batcher: Optional batcher which coalesces the requests of different clients
+    :param singleflight: Optional collapsing of identical requests which arrive while the first of them is in flight
     :return: fastapi app
     """
 
@@ -56,7 +65,11 @@ def get_fastapi_app(
     streamer = RequestStreamer(
         args=args,
         request_handler=handle_request(
-            graph=topology_graph, connection_pool=connection_pool
+            graph=topology_graph,
+            connection_pool=connection_pool,
+            response_cache=response_cache,
+            request_batcher=request_batcher,
+            singleflight=singleflight,
         ),
         result_handler=handle_result,
     )
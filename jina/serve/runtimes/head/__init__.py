@@ -9,10 +9,18 @@ from collections import defaultdict
 from typing import Optional, Union, List, Tuple, Dict
 
 import grpc
+from grpc.aio import AioRpcError
 
-from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
+from jina.excepts import DeadlineExceeded
+from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime, DataRequestStreamMixin
 from jina.serve.runtimes.request_handlers.data_request_handler import DataRequestHandler
-from jina.serve.networking import create_connection_pool, K8sGrpcConnectionPool
+from jina.serve.consistent_hash import ConsistentHashRing, split_requests_by_shard
+from jina.serve.networking import (
+    create_connection_pool,
+    K8sGrpcConnectionPool,
+    ConcurrencyLimitPolicy,
+    RetryPolicy,
+)
 from jina.enums import PollingType
 from jina.proto import jina_pb2_grpc
 from jina.types.request.control import ControlRequest
@@ -20,7 +28,7 @@ from jina.types.request.data import DataRequest
 from jina import __default_executor__
 
 
-class HeadRuntime(AsyncNewLoopRuntime, ABC):
+class HeadRuntime(AsyncNewLoopRuntime, DataRequestStreamMixin, ABC):
     """
     Runtime is used in head pods. It responds to Gateway requests and sends to uses_before/uses_after and its workers
     """
@@ -50,6 +58,21 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             logger=self.logger,
             k8s_connection_pool=args.k8s_connection_pool,
             k8s_namespace=args.k8s_namespace,
+            load_balancing=args.load_balancing,
+            hedging=json.loads(args.hedging) if args.hedging else None,
+            retry_policy=RetryPolicy(**json.loads(args.retry_policy))
+            if args.retry_policy
+            else None,
+            data_streaming=args.data_streaming,
+            uds=not args.disable_uds,
+            shared_memory=args.shared_memory,
+            compression=args.compression,
+            compression_min_bytes=args.compression_min_bytes,
+            concurrency_limit=ConcurrencyLimitPolicy(
+                **json.loads(args.concurrency_limit)
+            )
+            if args.concurrency_limit
+            else None,
         )
 
         polling = getattr(args, 'polling', self.DEFAULT_POLLING.name)
@@ -118,8 +141,13 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
                 deployment='uses_after', address=self.uses_after_address
             )
         self._has_uses = args.uses is not None and args.uses != __default_executor__
+        self._hash_key = getattr(args, 'hash_key', None)
+        self._hash_ring = None
 
     def _default_polling_dict(self, default_polling):
+        if default_polling == PollingType.HASH:
+            # hashed docs are indexed, updated and deleted on their own shard, but searches need all shards
+            return defaultdict(lambda: default_polling, {'/search': PollingType.ALL})
         return defaultdict(
             lambda: default_polling,
             {'/search': PollingType.ALL, '/index': PollingType.ANY},
@@ -138,12 +166,16 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             self, self._grpc_server
         )
         jina_pb2_grpc.add_JinaDataRequestRPCServicer_to_server(self, self._grpc_server)
+        jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+            self, self._grpc_server
+        )
         jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
             self, self._grpc_server
         )
         bind_addr = f'0.0.0.0:{self.args.port_in}'
         self._grpc_server.add_insecure_port(bind_addr)
         self.logger.debug(f'Start listening on {bind_addr}')
+        self._add_uds_port(self._grpc_server)
         await self._grpc_server.start()
 
     async def async_run_forever(self):
@@ -160,6 +192,7 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
     async def async_teardown(self):
         """Close the connection pool"""
         await self.async_cancel()
+        self._remove_uds()
         await self.connection_pool.close()
 
     async def process_single_data(self, request: DataRequest, context) -> DataRequest:
@@ -181,11 +214,23 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
         :returns: the response request
         """
         try:
+            DataRequestHandler.check_deadline(requests)
             endpoint = dict(context.invocation_metadata()).get('endpoint')
             response, metadata = await self._handle_data_request(requests, endpoint)
             context.set_trailing_metadata(metadata.items())
+            self._set_response_compression(context, response)
             return response
+        except DeadlineExceeded as ex:
+            return self._drop_expired_request(requests[0], ex, context)
         except (RuntimeError, Exception) as ex:
+            if (
+                isinstance(ex, AioRpcError)
+                and ex.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+            ):
+                # the deadline of the request passed while a Deployment processed it
+                return self._drop_expired_request(
+                    requests[0], DeadlineExceeded(ex.details()), context
+                )
             self.logger.error(
                 f'{ex!r}' + f'\n add "--quiet-error" to suppress the exception details'
                 if not self.args.quiet_error
@@ -236,6 +281,14 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
             )
             raise
 
+    def _drop_expired_request(
+        self, request: DataRequest, ex: DeadlineExceeded, context
+    ) -> DataRequest:
+        self.logger.debug(f'drop request: {ex!r}')
+        request.add_exception(ex)
+        context.set_trailing_metadata((('is-error', 'true'),))
+        return request
+
     async def _handle_data_request(
         self, requests: List[DataRequest], endpoint: Optional[str]
     ) -> Tuple[DataRequest, Dict]:
@@ -255,11 +308,16 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
         elif len(requests) > 1 and not self._has_uses:
             requests = [DataRequestHandler.reduce_requests(requests)]
 
-        worker_send_tasks = self.connection_pool.send_requests(
-            requests=requests,
-            deployment=self._deployment_name,
-            polling_type=self._polling[endpoint],
-        )
+        polling_type = self._polling[endpoint]
+        if polling_type == PollingType.HASH:
+            worker_send_tasks = self._send_requests_by_hash(requests, endpoint)
+        else:
+            worker_send_tasks = self.connection_pool.send_requests(
+                requests=requests,
+                deployment=self._deployment_name,
+                polling_type=polling_type,
+                endpoint=endpoint,
+            )
 
         worker_results = await asyncio.gather(*worker_send_tasks)
 
@@ -288,6 +346,46 @@ class HeadRuntime(AsyncNewLoopRuntime, ABC):
 
         return response_request, merged_metadata
 
+    def _send_requests_by_hash(
+        self, requests: List[DataRequest], endpoint: Optional[str]
+    ) -> List[asyncio.Task]:
+        if not any(len(request.docs) for request in requests):
+            # without docs there is nothing to route by, every shard gets the requests
+            return self.connection_pool.send_requests(
+                requests=requests,
+                deployment=self._deployment_name,
+                polling_type=PollingType.ALL,
+                endpoint=endpoint,
+            )
+        if self._hash_ring is None:
+            # the ring holds all configured shards, a doc must not move to another shard while its own is unreachable
+            self._hash_ring = ConsistentHashRing(range(self.args.shards))
+
+        shard_requests = split_requests_by_shard(
+            requests, self._hash_ring, self._hash_key
+        )
+        unreachable_shard_ids = set(shard_requests).difference(
+            self.connection_pool.get_shard_ids(self._deployment_name)
+        )
+        if unreachable_shard_ids:
+            raise RuntimeError(
+                f'Head {self.name} has no connection to the shards {sorted(unreachable_shard_ids)} owning docs of '
+                f'the request'
+            )
+
+        worker_send_tasks = []
+        for shard_id, requests_of_shard in shard_requests.items():
+            worker_send_tasks.extend(
+                self.connection_pool.send_requests(
+                    requests=requests_of_shard,
+                    deployment=self._deployment_name,
+                    shard_id=shard_id,
+                    polling_type=PollingType.ANY,
+                    endpoint=endpoint,
+                )
+            )
+        return worker_send_tasks
+
     def _merge_metadata(self, metadata, uses_after_metadata, uses_before_metadata):
         merged_metadata = {}
         if uses_before_metadata:
@@ -3,7 +3,7 @@ from typing import Dict, List, TYPE_CHECKING, Optional
 from docarray import DocumentArray
 
 from jina import __default_endpoint__
-from jina.excepts import ExecutorFailToLoad, BadConfigSource
+from jina.excepts import ExecutorFailToLoad, BadConfigSource, DeadlineExceeded
 from jina.serve.executors import BaseExecutor
 from jina.types.request.data import DataRequest
 
@@ -84,6 +84,9 @@ class DataRequestHandler:
             )
             return requests[0]
 
+        # the client gave up on expired requests, do not spend executor time on them
+        DataRequestHandler.check_deadline(requests)
+
         params = self._parse_params(requests[0].parameters, self._executor.metas.name)
         docs = DataRequestHandler.get_docs_from_request(
             requests,
@@ -124,6 +127,19 @@ class DataRequestHandler:
 
         return requests[0]
 
+    @staticmethod
+    def check_deadline(requests: List['DataRequest']) -> None:
+        """Raises if the deadline of any of the requests passed.
+
+        :param requests: the requests
+        """
+        for request in requests:
+            remaining_time = request.remaining_time
+            if remaining_time is not None and remaining_time <= 0:
+                raise DeadlineExceeded(
+                    f'request {request.header.request_id} expired {-remaining_time:.3f}s ago'
+                )
+
     @staticmethod
     def replace_docs(request: List['DataRequest'], docs: 'DocumentArray') -> None:
         """Replaces the docs in a message with new Documents.
@@ -131,7 +147,11 @@ class DataRequestHandler:
         :param request: The request object
         :param docs: the new docs to be used
         """
-        request.data.docs = docs
+        if request.header.HasField('docs_codec'):
+            # the docs are returned compressed like they were received
+            request.data.set_compressed_docs(docs, request.header.docs_codec)
+        else:
+            request.data.docs = docs
 
     @staticmethod
     def replace_parameters(request: List['DataRequest'], parameters: Dict) -> None:
@@ -7,14 +7,15 @@ from typing import Optional, Union, List
 
 import grpc
 
-from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
+from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime, DataRequestStreamMixin
 from jina.serve.runtimes.request_handlers.data_request_handler import DataRequestHandler
+from jina.excepts import DeadlineExceeded
 from jina.proto import jina_pb2_grpc
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest
 
 
-class WorkerRuntime(AsyncNewLoopRuntime, ABC):
+class WorkerRuntime(AsyncNewLoopRuntime, DataRequestStreamMixin, ABC):
     """Runtime procedure leveraging :class:`Grpclet` for sending DataRequests"""
 
     def __init__(
@@ -50,12 +51,16 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
             self, self._grpc_server
         )
         jina_pb2_grpc.add_JinaDataRequestRPCServicer_to_server(self, self._grpc_server)
+        jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+            self, self._grpc_server
+        )
         jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
             self, self._grpc_server
         )
         bind_addr = f'0.0.0.0:{self.args.port_in}'
         self.logger.debug(f'Start listening on {bind_addr}')
         self._grpc_server.add_insecure_port(bind_addr)
+        self._add_uds_port(self._grpc_server)
         await self._grpc_server.start()
 
     async def async_run_forever(self):
@@ -74,6 +79,7 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
     async def async_teardown(self):
         """Close the data request handler"""
         await self.async_cancel()
+        self._remove_uds()
         self._data_request_handler.close()
 
     async def process_single_data(self, request: DataRequest, context) -> DataRequest:
@@ -98,7 +104,14 @@ class WorkerRuntime(AsyncNewLoopRuntime, ABC):
             if self.logger.debug_enabled:
                 self._log_data_request(requests[0])
 
-            return await self._data_request_handler.handle(requests=requests)
+            response = await self._data_request_handler.handle(requests=requests)
+            self._set_response_compression(context, response)
+            return response
+        except DeadlineExceeded as ex:
+            self.logger.debug(f'drop request: {ex!r}')
+            requests[0].add_exception(ex, self._data_request_handler._executor)
+            context.set_trailing_metadata((('is-error', 'true'),))
+            return requests[0]
         except (RuntimeError, Exception) as ex:
             self.logger.error(
                 f'{ex!r}' + f'\n add "--quiet-error" to suppress the exception details'
@@ -0,0 +1,248 @@
+import mmap
+import os
+import uuid
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from jina.proto import jina_pb2
+from jina.types.request.data import DataRequest, _load_columns
+
+if TYPE_CHECKING:
+    from docarray import DocumentArray
+
+SHARED_MEMORY_DIR = '/dev/shm'
+SEGMENT_PREFIX = 'jina-shm-'
+# the tag of the `docs_shm` field of DataContentProto, field number 3 of wire type length delimited
+_DOCS_SHM_TAG = bytes([3 << 3 | 2])
+
+
+def is_shared_memory_supported() -> bool:
+    """
+    Checks if POSIX shared memory segments can be created as files, which is the case on Linux
+
+    :return: True if shared memory is supported
+    """
+    return os.path.isdir(SHARED_MEMORY_DIR)
+
+
+def _segment_path(name: str) -> str:
+    return os.path.join(SHARED_MEMORY_DIR, name)
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists but belongs to another user
+        return True
+    return True
+
+
+def cleanup_stale_segments():
+    """
+    Removes the segments left behind by crashed processes. The name of every segment contains the pid of its owner
+    """
+    if not is_shared_memory_supported():
+        return
+    for name in os.listdir(SHARED_MEMORY_DIR):
+        if not name.startswith(SEGMENT_PREFIX):
+            continue
+        try:
+            pid = int(name[len(SEGMENT_PREFIX) :].split('-')[0])
+        except ValueError:
+            continue
+        if not _is_process_alive(pid):
+            try:
+                os.unlink(_segment_path(name))
+            except OSError:
+                pass
+
+
+def load_docs_from_shared_memory(
+    docs_shm: 'jina_pb2.SharedMemoryProto', docs_codec: Optional[str] = None
+) -> 'DocumentArray':
+    """
+    Maps a segment read-only and materializes the docs it holds
+
+    :param docs_shm: the reference to the segment
+    :param docs_codec: the algorithm the `docs_bytes` in the segment are compressed with
+    :return: the docs
+    """
+    from docarray import DocumentArray
+    from docarray.proto.docarray_pb2 import DocumentArrayProto
+
+    fd = os.open(_segment_path(docs_shm.name), os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, docs_shm.size, access=mmap.ACCESS_READ) as m:
+            with memoryview(m) as payload:
+                if docs_shm.with_columns:
+                    content = jina_pb2.DataRequestProto.DataContentProto()
+                    content.ParseFromString(payload)
+                    docs = DocumentArray.from_protobuf(content.docs)
+                    _load_columns(docs, content.columns)
+                    return docs
+                if docs_shm.is_proto:
+                    docs_proto = DocumentArrayProto()
+                    docs_proto.ParseFromString(payload)
+                    return DocumentArray.from_protobuf(docs_proto)
+                if docs_codec:
+                    from jina.serve.compression import decompress_bytes
+
+                    return DocumentArray.from_bytes(
+                        decompress_bytes(bytes(payload), docs_codec)
+                    )
+                return DocumentArray.from_bytes(bytes(payload))
+    finally:
+        os.close(fd)
+
+
+def inline_shared_memory_docs(request: DataRequest) -> DataRequest:
+    """
+    Returns a request which holds its docs itself instead of referencing a segment, to be sent to another host
+
+    :param request: the request
+    :return: the request itself if it does not reference a segment, otherwise a new request with the docs inlined
+    """
+    if not _references_shared_memory(request):
+        return request
+    proto = request.proto
+    docs_shm = proto.data.docs_shm
+    inlined = DataRequest(_copy_without_docs(proto))
+    if docs_shm.is_proto:
+        inlined.data.docs = load_docs_from_shared_memory(docs_shm)
+    else:
+        # `docs_bytes` are inlined as they are, compressed ones stay compressed
+        fd = os.open(_segment_path(docs_shm.name), os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, docs_shm.size, access=mmap.ACCESS_READ) as m:
+                inlined.proto.data.docs_bytes = m[:]
+        finally:
+            os.close(fd)
+    return inlined
+
+
+def _references_shared_memory(request: DataRequest) -> bool:
+    if request.is_decompressed:
+        return request.proto.data.WhichOneof('documents') == 'docs_shm'
+    # the data holds a single field of the `documents` oneof, its tag is the first byte. Checking it does not parse
+    # the docs of a request which is only forwarded
+    return request.proto_wo_data.data[:1] == _DOCS_SHM_TAG
+
+
+def _copy_without_docs(
+    proto: 'jina_pb2.DataRequestProto',
+) -> 'jina_pb2.DataRequestProto':
+    # copies everything but the docs, which are the bulk of the request
+    copy = jina_pb2.DataRequestProto()
+    for field, value in proto.ListFields():
+        if field.name == 'data':
+            continue
+        if field.label == field.LABEL_REPEATED:
+            getattr(copy, field.name).extend(value)
+        else:
+            getattr(copy, field.name).CopyFrom(value)
+    return copy
+
+
+class SharedMemorySegments:
+    """
+    Moves the docs of outgoing DataRequests into shared memory segments and keeps track of them.
+    A request sent several times, like to all shards or as a retry, shares one segment,
+    which is removed once no send of the request is in flight anymore.
+
+    :param min_payload_size: docs smaller than this number of bytes are sent inline
+    """
+
+    MIN_PAYLOAD_SIZE = 64 * 1024
+
+    def __init__(self, min_payload_size: int = MIN_PAYLOAD_SIZE):
+        self._min_payload_size = min_payload_size
+        # maps the id of a request to [request, the request sent instead, segment name, reference count]
+        self._segments: Dict[int, List] = {}
+        cleanup_stale_segments()
+
+    def acquire(self, request: DataRequest) -> DataRequest:
+        """
+        Moves the docs of the request into a segment, unless they are small or already in a segment.
+        Every call has to be matched by a call to :meth:`release` once the response was received
+
+        :param request: the request to send
+        :return: the request to send instead, referencing the segment
+        """
+        key = id(request)
+        if key in self._segments:
+            entry = self._segments[key]
+            entry[3] += 1
+            return entry[1]
+
+        proto = request.proto
+        documents = proto.data.WhichOneof('documents')
+        with_columns = documents == 'docs' and len(proto.data.columns) > 0
+        if with_columns:
+            # the tensor columns are the bulk of the request, they are moved along with the docs
+            payload = proto.data.SerializeToString()
+        elif documents == 'docs':
+            payload = proto.data.docs.SerializeToString()
+        elif documents == 'docs_bytes':
+            payload = proto.data.docs_bytes
+        else:
+            return request
+        if len(payload) < self._min_payload_size:
+            return request
+
+        name = f'{SEGMENT_PREFIX}{os.getpid()}-{uuid.uuid4().hex}'
+        self._write_segment(name, payload)
+        shm_proto = _copy_without_docs(proto)
+        shm_proto.data.docs_shm.name = name
+        shm_proto.data.docs_shm.size = len(payload)
+        shm_proto.data.docs_shm.is_proto = documents == 'docs'
+        shm_proto.data.docs_shm.with_columns = with_columns
+        shm_request = DataRequest(shm_proto)
+        self._segments[key] = [request, shm_request, name, 1]
+        return shm_request
+
+    def release(self, request: DataRequest):
+        """
+        Releases the segment of the request acquired for one send
+
+        :param request: the request given to :meth:`acquire`
+        """
+        key = id(request)
+        entry = self._segments.get(key)
+        if entry is None:
+            return
+        entry[3] -= 1
+        if entry[3] <= 0:
+            del self._segments[key]
+            self._unlink_segment(entry[2])
+
+    def close(self):
+        """
+        Removes all segments
+        """
+        for entry in self._segments.values():
+            self._unlink_segment(entry[2])
+        self._segments.clear()
+        cleanup_stale_segments()
+
+    @staticmethod
+    def _write_segment(name: str, payload: bytes):
+        fd = os.open(_segment_path(name), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        try:
+            with memoryview(payload) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+        except BaseException:
+            os.unlink(_segment_path(name))
+            raise
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _unlink_segment(name: str):
+        try:
+            os.unlink(_segment_path(name))
+        except FileNotFoundError:
+            pass
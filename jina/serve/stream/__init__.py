@@ -1,6 +1,10 @@
 import asyncio
 import argparse
+import itertools
+import json
+import time
 from typing import (
+    Dict,
     List,
     Union,
     Iterator,
@@ -11,10 +15,17 @@ from typing import (
     Awaitable,
 )
 
-from jina.serve.stream.helper import AsyncRequestsIterator
+from jina.serve.stream.helper import (
+    AsyncRequestsIterator,
+    PrefetchWindowPolicy,
+    _PrefetchWindow,
+)
 from jina.logging.logger import JinaLogger
 
-__all__ = ['RequestStreamer']
+__all__ = ['RequestStreamer', 'PrefetchWindowPolicy', 'RESULTS_IN_ORDER_METADATA']
+
+# the gRPC metadata key with which a client asks for the responses in the order of its requests
+RESULTS_IN_ORDER_METADATA = 'jina-results-in-order'
 
 if TYPE_CHECKING:
     from jina.types.request import Request
@@ -31,6 +42,10 @@ class RequestStreamer:
     class _RequestsCounter:
         count = 0
 
+    # the maximal number of requests sent but not yet yielded in `results_in_order` mode, which bounds the responses
+    # buffered until the responses of earlier requests arrive
+    REORDER_BUFFER_SIZE = 100
+
     def __init__(
         self,
         args: argparse.Namespace,
@@ -49,38 +64,110 @@ class RequestStreamer:
         self.args = args
         self.logger = logger or JinaLogger(self.__class__.__name__, **vars(args))
         self._prefetch = getattr(self.args, 'prefetch', 0)
+        prefetch_window = getattr(self.args, 'prefetch_window', None)
+        self._prefetch_window_policy = (
+            PrefetchWindowPolicy(**json.loads(prefetch_window))
+            if prefetch_window
+            else None
+        )
+        # the windows of the streams currently served and the number of their responses waiting to be yielded
+        self._windows: Dict[_PrefetchWindow, Callable[[], int]] = {}
         self._request_handler = request_handler
         self._result_handler = result_handler
         self._end_of_iter_handler = end_of_iter_handler
 
-    async def stream(self, request_iterator, *args) -> AsyncIterator['Request']:
+    async def stream(
+        self,
+        request_iterator,
+        context=None,
+        results_in_order: bool = False,
+        *args,
+    ) -> AsyncIterator['Request']:
         """
         stream requests from client iterator and stream responses back.
 
         :param request_iterator: iterator of requests
+        :param context: the gRPC context of the call, if the stream is served over gRPC
+        :param results_in_order: if set, the responses are yielded in the order of the requests. At most
+            `REORDER_BUFFER_SIZE` requests, or `prefetch` if it is smaller, are in flight or buffered, once reached no
+            more requests are fetched until the oldest response was yielded
         :param args: positional arguments
         :yield: responses from Executors
         """
-        async_iter: AsyncIterator = (
-            self._stream_requests_with_prefetch(request_iterator, self._prefetch)
-            if self._prefetch > 0
-            else self._stream_requests(request_iterator)
+        if context is not None and not results_in_order:
+            results_in_order = any(
+                key == RESULTS_IN_ORDER_METADATA and value == 'true'
+                for key, value in (context.invocation_metadata() or ())
+            )
+        window = (
+            _PrefetchWindow(self._prefetch_window_policy)
+            if self._prefetch_window_policy is not None
+            else None
         )
+        if results_in_order:
+            reorder_buffer_size = (
+                min(self._prefetch, self.REORDER_BUFFER_SIZE)
+                if self._prefetch > 0
+                else self.REORDER_BUFFER_SIZE
+            )
+            async_iter: AsyncIterator = self._stream_requests(
+                request_iterator, window, reorder_buffer_size
+            )
+        elif window is not None:
+            async_iter = self._stream_requests(request_iterator, window)
+        elif self._prefetch > 0:
+            async_iter = self._stream_requests_with_prefetch(
+                request_iterator, self._prefetch
+            )
+        else:
+            async_iter = self._stream_requests(request_iterator)
 
         async for response in async_iter:
             yield response
 
+    @property
+    def prefetch_windows(self) -> List[Dict[str, int]]:
+        """
+        The window size, the requests and bytes in flight and the responses waiting to be handed back of every client
+        stream currently served, empty if `prefetch_window` is not set
+
+        :return: the `window`, `in_flight`, `bytes_in_flight` and `queue_depth` of every stream
+        """
+        return [
+            {
+                'window': window.size,
+                'in_flight': window.in_flight,
+                'bytes_in_flight': window.bytes_in_flight,
+                'queue_depth': queue_depth(),
+            }
+            for window, queue_depth in self._windows.items()
+        ]
+
     async def _stream_requests(
-        self, request_iterator: Union[Iterator, AsyncIterator]
+        self,
+        request_iterator: Union[Iterator, AsyncIterator],
+        window: Optional[_PrefetchWindow] = None,
+        reorder_buffer_size: Optional[int] = None,
     ) -> AsyncIterator:
-        """Implements request and response handling without prefetching
+        """Implements request and response handling without prefetching or with an adaptive window
         :param request_iterator: requests iterator from Client
+        :param window: the window bounding the requests in flight, unbounded if None
+        :param reorder_buffer_size: if set, responses are yielded in the order of the requests and at most this many
+            requests are in flight or buffered
         :yield: responses
         """
         result_queue = asyncio.Queue()
+        # the size of every request in flight, released once its response was handed back
+        request_sizes: Dict['asyncio.Future', int] = {}
         end_of_iter = asyncio.Event()
         all_requests_handled = asyncio.Event()
         requests_to_handle = self._RequestsCounter()
+        # in `results_in_order` mode, the index of every request in flight and the responses waiting for earlier ones
+        request_indices: Dict['asyncio.Future', int] = {}
+        reorder_buffer: Dict[int, 'asyncio.Future'] = {}
+        request_counter = itertools.count()
+        next_index = 0
+        request_yielded = asyncio.Event()
 
         def update_all_handled():
             if end_of_iter.is_set() and requests_to_handle.count == 0:
@@ -111,8 +198,26 @@ class RequestStreamer:
             5. Set `end_of_iter` event
             """
             async for request in AsyncRequestsIterator(iterator=request_iterator):
+                if reorder_buffer_size is not None:
+                    # backpressure, the buffer is not grown while an early response is missing
+                    while requests_to_handle.count >= reorder_buffer_size:
+                        request_yielded.clear()
+                        await request_yielded.wait()
+                if window is not None:
+                    nbytes = request.proto_wo_data.ByteSize()
+                    await window.acquire(nbytes)
+                    start = time.perf_counter()
                 requests_to_handle.count += 1
                 future: 'asyncio.Future' = self._request_handler(request=request)
+                if reorder_buffer_size is not None:
+                    request_indices[future] = next(request_counter)
+                if window is not None:
+                    request_sizes[future] = nbytes
+                    future.add_done_callback(
+                        lambda _, start=start: window.update_latency(
+                            time.perf_counter() - start
+                        )
+                    )
                 future.add_done_callback(callback)
             if self._end_of_iter_handler is not None:
                 self._end_of_iter_handler()
@@ -123,16 +228,33 @@ class RequestStreamer:
                 future_cancel = asyncio.ensure_future(end_future())
                 result_queue.put_nowait(future_cancel)
 
-        asyncio.create_task(iterate_requests())
-        while not all_requests_handled.is_set():
-            future = await result_queue.get()
-            try:
-                response = self._result_handler(future.result())
-                yield response
-                requests_to_handle.count -= 1
-                update_all_handled()
-            except self._EndOfStreaming:
-                pass
+        if window is not None:
+            self._windows[window] = lambda: result_queue.qsize() + len(reorder_buffer)
+        try:
+            asyncio.create_task(iterate_requests())
+            while not all_requests_handled.is_set():
+                future = await result_queue.get()
+                if future in request_indices:
+                    reorder_buffer[request_indices.pop(future)] = future
+                    ready = []
+                    while next_index in reorder_buffer:
+                        ready.append(reorder_buffer.pop(next_index))
+                        next_index += 1
+                else:
+                    ready = [future]
+                for future in ready:
+                    try:
+                        response = self._result_handler(future.result())
+                        yield response
+                        requests_to_handle.count -= 1
+                        if window is not None:
+                            window.release(request_sizes.pop(future))
+                        request_yielded.set()
+                        update_all_handled()
+                    except self._EndOfStreaming:
+                        pass
+        finally:
+            self._windows.pop(window, None)
 
     async def _stream_requests_with_prefetch(
         self, request_iterator: Union[Iterator, AsyncIterator], prefetch: int
@@ -144,6 +266,9 @@ class RequestStreamer:
         :yield: response
         """
 
+        # shared by all calls of `iterate_requests`, which continue where the previous one stopped
+        requests = AsyncRequestsIterator(iterator=request_iterator)
+
         async def iterate_requests(
             num_req: int, fetch_to: List[Union['asyncio.Task', 'asyncio.Future']]
         ):
@@ -156,7 +281,7 @@ class RequestStreamer:
             :return: False if append task to `fetch_to` else False
             """
             count = 0
-            async for request in AsyncRequestsIterator(iterator=request_iterator):
+            async for request in requests:
                 fetch_to.append(self._request_handler(request))
                 count += 1
                 if count == num_req:
@@ -1,30 +1,108 @@
-from typing import Iterator, AsyncIterator, Union
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Iterator, AsyncIterator, Optional, Union
 
 from jina.helper import get_or_reuse_loop
 
 
+class _IteratorProducer:
+    """
+    Drains a blocking iterator in a dedicated thread into a bounded buffer. The event loop is only woken up when it
+    waits for the next item, so items produced while the consumer is busy are handed over in chunks instead of one
+    thread hop per item
+
+    :param iterator: the blocking iterator
+    :param max_size: the maximal number of items fetched ahead
+    """
+
+    def __init__(self, iterator: Iterator, max_size: int):
+        self._iterator = iterator
+        self._max_size = max_size
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._waiter: Optional['asyncio.Future'] = None
+        self._loop = get_or_reuse_loop()
+        self._done = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._produce, name='AsyncRequestsIterator', daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self):
+        try:
+            for item in self._iterator:
+                with self._condition:
+                    while len(self._items) >= self._max_size and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                    self._items.append(item)
+                    self._wake_consumer()
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._wake_consumer()
+
+    def _wake_consumer(self):
+        # called with the condition held
+        if self._waiter is not None:
+            waiter, self._waiter = self._waiter, None
+            self._loop.call_soon_threadsafe(_set_result_if_pending, waiter)
+
+    async def get(self):
+        """
+        Returns the next item of the iterator
+
+        :return: the next item
+        """
+        while True:
+            with self._condition:
+                if self._items:
+                    item = self._items.popleft()
+                    self._condition.notify()
+                    return item
+                if self._done:
+                    if self._error is not None:
+                        raise self._error
+                    raise StopAsyncIteration
+                self._waiter = self._loop.create_future()
+                waiter = self._waiter
+            await waiter
+
+    def close(self):
+        """
+        Stops fetching items, the thread ends once the item it is fetching is produced
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+
+def _set_result_if_pending(future: 'asyncio.Future'):
+    if not future.done():
+        future.set_result(None)
+
+
 class AsyncRequestsIterator:
     """Iterator to allow async iteration of blocking/non-blocking iterator from the Client"""
 
+    # the maximal number of requests fetched ahead from a blocking iterator
+    MAX_PREFETCHED_REQUESTS = 100
+
     def __init__(self, iterator: Union[Iterator, AsyncIterator]) -> None:
         """Async request iterator
-        TODO (Deepankar): accept `num_req`
 
         :param iterator: request iterator
         """
         self.iterator = iterator
-
-    def iterator__next__(self):
-        """
-        Executed inside a `ThreadPoolExecutor` via `loop.run_in_executor` to avoid following exception.
-        "StopIteration interacts badly with generators and cannot be raised into a Future"
-
-        :return: next request or None
-        """
-        try:
-            return self.iterator.__next__()
-        except StopIteration:
-            return None
+        self._producer: Optional[_IteratorProducer] = None
 
     def __aiter__(self):
         return self
@@ -33,22 +111,156 @@ class AsyncRequestsIterator:
         if isinstance(self.iterator, Iterator):
             """
             An `Iterator` indicates "blocking" code, which might block all tasks in the event loop.
-            Hence we iterate in the default executor provided by asyncio.
+            Hence we iterate in a dedicated thread, which hands the requests over to the event loop.
             """
-            request = await get_or_reuse_loop().run_in_executor(
-                None, self.iterator__next__
-            )
-
-            """
-            `iterator.__next__` can be executed directly and that'd raise `StopIteration` in the executor,
-            which raises the following exception while chaining states in futures.
-            "StopIteration interacts badly with generators and cannot be raised into a Future"
-            To avoid that, we handle the raise by a `return None`
-            """
-            if request is None:
-                raise StopAsyncIteration
+            if self._producer is None:
+                self._producer = _IteratorProducer(
+                    self.iterator, self.MAX_PREFETCHED_REQUESTS
+                )
+            request = await self._producer.get()
         elif isinstance(self.iterator, AsyncIterator):
             # we assume that `AsyncIterator` doesn't block the event loop
             request = await self.iterator.__anext__()
 
         return request
+
+    def __del__(self):
+        if self._producer is not None:
+            self._producer.close()
+
+
+class PrefetchWindowPolicy:
+    """
+    Defines the adaptive window of requests a client stream may have in flight. The window grows additively while the
+    latency of the requests stays close to the lowest latency observed recently and shrinks multiplicatively once the
+    latency rises above it. Independently of the window, no more requests are fetched from the client once the
+    requests in flight hold `max_bytes`
+
+    :param initial_size: the number of requests in flight before any latency has been observed
+    :param min_size: the lower bound of the window
+    :param max_size: the upper bound of the window
+    :param max_bytes: the maximal number of bytes of the requests in flight, a single larger request is still sent
+    :param latency_tolerance: the window shrinks once the latency exceeds the lowest latency by this factor
+    :param backoff_ratio: the factor the window shrinks with
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 10,
+        min_size: int = 1,
+        max_size: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+    ):
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError(
+                f'the sizes must fulfill 1 <= min_size <= initial_size <= max_size, got {min_size}, '
+                f'{initial_size} and {max_size}'
+            )
+        if max_bytes <= 0:
+            raise ValueError(f'max_bytes must be positive, got {max_bytes}')
+        if latency_tolerance <= 1:
+            raise ValueError(
+                f'latency_tolerance must be greater than 1, got {latency_tolerance}'
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(
+                f'backoff_ratio must be between 0 and 1, got {backoff_ratio}'
+            )
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+
+
+class _PrefetchWindow:
+    """
+    Adaptive window of the requests a single client stream has in flight, see :class:`PrefetchWindowPolicy`.
+    A request stays in flight until its response was handed back to the client, so a slow reader holds the window
+    as well
+
+    :param policy: the policy defining the window
+    """
+
+    # the lowest latency is taken over this many requests, so that it follows a Flow which got slower
+    LATENCY_WINDOW_SIZE = 500
+
+    def __init__(self, policy: PrefetchWindowPolicy):
+        self._policy = policy
+        self._size = float(policy.initial_size)
+        self.in_flight = 0
+        self.bytes_in_flight = 0
+        self._space = asyncio.Event()
+        self._min_latency: Optional[float] = None
+        self._window_min_latency = math.inf
+        self._window_count = 0
+        self._last_decrease = 0.0
+
+    @property
+    def size(self) -> int:
+        """
+        The number of requests which may currently be in flight
+
+        :return: the window size
+        """
+        return int(self._size)
+
+    def _has_space(self, nbytes: int) -> bool:
+        if self.in_flight == 0:
+            return True
+        return (
+            self.in_flight < self.size
+            and self.bytes_in_flight + nbytes <= self._policy.max_bytes
+        )
+
+    async def acquire(self, nbytes: int):
+        """
+        Waits until a request of the given size may be sent. Every call has to be matched by a call to :meth:`release`
+
+        :param nbytes: the size of the request in bytes
+        """
+        while not self._has_space(nbytes):
+            self._space.clear()
+            await self._space.wait()
+        self.in_flight += 1
+        self.bytes_in_flight += nbytes
+
+    def release(self, nbytes: int):
+        """
+        Releases a request whose response was handed back to the client
+
+        :param nbytes: the size of the request in bytes
+        """
+        self.in_flight -= 1
+        self.bytes_in_flight -= nbytes
+        self._space.set()
+
+    def update_latency(self, latency: float):
+        """
+        Adapts the window to the latency of a completed request
+
+        :param latency: the latency of the request in seconds
+        """
+        self._window_min_latency = min(self._window_min_latency, latency)
+        self._window_count += 1
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self._window_count >= self.LATENCY_WINDOW_SIZE:
+            self._min_latency = self._window_min_latency
+            self._window_min_latency = math.inf
+            self._window_count = 0
+
+        if latency > self._min_latency * self._policy.latency_tolerance:
+            now = time.monotonic()
+            # the requests in flight while the window shrank report the same latency, shrink once per latency
+            if now - self._last_decrease >= latency:
+                self._last_decrease = now
+                self._size = max(
+                    self._policy.min_size, self._size * self._policy.backoff_ratio
+                )
+        elif self.in_flight + 1 >= self._size / 2:
+            # only grow the window if it is actually used
+            self._size = min(self._policy.max_size, self._size + 1 / self._size)
@@ -1,42 +1,156 @@
 import copy
-from typing import Optional, Dict, TypeVar
+import time
+from typing import TYPE_CHECKING, Optional, Dict, List, TypeVar, Union
 
+import numpy as np
 from google.protobuf import json_format
 
-from docarray import DocumentArray
+from docarray import Document, DocumentArray
 
 from jina.types.request import Request
 from jina.excepts import BadRequestType
 from jina.helper import typename, random_identity, cached_property
 from jina.proto import jina_pb2
 
+if TYPE_CHECKING:
+    from docarray.proto.docarray_pb2 import DocumentArrayProto
+
+    from jina.enums import CompressAlgo
+
 RequestSourceType = TypeVar(
     'RequestSourceType', jina_pb2.DataRequestProto, str, Dict, bytes
 )
 
+# tensor fields of the docs which are sent as one contiguous array per request if `header.tensor_columns` is set
+COLUMN_FIELDS = ('embedding', 'tensor')
+
+
+def _get_column(docs: 'DocumentArray', field: str) -> Optional[np.ndarray]:
+    # returns the values of the field of all docs stacked, None if they are not numpy arrays of the same shape and dtype
+    values = [getattr(doc, field) for doc in docs]
+    first = values[0]
+    if not isinstance(first, np.ndarray) or first.dtype.hasobject:
+        return None
+    for value in values:
+        if (
+            not isinstance(value, np.ndarray)
+            or value.shape != first.shape
+            or value.dtype != first.dtype
+        ):
+            return None
+    if first.flags.c_contiguous and all(value.base is first.base for value in values):
+        # the values are rows of one array, e.g. set with `docs.embeddings = array`. If they are consecutive, that
+        # array is used without copying every row
+        start = first.__array_interface__['data'][0]
+        if first.base is not None and all(
+            value.__array_interface__['data'][0] == start + i * first.nbytes
+            for i, value in enumerate(values)
+        ):
+            return np.lib.stride_tricks.as_strided(
+                first,
+                shape=(len(values),) + first.shape,
+                strides=(first.nbytes,) + first.strides,
+            )
+    return np.stack(values)
+
+
+def _docs_to_protobuf_with_columns(
+    docs: 'DocumentArray', columns
+) -> 'DocumentArrayProto':
+    # writes the tensor fields of the docs to the columns and serializes copies of the docs without them, the docs
+    # themselves are not changed
+    moved: List[str] = []
+    if len(docs):
+        for field in COLUMN_FIELDS:
+            column = _get_column(docs, field)
+            if column is None:
+                continue
+            proto = columns[field]
+            proto.buffer = column.tobytes()
+            proto.dtype = column.dtype.str
+            proto.shape.extend(column.shape)
+            moved.append(field)
+    if not moved:
+        return docs.to_protobuf()
+    return DocumentArray(_copy_without(doc, moved) for doc in docs).to_protobuf()
+
+
+def _copy_without(doc: 'Document', fields: List[str]) -> 'Document':
+    # a shallow copy of the doc with the fields unset, the values of the other fields are shared
+    data = copy.copy(doc._data)
+    for field in fields:
+        setattr(data, field, None)
+    doc_copy = Document()
+    data._reference_doc = doc_copy
+    doc_copy._data = data
+    return doc_copy
+
+
+def _load_columns(docs: 'DocumentArray', columns) -> None:
+    for field, column in columns.items():
+        # one writable copy of the column, the docs hold views of its rows
+        array = np.frombuffer(bytearray(column.buffer), dtype=column.dtype).reshape(
+            tuple(column.shape)
+        )
+        for doc, row in zip(docs, array):
+            setattr(doc, field, row)
+
 
 class DataRequest(Request):
     """ Represents a DataRequest used for exchanging DocumentArrays to and within a Flow"""
 
     class _DataContent:
-        def __init__(self, content: 'jina_pb2.DataRequestProto.DataContentProto'):
+        def __init__(
+            self,
+            content: 'jina_pb2.DataRequestProto.DataContentProto',
+            header: Optional['jina_pb2.HeaderProto'] = None,
+        ):
             self._content = content
+            self._header = header
             self._loaded_doc_array = None
 
+        @property
+        def _docs_codec(self) -> Optional[str]:
+            # the algorithm `docs_bytes` is compressed with, recorded in the header
+            if self._header is not None and self._header.HasField('docs_codec'):
+                return self._header.docs_codec
+            return None
+
+        def _set_docs_codec(self, algorithm: Optional[str]):
+            if self._header is None:
+                return
+            if algorithm:
+                self._header.docs_codec = algorithm
+            else:
+                self._header.ClearField('docs_codec')
+
+        @property
+        def _tensor_columns(self) -> bool:
+            # the sender of the request reads tensor columns, so they may be written to the request and its response
+            return self._header is not None and self._header.tensor_columns
+
         @property
         def docs(self) -> 'DocumentArray':
             """Get the :class: `DocumentArray` with sequence `data.docs` as content.
 
             .. # noqa: DAR201"""
             if not self._loaded_doc_array:
-                if self._content.WhichOneof('documents') == 'docs_bytes':
+                documents = self._content.WhichOneof('documents')
+                if documents == 'docs_bytes':
                     self._loaded_doc_array = DocumentArray.from_bytes(
-                        self._content.docs_bytes
+                        self.docs_bytes
+                    )
+                elif documents == 'docs_shm':
+                    from jina.serve.shared_memory import load_docs_from_shared_memory
+
+                    self._loaded_doc_array = load_docs_from_shared_memory(
+                        self._content.docs_shm, self._docs_codec
                     )
                 else:
                     self._loaded_doc_array = DocumentArray.from_protobuf(
                         self._content.docs
                     )
+                _load_columns(self._loaded_doc_array, self._content.columns)
 
             return self._loaded_doc_array
 
@@ -48,13 +162,26 @@ class DataRequest(Request):
             """
             if value is not None:
                 self._loaded_doc_array = None
-                self._content.docs.CopyFrom(value.to_protobuf())
+                self._content.ClearField('columns')
+                self._set_docs_codec(None)
+                if self._tensor_columns:
+                    self._content.docs.CopyFrom(
+                        _docs_to_protobuf_with_columns(value, self._content.columns)
+                    )
+                else:
+                    self._content.docs.CopyFrom(value.to_protobuf())
 
         @property
         def docs_bytes(self) -> bytes:
-            """Get the :class: `DocumentArray` with sequence `data.docs` as content.
+            """Get the :class: `DocumentArray` with sequence `data.docs` as content, decompressed if it was sent
+            compressed.
 
             .. # noqa: DAR201"""
+            codec = self._docs_codec
+            if codec:
+                from jina.serve.compression import decompress_bytes
+
+                return decompress_bytes(self._content.docs_bytes, codec)
             return self._content.docs_bytes
 
         @docs_bytes.setter
@@ -65,8 +192,32 @@ class DataRequest(Request):
             """
             if value:
                 self._loaded_doc_array = None
+                self._content.ClearField('columns')
+                self._set_docs_codec(None)
                 self._content.docs_bytes = value
 
+        def set_compressed_docs(
+            self, value: DocumentArray, algorithm: Union[str, 'CompressAlgo']
+        ):
+            """Overide the DocumentArray with the provided one, sent as `docs_bytes` compressed with the algorithm.
+            The algorithm is recorded in the header, so that Gateways and Heads forward the docs without decompressing
+            them. If the package of the algorithm is not installed, zlib is used.
+
+            :param value: a DocumentArray
+            :param algorithm: the compression algorithm, e.g. `LZ4`
+            """
+            from jina.enums import CompressAlgo
+            from jina.serve.compression import compress_bytes, get_compress_algo
+
+            algorithm = get_compress_algo(algorithm)
+            if algorithm == CompressAlgo.NONE:
+                self.docs_bytes = value.to_bytes()
+                return
+            self._loaded_doc_array = None
+            self._content.ClearField('columns')
+            self._set_docs_codec(str(algorithm))
+            self._content.docs_bytes = compress_bytes(value.to_bytes(), algorithm)
+
     """
     :class:`DataRequest` is one of the **primitive data type** in Jina.
 
@@ -87,6 +238,9 @@ class DataRequest(Request):
         request: Optional[RequestSourceType] = None,
     ):
         self.buffer = None
+        self._pb_body_wo_data = None
+        # the parameters converted to a dict, None until they are read
+        self._parameters = None
         try:
             if isinstance(request, jina_pb2.DataRequestProto):
                 self._pb_body = request
@@ -116,6 +270,15 @@ class DataRequest(Request):
 
         :return: True if the proto was deserialized before
         """
+        return self.buffer is None and self._pb_body_wo_data is None
+
+    @property
+    def is_decompressed_wo_data(self) -> bool:
+        """
+        Checks if the header, parameters and routes were already deserialized, the data may still be serialized
+
+        :return: True if the proto without data was deserialized before
+        """
         return self.buffer is None
 
     @property
@@ -129,10 +292,47 @@ class DataRequest(Request):
             self._decompress()
         return self._pb_body
 
+    @property
+    def proto_wo_data(
+        self,
+    ) -> Union['jina_pb2.DataRequestProtoWoData', 'jina_pb2.DataRequestProto']:
+        """
+        Deserializes the header, parameters and routes of the request but keeps its data serialized. If the request
+        was already deserialized, its proto is returned.
+        :return: protobuf instance holding header, parameters and routes
+        """
+        if not self.is_decompressed_wo_data:
+            self._pb_body_wo_data = jina_pb2.DataRequestProtoWoData()
+            self._pb_body_wo_data.ParseFromString(self.buffer)
+            self.buffer = None
+        if self._pb_body_wo_data is not None:
+            return self._pb_body_wo_data
+        return self._pb_body
+
     def _decompress(self):
         self._pb_body = jina_pb2.DataRequestProto()
-        self._pb_body.ParseFromString(self.buffer)
-        self.buffer = None
+        if self._pb_body_wo_data is not None:
+            # changes to the header, parameters and routes are kept, only the data is parsed
+            for field, value in self._pb_body_wo_data.ListFields():
+                if field.name == 'data':
+                    self._pb_body.data.ParseFromString(value)
+                elif field.label == field.LABEL_REPEATED:
+                    getattr(self._pb_body, field.name).extend(value)
+                else:
+                    getattr(self._pb_body, field.name).CopyFrom(value)
+            self._pb_body_wo_data = None
+        else:
+            self._pb_body.ParseFromString(self.buffer)
+            self.buffer = None
+
+    def to_bytes(self) -> bytes:
+        """Return the serialized request without deserializing what was not deserialized before
+
+        :return: binary string representation of the request
+        """
+        if not self.is_decompressed_wo_data:
+            return self.buffer
+        return self.proto_wo_data.SerializePartialToString()
 
     def to_dict(self) -> Dict:
         """Return the object in Python dictionary.
@@ -145,6 +345,7 @@ class DataRequest(Request):
         """
         da = self.docs
         self.proto.data.docs.CopyFrom(DocumentArray().to_protobuf())
+        self.proto.data.ClearField('columns')
         from google.protobuf.json_format import MessageToDict
 
         d = MessageToDict(
@@ -160,29 +361,66 @@ class DataRequest(Request):
         .. # noqa: DAR201"""
         return self.data.docs
 
+    @property
+    def header(self) -> 'jina_pb2.HeaderProto':
+        """Get the header of the request without deserializing its data
+
+        :return: the header
+        """
+        return self.proto_wo_data.header
+
+    @property
+    def routes(self):
+        """Get the routes of the request without deserializing its data
+
+        :return: the routes
+        """
+        return self.proto_wo_data.routes
+
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """Get the seconds left until the deadline in `header.timeout`, negative once it passed
+
+        :return: the remaining seconds or None if the request has no deadline
+        """
+        if not self.header.HasField('timeout'):
+            return None
+        return self.header.timeout - time.time()
+
     @cached_property
     def data(self) -> 'DataRequest._DataContent':
         """Get the data contaned in this data request
 
         :return: the data content as an instance of _DataContent wrapping docs
         """
-        return DataRequest._DataContent(self.proto.data)
+        return DataRequest._DataContent(self.proto.data, self.proto.header)
 
     @property
     def parameters(self) -> Dict:
-        """Return the `parameters` field of this DataRequest as a Python dict
+        """Return the `parameters` field of this DataRequest as a Python dict. The field is converted only once, every
+        access returns a copy which can be changed without changing the request.
         :return: a Python dict view of the parameters.
         """
-        # if u get this u need to have it decompressed
-        return json_format.MessageToDict(self.proto.parameters)
+        if self._parameters is None:
+            parameters = self.proto_wo_data.parameters
+            self._parameters = (
+                json_format.MessageToDict(parameters) if parameters.fields else {}
+            )
+        if not self._parameters:
+            return {}
+        return copy.deepcopy(self._parameters)
 
     @parameters.setter
     def parameters(self, value: Dict):
-        """Set the `parameters` field of this Request to a Python dict
+        """Set the `parameters` field of this Request to a Python dict, the field is only rewritten if it changes
         :param value: a Python dict
         """
-        self.proto.parameters.Clear()
-        self.proto.parameters.update(value)
+        if self._parameters is not None and value == self._parameters:
+            return
+        self.proto_wo_data.parameters.Clear()
+        self.proto_wo_data.parameters.update(value)
+        # converted again when read, like the values sent to other Pods, e.g. integers are read as floats
+        self._parameters = None
 
     @property
     def response(self):
@@ -200,7 +438,7 @@ class DataRequest(Request):
 
         :return: the status object of this request
         """
-        return self.proto.header.status
+        return self.header.status
 
     @classmethod
     def from_proto(cls, request: 'jina_pb2.DataRequestProto'):
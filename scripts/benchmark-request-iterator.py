@@ -0,0 +1,77 @@
+"""Compare the requests per second with which AsyncRequestsIterator hands the requests of a blocking iterator over to
+the event loop, with one executor hop per request as before and with the producer thread
+
+    python scripts/benchmark-request-iterator.py --num-requests 20000
+"""
+import argparse
+import asyncio
+import time
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.helper import get_or_reuse_loop
+from jina.serve.stream.helper import AsyncRequestsIterator
+
+
+class _PerRequestExecutorIterator:
+    # the previous implementation, every request is fetched with `run_in_executor`
+    def __init__(self, iterator):
+        self.iterator = iterator
+
+    def _next(self):
+        try:
+            return self.iterator.__next__()
+        except StopIteration:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        request = await get_or_reuse_loop().run_in_executor(None, self._next)
+        if request is None:
+            raise StopAsyncIteration
+        return request
+
+
+async def _measure(iterator_cls, requests) -> float:
+    async def _handle(request):
+        # a request handler which only yields to the event loop, like forwarding a request
+        await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    tasks = []
+    async for request in iterator_cls(iter(requests)):
+        tasks.append(asyncio.ensure_future(_handle(request)))
+    await asyncio.gather(*tasks)
+    return len(requests) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--num-requests', type=int, default=20000)
+    parser.add_argument('--repetitions', type=int, default=3)
+    bench_args = parser.parse_args()
+
+    requests = list(
+        request_generator(
+            '/',
+            DocumentArray(
+                [Document(text='hello') for _ in range(bench_args.num_requests)]
+            ),
+            request_size=1,
+        )
+    )
+    for name, iterator_cls in (
+        ('per-request executor', _PerRequestExecutorIterator),
+        ('producer thread', AsyncRequestsIterator),
+    ):
+        rates = [
+            asyncio.run(_measure(iterator_cls, requests))
+            for _ in range(bench_args.repetitions)
+        ]
+        print(f'{name:<21}: {max(rates):10.0f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Measure the requests per second the gateway routes through the TopologyGraph of a chain, a fan-out and a diamond
+topology, with a connection pool which answers every request right away
+
+    python scripts/benchmark-topology-graph.py --num-requests 5000
+"""
+import argparse
+import asyncio
+import time
+
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+from jina.types.request.data import DataRequest
+
+TOPOLOGIES = {
+    'chain': {
+        'start-gateway': ['deployment0'],
+        'deployment0': ['deployment1'],
+        'deployment1': ['deployment2'],
+        'deployment2': ['deployment3'],
+        'deployment3': ['deployment4'],
+        'deployment4': ['end-gateway'],
+    },
+    'fan-out': {
+        'start-gateway': ['deployment0'],
+        'deployment0': ['deployment1', 'deployment2', 'deployment3', 'deployment4'],
+        'deployment1': ['end-gateway'],
+        'deployment2': [],
+        'deployment3': [],
+        'deployment4': [],
+    },
+    'diamond': {
+        'start-gateway': ['deployment0'],
+        'deployment0': ['deployment1', 'deployment2'],
+        'deployment1': ['deployment3'],
+        'deployment2': ['deployment3'],
+        'deployment3': ['deployment4'],
+        'deployment4': ['end-gateway'],
+    },
+}
+
+
+class _InstantConnectionPool:
+    def send_requests_once(self, requests, deployment, head, endpoint=None):
+        async def _send():
+            return requests[0], {}
+
+        return asyncio.ensure_future(_send())
+
+    def send_request(self, request, deployment, head, endpoint=None):
+        return [self.send_requests_once([request], deployment, head, endpoint)]
+
+
+async def _measure(graph_description, num_requests: int) -> float:
+    handler = handle_request(TopologyGraph(graph_description), _InstantConnectionPool())
+    requests = [DataRequest() for _ in range(num_requests)]
+    start = time.perf_counter()
+    await asyncio.gather(*[handler(request) for request in requests])
+    return num_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--num-requests', type=int, default=5000)
+    parser.add_argument('--repetitions', type=int, default=3)
+    bench_args = parser.parse_args()
+
+    for name, graph_description in TOPOLOGIES.items():
+        rates = [
+            asyncio.run(_measure(graph_description, bench_args.num_requests))
+            for _ in range(bench_args.repetitions)
+        ]
+        print(f'{name:<8}: {max(rates):10.0f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
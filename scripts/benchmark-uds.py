@@ -0,0 +1,85 @@
+"""Compare the round-trip latency of data requests sent to a local WorkerRuntime over TCP and over its unix domain socket
+
+    python scripts/benchmark-uds.py --num-requests 200
+"""
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from threading import Event
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.parsers import set_pod_parser
+from jina.serve.networking import GrpcConnectionPool
+from jina.serve.runtimes.asyncio import AsyncNewLoopRuntime
+from jina.serve.runtimes.worker import WorkerRuntime
+
+PAYLOAD_SIZES = {'1KB': 1024, '10MB': 10 * 1024 * 1024}
+
+
+def _start_runtime(args, cancel_event):
+    with WorkerRuntime(args, cancel_event) as runtime:
+        runtime.run_forever()
+
+
+async def _measure(address: str, uds: bool, payload_size: int, num_requests: int):
+    request = list(
+        request_generator('/', DocumentArray([Document(blob=b'x' * payload_size)]))
+    )[0]
+    pool = GrpcConnectionPool(uds=uds)
+    pool.add_connection(deployment='worker', address=address)
+    latencies = []
+    try:
+        # the first requests establish the connection
+        for i in range(num_requests + 5):
+            start = time.perf_counter()
+            await pool.send_request(request=request, deployment='worker')[0]
+            if i >= 5:
+                latencies.append(time.perf_counter() - start)
+    finally:
+        await pool.close()
+    return latencies
+
+
+def _report(transport: str, payload: str, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f'{transport:<4} {payload:>5}: '
+        f'mean {statistics.mean(latencies) * 1000:8.3f}ms  '
+        f'p50 {statistics.median(latencies) * 1000:8.3f}ms  '
+        f'p99 {p99 * 1000:8.3f}ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--num-requests', type=int, default=200)
+    bench_args = parser.parse_args()
+
+    args = set_pod_parser().parse_args([])
+    cancel_event = multiprocessing.Event()
+    runtime = multiprocessing.Process(
+        target=_start_runtime, args=(args, cancel_event), daemon=True
+    )
+    runtime.start()
+    address = f'{args.host}:{args.port_in}'
+    try:
+        assert AsyncNewLoopRuntime.wait_for_ready_or_shutdown(
+            timeout=10.0, ctrl_address=address, ready_or_shutdown_event=Event()
+        )
+        for payload, payload_size in PAYLOAD_SIZES.items():
+            for transport, uds in (('tcp', False), ('uds', True)):
+                latencies = asyncio.run(
+                    _measure(address, uds, payload_size, bench_args.num_requests)
+                )
+                _report(transport, payload, latencies)
+    finally:
+        cancel_event.set()
+        runtime.join()
+
+
+if __name__ == '__main__':
+    main()
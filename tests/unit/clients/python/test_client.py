@@ -172,3 +172,25 @@ def test_all_sync_clients(protocol, mocker):
     m2.assert_called()
     m3.assert_called_once()
     m4.assert_called()
+
+
+class SlowFirstExec(Executor):
+    @req
+    async def foo(self, docs, **kwargs):
+        import asyncio
+
+        # the first requests complete last
+        await asyncio.sleep(max(0.0, 0.5 - 0.1 * int(docs[0].id)))
+
+
+@pytest.mark.parametrize('protocol', ['grpc', 'websocket'])
+def test_client_results_in_order(protocol):
+    with Flow(protocol=protocol).add(uses=SlowFirstExec) as f:
+        c = Client(port=f.port_expose, protocol=protocol, return_responses=True)
+        responses = c.post(
+            '/',
+            DocumentArray([Document(id=str(i)) for i in range(6)]),
+            request_size=1,
+            results_in_order=True,
+        )
+    assert [r.docs[0].id for r in responses] == [str(i) for i in range(6)]
@@ -67,3 +67,11 @@ def test_client_behaviour(flow_with_exception_request, mocker):
     on_always_mock.assert_called_once()
     on_done_mock.assert_not_called()
     on_error_mock.assert_called_once()
+
+
+def test_new_data_request_timeout():
+    request = _new_data_request('/', None, None)
+    assert request.remaining_time is None
+
+    request = _new_data_request('/', None, None, timeout=10)
+    assert 9 < request.remaining_time <= 11
@@ -111,6 +111,22 @@ def test_uses_before_after(pod_args):
         assert pod.num_pods == 4
 
 
+@pytest.mark.parametrize(
+    'uses, uses_before, disable_uds',
+    [
+        ('MyDummyExecutor', None, False),
+        ('docker://executor', None, True),
+        ('jinahub+docker://Executor', None, True),
+        ('MyDummyExecutor', 'docker://executor', True),
+    ],
+)
+def test_head_disable_uds_for_containers(pod_args, uses, uses_before, disable_uds):
+    pod_args.uses = uses
+    pod_args.uses_before = uses_before
+    pod = Deployment(pod_args)
+    assert pod.head_args.disable_uds == disable_uds
+
+
 def test_mermaid_str_no_error(pod_args):
     pod_args.replicas = 3
     pod_args.uses_before = 'MyDummyExecutor'
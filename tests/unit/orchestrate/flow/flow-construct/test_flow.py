@@ -432,6 +432,19 @@ def test_socket_types_2_remote_one_local_input_socket_pull_connect_from_remote()
     _validate_flow(f)
 
 
+@pytest.mark.parametrize('host, disable_uds', [('localhost', True), ('1.2.3.4', False)])
+def test_flow_gateway_disable_uds_for_local_external(host, disable_uds):
+    f = (
+        Flow()
+        .add(name='executor1')
+        .add(name='external', external=True, host=host, port_in=12345)
+    )
+
+    f.build()
+
+    assert f._deployment_nodes['gateway'].args.disable_uds == disable_uds
+
+
 def test_single_document_flow_index():
     d = Document()
     with Flow().add() as f:
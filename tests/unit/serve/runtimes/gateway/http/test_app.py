@@ -52,6 +52,42 @@ def test_tag_update():
     assert r2.json()['data'][0]['tags'] == {'prop2': 'val'}
 
 
+@pytest.mark.parametrize('media_type', ['application/x-protobuf', 'application/msgpack'])
+def test_binary_media_types(media_type):
+    from jina.serve.media_types import request_from_bytes, request_to_bytes
+    from jina.types.request.data import DataRequest
+
+    port_expose = random_port()
+    request = DataRequest()
+    request.header.exec_endpoint = '/foo'
+    request.data.docs = DocumentArray([Document(id='1', embedding=[1.0, 2.0])])
+
+    f = Flow(port_expose=port_expose, protocol='http').add(uses=TestExecutor)
+    with f:
+        r1 = req.post(
+            f'http://localhost:{port_expose}/index',
+            data=request_to_bytes(request, media_type),
+            headers={'Content-Type': media_type},
+        )
+        r2 = req.post(
+            f'http://localhost:{port_expose}/post',
+            data=request_to_bytes(request, media_type),
+            headers={'Content-Type': media_type, 'Accept': 'application/json'},
+        )
+        r3 = req.post(
+            f'http://localhost:{port_expose}/index',
+            data=b'not a request',
+            headers={'Content-Type': media_type},
+        )
+    assert r1.headers['content-type'] == media_type
+    response = request_from_bytes(r1.content, media_type)
+    assert response.header.exec_endpoint == '/index'
+    assert response.docs[0].id == '1'
+    assert list(response.docs[0].embedding) == [1.0, 2.0]
+    assert r2.json()['header']['exec_endpoint'] == '/foo'
+    assert r3.status_code == 400
+
+
 @pytest.fixture
 def cert_pem():
     """This is the cert entry of a self-signed local cert"""
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from jina import Document, DocumentArray
+from jina.serve.runtimes.gateway.batching import BatchingPolicy, RequestBatcher
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+from jina.types.request.data import DataRequest
+
+
+def _create_request(doc_ids, endpoint='/encode', parameters=None):
+    req = DataRequest()
+    req.header.exec_endpoint = endpoint
+    req.data.docs = DocumentArray([Document(id=doc_id) for doc_id in doc_ids])
+    if parameters:
+        req.parameters = parameters
+    # the gateway receives the requests serialized
+    return DataRequest(req.to_bytes())
+
+
+class _RecordingConnectionPool:
+    def __init__(self, fail=False):
+        self.fail = fail
+        # the ids of the docs of every request sent to every deployment
+        self.sent = []
+
+    def send_requests_once(self, requests, deployment, head, endpoint=None):
+        response = DataRequest(requests[0].to_bytes())
+        docs = response.docs
+        self.sent.append((deployment, [doc.id for doc in docs]))
+        for doc in docs:
+            doc.text += f'-{deployment}'
+        response.data.docs = docs
+        if self.fail:
+            response.add_exception(ValueError('failed'))
+
+        async def _send():
+            await asyncio.sleep(0.01)
+            return response, {'is-error': True} if self.fail else {}
+
+        return asyncio.ensure_future(_send())
+
+
+def _create_handler(connection_pool, **policy):
+    return handle_request(
+        TopologyGraph(
+            {
+                'start-gateway': ['deployment0'],
+                'deployment0': ['deployment1'],
+                'deployment1': ['end-gateway'],
+            }
+        ),
+        connection_pool,
+        request_batcher=RequestBatcher(BatchingPolicy(endpoints=['/encode'], **policy)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batching_coalesces_concurrent_requests():
+    connection_pool = _RecordingConnectionPool()
+    handler = _create_handler(connection_pool, max_batch_docs=4, max_wait_ms=1000)
+    responses = await asyncio.gather(
+        handler(_create_request(['a'])),
+        handler(_create_request(['b', 'c'])),
+        handler(_create_request(['d'])),
+    )
+    # the batch is full and sent without waiting
+    assert connection_pool.sent == [
+        ('deployment0', ['a', 'b', 'c', 'd']),
+        ('deployment1', ['a', 'b', 'c', 'd']),
+    ]
+    assert [[doc.id for doc in response.docs] for response in responses] == [
+        ['a'],
+        ['b', 'c'],
+        ['d'],
+    ]
+    for response in responses:
+        for doc in response.docs:
+            assert doc.text == '-deployment0-deployment1'
+        assert [route.executor for route in response.routes] == [
+            'gateway',
+            'deployment0',
+            'deployment1',
+        ]
+
+
+@pytest.mark.asyncio
+async def test_batching_sends_after_max_wait():
+    connection_pool = _RecordingConnectionPool()
+    handler = _create_handler(connection_pool, max_batch_docs=64, max_wait_ms=50)
+    responses = await asyncio.gather(
+        handler(_create_request(['a'])), handler(_create_request(['b']))
+    )
+    assert connection_pool.sent[0] == ('deployment0', ['a', 'b'])
+    assert [response.docs[0].id for response in responses] == ['a', 'b']
+
+
+@pytest.mark.asyncio
+async def test_batching_splits_batches():
+    connection_pool = _RecordingConnectionPool()
+    handler = _create_handler(connection_pool, max_batch_docs=3, max_wait_ms=50)
+    await asyncio.gather(
+        handler(_create_request(['a', 'b'])),
+        # does not fit into the batch
+        handler(_create_request(['c', 'd'])),
+        # can not be told apart from the previous request in the response
+        handler(_create_request(['c'])),
+        # other parameters
+        handler(_create_request(['e'], parameters={'limit': 1})),
+        # not batched
+        handler(_create_request(['f'], endpoint='/index')),
+    )
+    sent_to_first = sorted(
+        doc_ids
+        for deployment, doc_ids in connection_pool.sent
+        if deployment == 'deployment0'
+    )
+    assert sent_to_first == [['a', 'b'], ['c'], ['c', 'd'], ['e'], ['f']]
+
+
+@pytest.mark.asyncio
+async def test_batching_propagates_errors():
+    connection_pool = _RecordingConnectionPool(fail=True)
+    handler = _create_handler(connection_pool, max_batch_docs=2, max_wait_ms=50)
+    responses = await asyncio.gather(
+        handler(_create_request(['a'])), handler(_create_request(['b']))
+    )
+    for response in responses:
+        assert response.header.status.code == response.header.status.ERROR
+        assert response.header.status.exception.name == 'ValueError'
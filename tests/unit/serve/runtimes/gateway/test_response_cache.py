@@ -0,0 +1,175 @@
+import asyncio
+import time
+
+import pytest
+
+from jina import Document, DocumentArray
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+from jina.serve.runtimes.gateway.response_cache import (
+    ResponseCache,
+    ResponseCachePolicy,
+)
+from jina.types.request.data import DataRequest
+
+
+def _create_request(
+    text='hello', endpoint='/search', parameters=None, doc_id='doc0'
+):
+    req = DataRequest()
+    req.header.exec_endpoint = endpoint
+    req.data.docs = DocumentArray([Document(id=doc_id, text=text)])
+    if parameters:
+        req.parameters = parameters
+    # the gateway receives the requests serialized
+    return DataRequest(req.to_bytes())
+
+
+class _CountingConnectionPool:
+    def __init__(self):
+        self.sent = 0
+
+    def send_requests_once(self, requests, deployment, head, endpoint=None):
+        self.sent += 1
+        response = DataRequest(requests[0].to_bytes())
+        docs = response.docs
+        docs[0].text += f'-{deployment}'
+        response.data.docs = docs
+
+        async def _send():
+            return response, {}
+
+        return asyncio.ensure_future(_send())
+
+
+def test_response_cache_key():
+    cache = ResponseCache()
+    assert cache.key(_create_request()) == cache.key(_create_request())
+    assert cache.key(_create_request()) != cache.key(_create_request(text='world'))
+    assert cache.key(
+        _create_request(parameters={'a': 1, 'b': {'c': 'd', 'e': 2}})
+    ) == cache.key(_create_request(parameters={'b': {'e': 2, 'c': 'd'}, 'a': 1}))
+    assert cache.key(_create_request(parameters={'a': 1})) != cache.key(
+        _create_request(parameters={'a': 2})
+    )
+    # requests which were parsed by the gateway have the same key
+    decompressed = _create_request()
+    decompressed.docs
+    assert cache.key(decompressed) == cache.key(_create_request())
+    assert cache.key(_create_request(endpoint='/index')) is None
+    # equal queries of different clients have the same key
+    assert cache.key(_create_request(doc_id='doc1')) == cache.key(_create_request())
+
+
+def test_response_cache_get_put():
+    cache = ResponseCache()
+    request = _create_request()
+    key = cache.key(request)
+    assert cache.get(key, request) is None
+
+    response = _create_request(text='response')
+    response.routes.add().executor = 'executor0'
+    cache.put(key, request, response)
+
+    new_request = _create_request()
+    new_request.routes.add().executor = 'gateway'
+    cached_response = cache.get(key, new_request)
+    assert cached_response.docs[0].text == 'response'
+    assert cached_response.header.request_id == new_request.header.request_id
+    assert cached_response.docs[0].id == 'doc0'
+    assert [route.executor for route in cached_response.routes] == ['gateway']
+    assert cache.stats == {
+        'hits': 1,
+        'misses': 1,
+        'evictions': 0,
+        'expirations': 0,
+        'entries': 1,
+        'bytes': len(response.to_bytes()),
+    }
+
+
+def test_response_cache_replaces_doc_ids():
+    cache = ResponseCache()
+    request = _create_request()
+    key = cache.key(request)
+    cache.put(key, request, _create_request(text='response'))
+
+    new_request = _create_request(doc_id='doc1')
+    assert cache.key(new_request) == key
+    cached_response = cache.get(key, new_request)
+    assert cached_response.docs[0].id == 'doc1'
+    assert cached_response.docs[0].text == 'response'
+
+
+def test_response_cache_does_not_cache_errors():
+    cache = ResponseCache()
+    request = _create_request()
+    key = cache.key(request)
+    response = _create_request()
+    response.add_exception(ValueError('failed'))
+    cache.put(key, request, response)
+    assert cache.get(key, request) is None
+
+
+@pytest.mark.parametrize(
+    'policy', [{'max_entries': 2}, {'max_bytes': 2 * len(_create_request().to_bytes())}]
+)
+def test_response_cache_evicts_least_recently_used(policy):
+    cache = ResponseCache(ResponseCachePolicy(**policy))
+    requests = [_create_request(text=text) for text in ('a', 'b', 'c')]
+    keys = [cache.key(request) for request in requests]
+    cache.put(keys[0], requests[0], requests[0])
+    cache.put(keys[1], requests[1], requests[1])
+    assert cache.get(keys[0], requests[0]) is not None
+    cache.put(keys[2], requests[2], requests[2])
+    assert cache.get(keys[1], requests[1]) is None
+    assert cache.get(keys[0], requests[0]) is not None
+    assert cache.get(keys[2], requests[2]) is not None
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['entries'] == 2
+
+
+def test_response_cache_ttl():
+    cache = ResponseCache(ResponseCachePolicy(ttl=0.1))
+    request = _create_request()
+    key = cache.key(request)
+    cache.put(key, request, request)
+    assert cache.get(key, request) is not None
+    time.sleep(0.2)
+    assert cache.get(key, request) is None
+    assert cache.stats['expirations'] == 1
+    assert cache.stats['entries'] == 0
+
+
+@pytest.mark.asyncio
+async def test_handle_request_with_response_cache():
+    connection_pool = _CountingConnectionPool()
+    cache = ResponseCache()
+    handler = handle_request(
+        TopologyGraph(
+            {
+                'start-gateway': ['deployment0'],
+                'deployment0': ['deployment1'],
+                'deployment1': ['end-gateway'],
+            }
+        ),
+        connection_pool,
+        response_cache=cache,
+    )
+
+    responses = []
+    for _ in range(3):
+        responses.append(await handler(_create_request()))
+    await handler(_create_request(endpoint='/index'))
+
+    assert connection_pool.sent == 2 + 2
+    for response in responses:
+        assert response.docs[0].text == 'hello-deployment0-deployment1'
+    assert [route.executor for route in responses[0].routes] == [
+        'gateway',
+        'deployment0',
+        'deployment1',
+    ]
+    assert [route.executor for route in responses[2].routes] == ['gateway']
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 1
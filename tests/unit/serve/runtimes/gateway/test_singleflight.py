@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from jina import Document, DocumentArray
+from jina.serve.runtimes.gateway.graph.topology_graph import TopologyGraph
+from jina.serve.runtimes.gateway.request_handling import handle_request
+from jina.serve.runtimes.gateway.singleflight import Singleflight
+from jina.types.request.data import DataRequest
+
+
+def _create_request(text='hello', endpoint='/search', doc_id='doc0'):
+    req = DataRequest()
+    req.header.exec_endpoint = endpoint
+    req.data.docs = DocumentArray([Document(id=doc_id, text=text)])
+    # the gateway receives the requests serialized
+    return DataRequest(req.to_bytes())
+
+
+class _SlowConnectionPool:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = 0
+
+    def send_requests_once(self, requests, deployment, head, endpoint=None):
+        self.sent += 1
+        response = DataRequest(requests[0].to_bytes())
+        docs = response.docs
+        docs[0].text += f'-{deployment}'
+        response.data.docs = docs
+
+        async def _send():
+            await asyncio.sleep(0.05)
+            if self.fail:
+                raise ConnectionError('deployment is gone')
+            return response, {}
+
+        return asyncio.ensure_future(_send())
+
+
+def _create_handler(connection_pool, singleflight):
+    return handle_request(
+        TopologyGraph(
+            {
+                'start-gateway': ['deployment0'],
+                'deployment0': ['end-gateway'],
+            }
+        ),
+        connection_pool,
+        singleflight=singleflight,
+    )
+
+
+@pytest.mark.asyncio
+async def test_singleflight_collapses_identical_requests():
+    connection_pool = _SlowConnectionPool()
+    singleflight = Singleflight(['/search'])
+    handler = _create_handler(connection_pool, singleflight)
+    requests = [_create_request() for _ in range(3)] + [
+        _create_request(text='world'),
+        _create_request(endpoint='/index'),
+        _create_request(endpoint='/index'),
+    ]
+    request_ids = [request.header.request_id for request in requests]
+    responses = await asyncio.gather(*[handler(request) for request in requests])
+
+    assert connection_pool.sent == 4
+    assert singleflight.stats == {'collapsed': 2, 'in_flight': 0}
+    assert [response.header.request_id for response in responses] == request_ids
+    for response in responses[:3]:
+        assert response.docs[0].text == 'hello-deployment0'
+        assert [route.executor for route in response.routes] == [
+            'gateway',
+            'deployment0',
+        ]
+    assert responses[3].docs[0].text == 'world-deployment0'
+
+    # once the request landed, an identical request is sent again
+    await handler(_create_request())
+    assert connection_pool.sent == 5
+
+
+@pytest.mark.asyncio
+async def test_singleflight_propagates_errors():
+    singleflight = Singleflight(['/search'])
+    handler = _create_handler(_SlowConnectionPool(fail=True), singleflight)
+    results = await asyncio.gather(
+        handler(_create_request()), handler(_create_request()), return_exceptions=True
+    )
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert singleflight.stats == {'collapsed': 1, 'in_flight': 0}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_collapses_requests_of_different_clients():
+    connection_pool = _SlowConnectionPool()
+    handler = _create_handler(connection_pool, Singleflight(['/search']))
+    responses = await asyncio.gather(
+        handler(_create_request(doc_id='doc0')), handler(_create_request(doc_id='doc1'))
+    )
+
+    assert connection_pool.sent == 1
+    assert [response.docs[0].id for response in responses] == ['doc0', 'doc1']
+    assert responses[1].docs[0].text == 'hello-deployment0'
+
+
+@pytest.mark.asyncio
+async def test_singleflight_leader_cancelled():
+    connection_pool = _SlowConnectionPool()
+    singleflight = Singleflight(['/search'])
+    handler = _create_handler(connection_pool, singleflight)
+    leader = handler(_create_request())
+    follower = handler(_create_request())
+    # the client of the leading request goes away
+    leader.cancel()
+
+    response = await follower
+    assert response.docs[0].text == 'hello-deployment0'
+    assert connection_pool.sent == 1
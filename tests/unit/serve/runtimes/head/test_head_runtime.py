@@ -241,6 +241,59 @@ def test_base_polling(polling):
     _destroy_runtime(args, cancel_event, runtime_thread)
 
 
+def test_hash_polling():
+    args = set_pod_parser().parse_args(['--polling', 'HASH', '--shards', str(2)])
+    cancel_event, handle_queue, runtime_thread = _create_runtime(args)
+
+    _add_worker(args, shard_id=0)
+    _add_worker(args, shard_id=1)
+
+    with grpc.insecure_channel(
+        f'{args.host}:{args.port_in}',
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        request = list(
+            request_generator(
+                '/index', DocumentArray([Document(text=str(i)) for i in range(20)])
+            )
+        )[0]
+        response, call = stub.process_single_data.with_call(
+            request, metadata=(('endpoint', '/index'),)
+        )
+
+    # every shard received its slice of the docs
+    assert _queue_length(handle_queue) == 2
+    assert {doc.id for doc in response.docs} == {doc.id for doc in request.docs}
+
+    _destroy_runtime(args, cancel_event, runtime_thread)
+
+
+def test_hash_polling_unreachable_shard():
+    args = set_pod_parser().parse_args(['--polling', 'HASH', '--shards', str(2)])
+    cancel_event, handle_queue, runtime_thread = _create_runtime(args)
+
+    # shard 1 is not connected yet, its docs must not be sent to shard 0
+    _add_worker(args, shard_id=0)
+
+    with grpc.insecure_channel(
+        f'{args.host}:{args.port_in}',
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        request = list(
+            request_generator(
+                '/index', DocumentArray([Document(text=str(i)) for i in range(20)])
+            )
+        )[0]
+        with pytest.raises(RpcError):
+            stub.process_single_data(request, metadata=(('endpoint', '/index'),))
+
+    assert _queue_length(handle_queue) == 0
+
+    _destroy_runtime(args, cancel_event, runtime_thread)
+
+
 def _create_test_data_message(counter=0, endpoint='/'):
     return list(
         request_generator(endpoint, DocumentArray([Document(text=str(counter))]))
@@ -61,6 +61,128 @@ def test_worker_runtime():
     assert not AsyncNewLoopRuntime.is_ready(f'{args.host}:{args.port_in}')
 
 
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+@pytest.mark.skipif(os.name == 'nt', reason='unix domain sockets are not supported')
+def test_worker_runtime_uds():
+    args = set_pod_parser().parse_args([])
+    uds_address = GrpcConnectionPool.get_uds_address(args.port_in)
+
+    cancel_event = multiprocessing.Event()
+
+    def start_runtime(args, cancel_event):
+        with WorkerRuntime(args, cancel_event) as runtime:
+            runtime.run_forever()
+
+    runtime_thread = Process(
+        target=start_runtime,
+        args=(args, cancel_event),
+        daemon=True,
+    )
+    runtime_thread.start()
+
+    assert AsyncNewLoopRuntime.wait_for_ready_or_shutdown(
+        timeout=5.0,
+        ctrl_address=f'{args.host}:{args.port_in}',
+        ready_or_shutdown_event=Event(),
+    )
+
+    with grpc.insecure_channel(
+        uds_address,
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        response = stub.process_single_data(_create_test_data_message())
+
+    cancel_event.set()
+    runtime_thread.join()
+
+    assert response
+    assert not os.path.exists(uds_address[len('unix:') :])
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+def test_worker_runtime_compression():
+    args = set_pod_parser().parse_args(
+        ['--compression', 'GZIP', '--compression-min-bytes', '0']
+    )
+
+    cancel_event = multiprocessing.Event()
+
+    def start_runtime(args, cancel_event):
+        with WorkerRuntime(args, cancel_event) as runtime:
+            runtime.run_forever()
+
+    runtime_thread = Process(
+        target=start_runtime,
+        args=(args, cancel_event),
+        daemon=True,
+    )
+    runtime_thread.start()
+
+    assert AsyncNewLoopRuntime.wait_for_ready_or_shutdown(
+        timeout=5.0,
+        ctrl_address=f'{args.host}:{args.port_in}',
+        ready_or_shutdown_event=Event(),
+    )
+
+    with grpc.insecure_channel(
+        f'{args.host}:{args.port_in}',
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        response = stub.process_single_data(
+            _create_test_data_message(), compression=grpc.Compression.Gzip
+        )
+
+    cancel_event.set()
+    runtime_thread.join()
+
+    assert len(response.docs) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+def test_worker_runtime_expired_request():
+    args = set_pod_parser().parse_args(['--uses', 'SlowNewDocsExecutor'])
+
+    cancel_event = multiprocessing.Event()
+
+    def start_runtime(args, cancel_event):
+        with WorkerRuntime(args, cancel_event) as runtime:
+            runtime.run_forever()
+
+    runtime_thread = Process(
+        target=start_runtime,
+        args=(args, cancel_event),
+        daemon=True,
+    )
+    runtime_thread.start()
+
+    assert AsyncNewLoopRuntime.wait_for_ready_or_shutdown(
+        timeout=5.0,
+        ctrl_address=f'{args.host}:{args.port_in}',
+        ready_or_shutdown_event=Event(),
+    )
+
+    request = _create_test_data_message()
+    request.header.timeout = int(time.time()) - 1
+    with grpc.insecure_channel(
+        f'{args.host}:{args.port_in}',
+        options=GrpcConnectionPool.get_default_grpc_options(),
+    ) as channel:
+        stub = jina_pb2_grpc.JinaSingleDataRequestRPCStub(channel)
+        response, call = stub.process_single_data.with_call(request)
+
+    cancel_event.set()
+    runtime_thread.join()
+
+    assert response.header.status.code == jina_pb2.StatusProto.ERROR
+    assert response.header.status.exception.name == 'DeadlineExceeded'
+    assert 'is-error' in dict(call.trailing_metadata())
+
+
 class AsyncSlowNewDocsExecutor(Executor):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -37,3 +37,34 @@ async def test_iter_requests():
     task.cancel()
     # ideally count will be 20, but to avoid flaky CI
     assert count > 15
+
+
+@pytest.mark.asyncio
+async def test_iter_requests_bounded_prefetch(monkeypatch):
+    monkeypatch.setattr(AsyncRequestsIterator, 'MAX_PREFETCHED_REQUESTS', 5)
+    produced = 0
+
+    def counting_generator():
+        nonlocal produced
+        for i in range(100):
+            produced += 1
+            yield i
+
+    requests = AsyncRequestsIterator(counting_generator())
+    assert await requests.__anext__() == 0
+    await asyncio.sleep(0.2)
+    # the buffer is full and the producer waits with the next item
+    assert produced == 7
+    assert [r async for r in requests] == list(range(1, 100))
+
+
+@pytest.mark.asyncio
+async def test_iter_requests_error():
+    def failing_generator():
+        yield 0
+        raise ValueError('bad input')
+
+    requests = AsyncRequestsIterator(failing_generator())
+    assert await requests.__anext__() == 0
+    with pytest.raises(ValueError):
+        await requests.__anext__()
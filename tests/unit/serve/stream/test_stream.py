@@ -3,7 +3,8 @@ import pytest
 
 from jina import Document, DocumentArray
 from jina.helper import Namespace, random_identity
-from jina.serve.stream import RequestStreamer
+from jina.serve.stream import PrefetchWindowPolicy, RequestStreamer
+from jina.serve.stream.helper import _PrefetchWindow
 from jina.types.request.data import DataRequest
 
 
@@ -82,3 +83,108 @@ async def test_request_streamer(prefetch, num_requests, async_iterator):
         assert r.docs[0].tags['result_handled']
 
     assert num_responses == num_requests
+
+
+@pytest.mark.asyncio
+async def test_request_streamer_prefetch_window():
+    in_flight = []
+    max_in_flight = 0
+    latency = 0.05
+
+    def request_handler_fn(request):
+        nonlocal max_in_flight
+        in_flight.append(request)
+        max_in_flight = max(max_in_flight, len(in_flight))
+
+        async def task():
+            await asyncio.sleep(latency)
+            in_flight.remove(request)
+            return request
+
+        return asyncio.ensure_future(task())
+
+    def _get_requests_iterator(num_requests):
+        for _ in range(num_requests):
+            req = DataRequest()
+            req.data.docs = DocumentArray([Document(text='a' * 1000)])
+            yield req
+
+    args = Namespace()
+    args.prefetch = 0
+    args.prefetch_window = '{"initial_size": 2, "max_size": 4}'
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda result: result,
+    )
+
+    # the window grows while the latency stays flat
+    num_responses = 0
+    async for _ in streamer.stream(_get_requests_iterator(50)):
+        num_responses += 1
+        assert len(streamer.prefetch_windows) == 1
+    assert num_responses == 50
+    assert max_in_flight == 4
+    assert streamer.prefetch_windows == []
+
+    # the bytes in flight are bounded independently of the window
+    args.prefetch_window = '{"initial_size": 4, "max_bytes": 2500}'
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda result: result,
+    )
+    max_in_flight = 0
+    async for _ in streamer.stream(_get_requests_iterator(10)):
+        assert streamer.prefetch_windows[0]['bytes_in_flight'] <= 2500
+    assert max_in_flight == 2
+
+
+def test_prefetch_window_shrinks_with_latency():
+    window = _PrefetchWindow(PrefetchWindowPolicy(initial_size=10))
+    window.update_latency(0.01)
+    window.update_latency(0.1)
+    assert window.size == 9
+    # requests which were in flight while the window shrank do not shrink it again
+    window.update_latency(0.1)
+    assert window.size == 9
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [0, 3])
+async def test_request_streamer_results_in_order(prefetch):
+    num_requests = 20
+    sent = []
+
+    def request_handler_fn(request):
+        index = len(sent)
+        sent.append(request)
+
+        async def task():
+            # later requests complete first
+            await asyncio.sleep(0.05 * (1 - (index % 5) / 5))
+            return request
+
+        return asyncio.ensure_future(task())
+
+    def _get_requests_iterator():
+        for _ in range(num_requests):
+            yield DataRequest()
+
+    args = Namespace()
+    args.prefetch = prefetch
+    streamer = RequestStreamer(
+        args=args,
+        request_handler=request_handler_fn,
+        result_handler=lambda result: result,
+    )
+    streamer.REORDER_BUFFER_SIZE = 4
+    responses = []
+    async for r in streamer.stream(_get_requests_iterator(), results_in_order=True):
+        # the requests sent but not yet yielded are bounded by the buffer
+        assert len(sent) - len(responses) <= (prefetch or 4)
+        responses.append(r)
+
+    assert [r.header.request_id for r in responses] == [
+        r.header.request_id for r in sent
+    ]
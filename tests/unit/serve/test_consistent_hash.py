@@ -0,0 +1,51 @@
+from collections import Counter
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.serve.consistent_hash import ConsistentHashRing, split_requests_by_shard
+
+
+def test_consistent_hash_ring_distribution():
+    ring = ConsistentHashRing(range(4))
+    counts = Counter(ring.get_shard_id(str(i)) for i in range(10000))
+
+    assert set(counts) == {0, 1, 2, 3}
+    assert all(1500 < count < 3500 for count in counts.values())
+    # the mapping does not depend on the process
+    assert ring.get_shard_id('doc') == ConsistentHashRing([3, 2, 1, 0]).get_shard_id(
+        'doc'
+    )
+
+
+def test_consistent_hash_ring_resharding():
+    keys = [str(i) for i in range(10000)]
+    ring = ConsistentHashRing(range(4))
+    resharded_ring = ConsistentHashRing(range(5))
+
+    moved = [
+        key
+        for key in keys
+        if ring.get_shard_id(key) != resharded_ring.get_shard_id(key)
+    ]
+    # only keys of the new shard moved
+    assert all(resharded_ring.get_shard_id(key) == 4 for key in moved)
+    assert len(moved) < 0.3 * len(keys)
+
+
+def test_split_requests_by_shard():
+    docs = DocumentArray([Document(id=str(i), tags={'user': i % 3}) for i in range(30)])
+    request = list(request_generator('/index', docs))[0]
+    request.parameters = {'key': 'value'}
+    ring = ConsistentHashRing(range(3))
+
+    shard_requests = split_requests_by_shard([request], ring)
+    assert sum(len(r[0].docs) for r in shard_requests.values()) == 30
+    for shard_id, (shard_request,) in shard_requests.items():
+        assert shard_request.header.exec_endpoint == '/index'
+        assert shard_request.parameters == {'key': 'value'}
+        assert all(ring.get_shard_id(doc.id) == shard_id for doc in shard_request.docs)
+
+    shard_requests = split_requests_by_shard([request], ring, hash_key='user')
+    for shard_id, (shard_request,) in shard_requests.items():
+        users = {doc.tags['user'] for doc in shard_request.docs}
+        assert all(ring.get_shard_id(str(user)) == shard_id for user in users)
@@ -0,0 +1,68 @@
+import pytest
+
+from jina import Document, DocumentArray
+from jina.serve.media_types import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE,
+    get_accepted_media_type,
+    get_media_type,
+    request_from_bytes,
+    request_to_bytes,
+)
+from jina.types.request.data import DataRequest
+
+
+def _create_request():
+    req = DataRequest()
+    req.header.exec_endpoint = '/search'
+    req.parameters = {'limit': 3}
+    req.data.docs = DocumentArray(
+        [Document(id='doc0', text='hello', embedding=[1.0, 2.0]), Document(id='doc1')]
+    )
+    return req
+
+
+@pytest.mark.parametrize('media_type', [PROTOBUF_MEDIA_TYPE, MSGPACK_MEDIA_TYPE])
+def test_request_round_trip(media_type):
+    if media_type == MSGPACK_MEDIA_TYPE:
+        pytest.importorskip('msgpack')
+    req = _create_request()
+    received = request_from_bytes(request_to_bytes(req, media_type), media_type)
+
+    assert received.header.exec_endpoint == '/search'
+    assert received.header.request_id == req.header.request_id
+    assert received.parameters == {'limit': 3}
+    assert received.docs[:, 'id'] == ['doc0', 'doc1']
+    assert received.docs[0].text == 'hello'
+    assert list(received.docs[0].embedding) == [1.0, 2.0]
+
+
+def test_request_to_bytes_rejects_json():
+    with pytest.raises(ValueError):
+        request_to_bytes(_create_request(), JSON_MEDIA_TYPE)
+
+
+@pytest.mark.parametrize(
+    'content_type, expected',
+    [
+        (None, None),
+        ('application/json', JSON_MEDIA_TYPE),
+        ('Application/X-Protobuf; charset=binary', PROTOBUF_MEDIA_TYPE),
+    ],
+)
+def test_get_media_type(content_type, expected):
+    assert get_media_type(content_type) == expected
+
+
+@pytest.mark.parametrize(
+    'accept, expected',
+    [
+        (None, PROTOBUF_MEDIA_TYPE),
+        ('*/*', PROTOBUF_MEDIA_TYPE),
+        ('text/html, application/json;q=0.9', JSON_MEDIA_TYPE),
+        ('application/x-protobuf', PROTOBUF_MEDIA_TYPE),
+    ],
+)
+def test_get_accepted_media_type(accept, expected):
+    assert get_accepted_media_type(accept, default=PROTOBUF_MEDIA_TYPE) == expected
@@ -1,4 +1,5 @@
 import os
+import socket
 import asyncio
 import multiprocessing
 import time
@@ -9,10 +10,18 @@ import pytest
 
 from jina import DocumentArray, Document
 from jina.clients.request import request_generator
-from jina.enums import PollingType
+from jina.enums import CompressionType, PollingType, LoadBalancingType
 from jina.helper import random_port
-from jina.serve.networking import ReplicaList, GrpcConnectionPool
+from jina.serve.networking import (
+    ReplicaList,
+    GrpcConnectionPool,
+    ConcurrencyLimitPolicy,
+    RetryPolicy,
+    _channel_cache,
+)
 from jina.proto import jina_pb2_grpc
+from jina.serve.runtimes.asyncio import DataRequestStreamMixin
+from jina.serve.shared_memory import is_shared_memory_supported
 from jina.types.request.control import ControlRequest
 
 
@@ -58,6 +67,453 @@ async def test_connection_list(mocker, monkeypatch):
     await connection_list.close()
 
 
+@pytest.mark.asyncio
+async def test_connection_list_least_outstanding(mocker, monkeypatch):
+    await _mock_grpc_distinct_stubs(mocker, monkeypatch)
+    connection_list = ReplicaList(load_balancing=LoadBalancingType.LEAST_OUTSTANDING)
+    connection_list.add_connection(address='1.1.1.1')
+    connection_list.add_connection(address='1.1.1.2')
+    connection_list.add_connection(address='1.1.1.3')
+
+    busy = connection_list.get_next_connection()
+    connection_list.record_request_start(busy)
+    connection_list.record_request_start(busy)
+    slow = connection_list.get_next_connection()
+    assert slow is not busy
+    connection_list.record_request_start(slow)
+    connection_list.record_request_end(slow, latency=1.0)
+
+    # the idle replica with the lowest latency is selected, independent of the order
+    for _ in range(5):
+        selected = connection_list.get_next_connection()
+        assert selected is not busy
+        assert selected is not slow
+
+    connection_list.record_request_end(busy, latency=0.1)
+    connection_list.record_request_end(busy, latency=0.1)
+    assert connection_list.get_connection_stats(busy).in_flight == 0
+    assert connection_list.get_connection_stats(busy).ewma_latency > 0
+    await connection_list.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_list_power_of_two(mocker, monkeypatch):
+    await _mock_grpc_distinct_stubs(mocker, monkeypatch)
+    connection_list = ReplicaList(load_balancing=LoadBalancingType.POWER_OF_TWO)
+    connection_list.add_connection(address='1.1.1.1')
+    only_connection = connection_list.get_next_connection()
+    assert connection_list.get_next_connection() is only_connection
+
+    connection_list.add_connection(address='1.1.1.2')
+    connection_list.record_request_start(only_connection)
+    connection_list.record_request_end(only_connection, latency=1.0)
+    connection_list.record_request_start(only_connection)
+
+    # with two replicas both are always compared, the idle one has to win
+    for _ in range(5):
+        assert connection_list.get_next_connection() is not only_connection
+    await connection_list.close()
+
+
+def _fail_requests(connection_list, connection, num_requests):
+    for _ in range(num_requests):
+        connection_list.record_request_start(connection)
+        connection_list.record_request_end(connection, failed=True)
+
+
+@pytest.mark.asyncio
+async def test_connection_list_outlier_ejection(mocker, monkeypatch):
+    await _mock_grpc_distinct_stubs(mocker, monkeypatch)
+    connection_list = ReplicaList()
+    connection_list.EJECTION_BASE_TIME = 0.2
+    connection_list.add_connection(address='1.1.1.1')
+    connection_list.add_connection(address='1.1.1.2')
+    sick, healthy = connection_list.get_all_connections()
+
+    _fail_requests(
+        connection_list, sick, connection_list.EJECTION_CONSECUTIVE_FAILURES - 1
+    )
+    assert connection_list.num_ejected == 0
+    _fail_requests(connection_list, sick, 1)
+    assert connection_list.num_ejected == 1
+    for _ in range(4):
+        assert connection_list.get_next_connection() is healthy
+
+    # the last healthy replica is never ejected
+    _fail_requests(connection_list, healthy, 10)
+    assert connection_list.num_ejected == 1
+    connection_list.record_request_start(healthy)
+    connection_list.record_request_end(healthy, latency=0.01)
+
+    # after the cooldown a single probe is sent, its failure doubles the cooldown
+    await asyncio.sleep(0.3)
+    assert connection_list.get_next_connection() is sick
+    connection_list.record_request_start(sick)
+    assert connection_list.get_next_connection() is healthy
+    assert connection_list.get_next_connection() is healthy
+    connection_list.record_request_end(sick, failed=True)
+    assert connection_list.get_connection_stats(sick).ejection_count == 2
+    await asyncio.sleep(0.3)
+    assert connection_list.get_next_connection() is healthy
+    assert connection_list.get_next_connection() is healthy
+
+    # a successful probe returns the replica to the rotation
+    await asyncio.sleep(0.2)
+    probe = connection_list.get_next_connection()
+    assert probe is sick
+    connection_list.record_request_start(sick)
+    connection_list.record_request_end(sick, latency=0.01)
+    assert connection_list.num_ejected == 0
+    assert {
+        connection_list.get_next_connection(),
+        connection_list.get_next_connection(),
+    } == {sick, healthy}
+    await connection_list.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_list_error_rate_ejection(mocker, monkeypatch):
+    await _mock_grpc_distinct_stubs(mocker, monkeypatch)
+    connection_list = ReplicaList(load_balancing=LoadBalancingType.LEAST_OUTSTANDING)
+    connection_list.add_connection(address='1.1.1.1')
+    connection_list.add_connection(address='1.1.1.2')
+    flaky, healthy = connection_list.get_all_connections()
+
+    # alternating failures never reach the consecutive threshold, but the error rate
+    for i in range(connection_list.EJECTION_MIN_REQUESTS):
+        connection_list.record_request_start(flaky)
+        if i % 2:
+            connection_list.record_request_end(flaky, failed=True)
+        else:
+            connection_list.record_request_end(flaky, latency=0.01)
+    assert connection_list.get_connection_stats(flaky).is_ejected
+    for _ in range(4):
+        assert connection_list.get_next_connection() is healthy
+
+    # cancelled requests are not counted
+    connection_list.record_request_start(healthy)
+    connection_list.record_request_end(healthy)
+    assert connection_list.get_connection_stats(healthy).outcomes.count(False) == 0
+    await connection_list.close()
+
+
+class _DelayedCall:
+    def __init__(self, delay, response):
+        self._delay = delay
+        self._response = response
+
+    async def trailing_metadata(self):
+        await asyncio.sleep(self._delay)
+        return ()
+
+    def __await__(self):
+        async def _response():
+            return self._response
+
+        return _response().__await__()
+
+
+async def _mock_grpc_with_delays(mocker, monkeypatch, delays):
+    def create_async_channel_mock(address, *args, **kwargs):
+        single_data_stub = mocker.Mock()
+        single_data_stub.process_single_data = (
+            lambda request, metadata=None: _DelayedCall(delays[address], address)
+        )
+        channel_mock = mocker.Mock()
+
+        async def close_mock(*args):
+            pass
+
+        channel_mock.close = close_mock
+        return single_data_stub, mocker.Mock(), mocker.Mock(), channel_mock
+
+    monkeypatch.setattr(
+        GrpcConnectionPool, 'create_async_channel_stub', create_async_channel_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_hedging(mocker, monkeypatch):
+    await _mock_grpc_with_delays(mocker, monkeypatch, {'slow:53': 1.0, 'fast:53': 0.01})
+    pool = GrpcConnectionPool(hedging={'/search': 50})
+    pool.add_connection(deployment='encoder', address='slow:53')
+    pool.add_connection(deployment='encoder', address='fast:53')
+
+    # round robin selects the slow replica first, the hedged request to the fast one wins
+    response, _ = await pool.send_requests_once(
+        [_create_test_data_message()], deployment='encoder', endpoint='/search'
+    )
+    assert response == 'fast:53'
+    assert pool.hedges_issued == 1
+    assert pool.hedges_won == 1
+
+    # the hedge advanced the round robin, so the slow replica is selected and hedged again
+    response, _ = await pool.send_requests_once(
+        [_create_test_data_message()], deployment='encoder', endpoint='/search'
+    )
+    assert response == 'fast:53'
+    assert pool.hedges_issued == 2
+    assert pool.hedges_won == 2
+
+    # endpoints without hedging wait for the selected replica
+    response, _ = await pool.send_requests_once(
+        [_create_test_data_message()], deployment='encoder', endpoint='/index'
+    )
+    assert response == 'slow:53'
+    assert pool.hedges_issued == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_hedging_percentile(mocker, monkeypatch):
+    await _mock_grpc_with_delays(mocker, monkeypatch, {'a:53': 0, 'b:53': 0})
+    pool = GrpcConnectionPool(hedging={'/search': 'p95', '*': 20})
+    pool.add_connection(deployment='encoder', address='a:53')
+    pool.add_connection(deployment='encoder', address='b:53')
+    replica_list = pool._connections.get_replicas('encoder', head=False)
+    assert pool._get_hedging_delay(replica_list, '/search') is None
+    for latency in range(1, 101):
+        connection = replica_list.get_next_connection()
+        replica_list.record_request_start(connection)
+        replica_list.record_request_end(connection, latency / 1000)
+    assert replica_list.get_latency_percentile(95) == pytest.approx(0.095)
+    assert pool._get_hedging_delay(replica_list, '/search') == pytest.approx(0.095)
+    assert pool._get_hedging_delay(replica_list, '/index') == pytest.approx(0.02)
+
+    await pool.close()
+
+    with pytest.raises(ValueError):
+        GrpcConnectionPool(hedging={'/search': 'p101'})
+
+
+class _FailingCall:
+    def __init__(self, code):
+        self._code = code
+
+    async def trailing_metadata(self):
+        raise grpc.aio.AioRpcError(self._code, grpc.aio.Metadata(), grpc.aio.Metadata())
+
+    def __await__(self):
+        return self.trailing_metadata().__await__()
+
+
+async def _mock_grpc_with_codes(mocker, monkeypatch, codes):
+    def create_async_channel_mock(address, *args, **kwargs):
+        single_data_stub = mocker.Mock()
+        single_data_stub.process_single_data = lambda request, metadata=None: (
+            _FailingCall(codes[address]) if codes[address] else _DelayedCall(0, address)
+        )
+        channel_mock = mocker.Mock()
+
+        async def close_mock(*args):
+            pass
+
+        channel_mock.close = close_mock
+        return single_data_stub, mocker.Mock(), mocker.Mock(), channel_mock
+
+    monkeypatch.setattr(
+        GrpcConnectionPool, 'create_async_channel_stub', create_async_channel_mock
+    )
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_retry_on_different_replica(mocker, monkeypatch):
+    await _mock_grpc_with_codes(
+        mocker,
+        monkeypatch,
+        {'down:53': grpc.StatusCode.UNAVAILABLE, 'up:53': None},
+    )
+    pool = GrpcConnectionPool(retry_policy=RetryPolicy(initial_backoff=0))
+    pool.add_connection(deployment='encoder', address='down:53')
+    pool.add_connection(deployment='encoder', address='up:53')
+
+    response, _ = await pool.send_requests_once(
+        [_create_test_data_message()], deployment='encoder'
+    )
+    assert response == 'up:53'
+    assert pool.retries == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_retry_policy_status_codes(mocker, monkeypatch):
+    await _mock_grpc_with_codes(
+        mocker, monkeypatch, {'broken:53': grpc.StatusCode.INTERNAL}
+    )
+    pool = GrpcConnectionPool(
+        retry_policy=RetryPolicy(
+            max_attempts=4, initial_backoff=0, retryable_status_codes=['internal']
+        )
+    )
+    pool.add_connection(deployment='encoder', address='broken:53')
+    with pytest.raises(grpc.aio.AioRpcError):
+        await pool.send_requests_once(
+            [_create_test_data_message()], deployment='encoder'
+        )
+    assert pool.retries == 3
+
+    # the default policy only retries UNAVAILABLE
+    default_pool = GrpcConnectionPool()
+    default_pool.add_connection(deployment='encoder', address='broken:53')
+    with pytest.raises(grpc.aio.AioRpcError):
+        await default_pool.send_requests_once(
+            [_create_test_data_message()], deployment='encoder'
+        )
+    assert default_pool.retries == 0
+    await pool.close()
+    await default_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_request_deadline(mocker, monkeypatch):
+    calls = []
+
+    def create_async_channel_mock(address, *args, **kwargs):
+        def process_single_data(request, metadata=None, **kwargs):
+            calls.append(kwargs)
+            return _DelayedCall(0, address)
+
+        single_data_stub = mocker.Mock()
+        single_data_stub.process_single_data = process_single_data
+        channel_mock = mocker.Mock()
+
+        async def close_mock(*args):
+            pass
+
+        channel_mock.close = close_mock
+        return single_data_stub, mocker.Mock(), mocker.Mock(), channel_mock
+
+    monkeypatch.setattr(
+        GrpcConnectionPool, 'create_async_channel_stub', create_async_channel_mock
+    )
+    pool = GrpcConnectionPool()
+    pool.add_connection(deployment='encoder', address='encoder:53')
+
+    # the time left until the deadline is the timeout of the call
+    request = _create_test_data_message()
+    request.header.timeout = int(time.time()) + 60
+    response, _ = await pool.send_requests_once([request], deployment='encoder')
+    assert response == 'encoder:53'
+    assert 0 < calls[-1]['timeout'] <= 60
+
+    # an expired request is not sent
+    request = _create_test_data_message()
+    request.header.timeout = int(time.time()) - 1
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await pool.send_requests_once([request], deployment='encoder')
+    assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert len(calls) == 1
+    await pool.close()
+
+
+def test_retry_policy():
+    policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3, jitter=False)
+    assert [policy.get_backoff(attempt) for attempt in range(4)] == pytest.approx(
+        [0.1, 0.2, 0.3, 0.3]
+    )
+    jittered = RetryPolicy(initial_backoff=0.1)
+    assert all(0 <= jittered.get_backoff(1) <= 0.2 for _ in range(20))
+
+    budget = RetryPolicy(retry_budget=0.5).create_budget()
+    for _ in range(RetryPolicy.RETRY_BUDGET_BURST):
+        assert budget.try_retry()
+    assert not budget.try_retry()
+    budget.record_request()
+    assert not budget.try_retry()
+    budget.record_request()
+    assert budget.try_retry()
+    assert RetryPolicy(retry_budget=None).create_budget() is None
+
+    with pytest.raises(ValueError):
+        RetryPolicy(retryable_status_codes=['NOT_A_CODE'])
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter():
+    limiter = ConcurrencyLimitPolicy(
+        initial_limit=2,
+        max_limit=4,
+        max_queue_size=1,
+        queue_timeout=0.1,
+        backoff_ratio=0.5,
+    ).create_limiter()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    # the third request waits for a slot, the fourth one is rejected
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+    limiter.release(latency=0.01)
+    await waiting
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 0
+
+    # a request which waits too long for a slot fails
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert limiter.queue_depth == 0
+
+    # low latency grows the limit additively up to the maximum
+    for _ in range(20):
+        limiter.release(latency=0.01)
+        await limiter.acquire()
+    assert limiter.limit == 4
+
+    # a latency far above the lowest one shrinks the limit multiplicatively
+    limiter.release(latency=1.0)
+    assert limiter.limit == 2
+    await limiter.acquire()
+
+    # so does an overloaded deployment, but only once per latency
+    error = grpc.aio.AioRpcError(
+        grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.aio.Metadata(), grpc.aio.Metadata()
+    )
+    limiter._last_decrease = 0
+    limiter.release(error=error)
+    assert limiter.limit == 1
+    limiter.release(error=error)
+    assert limiter.limit == 1
+
+    with pytest.raises(ValueError):
+        ConcurrencyLimitPolicy(initial_limit=0)
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_concurrency_limit(mocker, monkeypatch):
+    await _mock_grpc_with_delays(mocker, monkeypatch, {'a:53': 0.1})
+    pool = GrpcConnectionPool(
+        concurrency_limit=ConcurrencyLimitPolicy(initial_limit=2, max_queue_size=1)
+    )
+    pool.add_connection(deployment='encoder', address='a:53')
+
+    tasks = [
+        pool.send_requests_once([_create_test_data_message()], deployment='encoder')
+        for _ in range(4)
+    ]
+    await asyncio.sleep(0.05)
+    assert pool.concurrency_limits['encoder'] == {
+        'limit': 2,
+        'in_flight': 2,
+        'queue_depth': 1,
+    }
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert [r for r in results if isinstance(r, grpc.aio.AioRpcError)][
+        0
+    ].code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert len([r for r in results if not isinstance(r, Exception)]) == 3
+    assert pool.concurrency_limits['encoder']['in_flight'] == 0
+    await pool.close()
+
+
 def mock_send(mock):
     mock()
     return None
@@ -237,6 +693,21 @@ async def _mock_grpc(mocker, monkeypatch):
     return close_mock_object, create_mock
 
 
+async def _mock_grpc_distinct_stubs(mocker, monkeypatch):
+    def create_async_channel_mock(*args, **kwargs):
+        channel_mock = mocker.Mock()
+
+        async def close_mock(*args):
+            pass
+
+        channel_mock.close = close_mock
+        return mocker.Mock(), mocker.Mock(), mocker.Mock(), channel_mock
+
+    monkeypatch.setattr(
+        GrpcConnectionPool, 'create_async_channel_stub', create_async_channel_mock
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(5)
@@ -321,6 +792,258 @@ async def test_grpc_connection_pool_real_sending():
     server_process2.join()
 
 
+def test_get_local_uds_address():
+    assert GrpcConnectionPool.get_local_uds_address(
+        'localhost:8080'
+    ) == GrpcConnectionPool.get_uds_address(8080)
+    assert GrpcConnectionPool.get_local_uds_address(
+        '0.0.0.0:8080'
+    ) == GrpcConnectionPool.get_uds_address(8080)
+    assert GrpcConnectionPool.get_local_uds_address('8.8.8.8:8080') is None
+    assert GrpcConnectionPool.get_local_uds_address('localhost') is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+@pytest.mark.skipif(os.name == 'nt', reason='unix domain sockets are not supported')
+async def test_grpc_connection_pool_uds():
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_control(self, request, context):
+                context.set_trailing_metadata((('peer', context.peer()),))
+                return request
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+
+            jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+            grpc_server.add_insecure_port(GrpcConnectionPool.get_uds_address(port))
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    async def get_peer(pool):
+        pool.add_connection(
+            deployment='encoder', head=False, address=f'localhost:{port}'
+        )
+        _, metadata = await pool.send_request(
+            request=ControlRequest(command='STATUS'), deployment='encoder', head=False
+        )[0]
+        await pool.close()
+        return dict(metadata)['peer']
+
+    assert (await get_peer(GrpcConnectionPool(uds=True))).startswith('unix:')
+    assert not (await get_peer(GrpcConnectionPool())).startswith('unix:')
+
+    server_process.kill()
+    server_process.join()
+    os.unlink(GrpcConnectionPool.get_uds_address(port)[len('unix:') :])
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+@pytest.mark.skipif(os.name == 'nt', reason='unix domain sockets are not supported')
+@pytest.mark.parametrize('stale_socket', [False, True])
+async def test_grpc_connection_pool_uds_fall_back_to_tcp(stale_socket):
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_control(self, request, context):
+                context.set_trailing_metadata((('peer', context.peer()),))
+                return request
+
+        async def start_grpc_server():
+            # like a runtime started with `--disable-uds`
+            grpc_server = grpc.aio.server()
+
+            jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    uds_path = GrpcConnectionPool.get_uds_address(port)[len('unix:') :]
+    if stale_socket:
+        # a socket file nobody listens on, left behind by a runtime which was killed
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(uds_path)
+        sock.close()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    pool = GrpcConnectionPool(uds=True)
+    pool.add_connection(deployment='encoder', head=False, address=f'localhost:{port}')
+    for _ in range(2):
+        _, metadata = await pool.send_request(
+            request=ControlRequest(command='STATUS'), deployment='encoder', head=False
+        )[0]
+        assert not dict(metadata)['peer'].startswith('unix:')
+    await pool.close()
+
+    server_process.kill()
+    server_process.join()
+    if stale_socket:
+        os.unlink(uds_path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+@pytest.mark.skipif(
+    not is_shared_memory_supported(), reason='shared memory is not supported'
+)
+async def test_grpc_connection_pool_shared_memory():
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_single_data(self, request, context):
+                documents = request.proto.data.WhichOneof('documents')
+                context.set_trailing_metadata(
+                    (('documents', documents), ('num_docs', str(len(request.docs))))
+                )
+                return request
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+
+            jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+            grpc_server.add_insecure_port(GrpcConnectionPool.get_uds_address(port))
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    async def send(pool):
+        pool.add_connection(
+            deployment='encoder', head=False, address=f'localhost:{port}'
+        )
+        request = list(
+            request_generator(
+                '/',
+                DocumentArray([Document(text='a' * 1024) for _ in range(100)]),
+            )
+        )[0]
+        response, metadata = await pool.send_request(
+            request=request, deployment='encoder', head=False
+        )[0]
+        await pool.close()
+        return response, dict(metadata)
+
+    response, metadata = await send(GrpcConnectionPool(uds=True, shared_memory=True))
+    assert metadata['documents'] == 'docs_shm'
+    assert metadata['num_docs'] == '100'
+    # the response referenced the segment of the request and was inlined before the segment was removed
+    assert len(response.docs) == 100
+    assert not [
+        name
+        for name in os.listdir('/dev/shm')
+        if name.startswith(f'jina-shm-{os.getpid()}-')
+    ]
+
+    _, metadata = await send(GrpcConnectionPool(shared_memory=True))
+    assert metadata['documents'] == 'docs'
+
+    server_process.kill()
+    server_process.join()
+    os.unlink(GrpcConnectionPool.get_uds_address(port)[len('unix:') :])
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(5)
+async def test_grpc_connection_pool_compression():
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_single_data(self, request, context):
+                context.set_compression(grpc.Compression.Gzip)
+                return request
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+
+            jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    pool = GrpcConnectionPool(
+        compression=CompressionType.GZIP, compression_min_bytes=4096
+    )
+    pool.add_connection(deployment='encoder', head=False, address=f'localhost:{port}')
+
+    small_request = _create_test_data_message()
+    response, _ = await pool.send_request(
+        request=small_request, deployment='encoder', head=False
+    )[0]
+    assert len(response.docs) == 10
+    assert pool.compression.raw_bytes == 0
+    assert pool.compression.uncompressed_bytes == small_request.proto.ByteSize()
+
+    large_request = list(
+        request_generator(
+            '/', DocumentArray([Document(text='a' * 1024) for _ in range(100)])
+        )
+    )[0]
+    response, _ = await pool.send_request(
+        request=large_request, deployment='encoder', head=False
+    )[0]
+    assert len(response.docs) == 100
+    assert response.docs[0].text == 'a' * 1024
+    assert pool.compression.raw_bytes == large_request.proto.ByteSize()
+    assert 0 < pool.compression.compressed_bytes < pool.compression.raw_bytes / 10
+
+    await pool.close()
+    server_process.kill()
+    server_process.join()
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 @pytest.mark.timeout(5)
@@ -386,6 +1109,169 @@ async def test_secure_send_request(private_key_cert_chain):
     server_process1.join()
 
 
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+async def test_send_request_reuses_channels(mocker):
+    server_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event):
+        class DummyServer:
+            async def process_control(self, request, *args):
+                returned_msg = ControlRequest(command='DEACTIVATE')
+                return returned_msg
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+            jina_pb2_grpc.add_JinaControlRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    port = random_port()
+    server_process = Process(target=listen, args=(port, server_ready_event))
+    server_process.start()
+    server_ready_event.wait()
+
+    _channel_cache.clear()
+    create_channel_spy = mocker.spy(GrpcConnectionPool, 'get_grpc_channel')
+    sent_msg = ControlRequest(command='STATUS')
+    for _ in range(3):
+        result = GrpcConnectionPool.send_request_sync(sent_msg, f'localhost:{port}')
+        assert result.command == 'DEACTIVATE'
+    for _ in range(3):
+        result = await GrpcConnectionPool.send_request_async(
+            sent_msg, f'localhost:{port}'
+        )
+        assert result.command == 'DEACTIVATE'
+    # the async sends use the same cached channel
+    assert create_channel_spy.call_count == 1
+    assert len(_channel_cache) == 1
+
+    server_process.kill()
+    server_process.join()
+
+    # channels to an unavailable target are discarded
+    with pytest.raises(grpc.RpcError):
+        GrpcConnectionPool.send_request_sync(
+            sent_msg,
+            f'localhost:{port}',
+            timeout=1.0,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+    assert len(_channel_cache) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.timeout(10)
+async def test_grpc_connection_pool_data_streaming():
+    streaming_ready_event = multiprocessing.Event()
+    unary_ready_event = multiprocessing.Event()
+
+    def listen(port, event: multiprocessing.Event, streaming: bool):
+        class DummyServer(DataRequestStreamMixin):
+            async def process_single_data(self, request, context):
+                context.set_trailing_metadata((('transport', 'unary'),))
+                return request
+
+            async def process_data(self, requests, context):
+                endpoint = dict(context.invocation_metadata()).get('endpoint', '/')
+                if endpoint == '/fail':
+                    raise ValueError('fail')
+                context.set_trailing_metadata(
+                    (('transport', 'stream'), ('endpoint', endpoint))
+                )
+                return requests[0]
+
+        async def start_grpc_server():
+            grpc_server = grpc.aio.server()
+            jina_pb2_grpc.add_JinaSingleDataRequestRPCServicer_to_server(
+                DummyServer(), grpc_server
+            )
+            if streaming:
+                jina_pb2_grpc.add_JinaDataRequestStreamRPCServicer_to_server(
+                    DummyServer(), grpc_server
+                )
+            grpc_server.add_insecure_port(f'localhost:{port}')
+
+            await grpc_server.start()
+            event.set()
+            await grpc_server.wait_for_termination()
+
+        asyncio.run(start_grpc_server())
+
+    streaming_port = random_port()
+    streaming_process = Process(
+        target=listen, args=(streaming_port, streaming_ready_event, True)
+    )
+    streaming_process.start()
+    unary_port = random_port()
+    unary_process = Process(target=listen, args=(unary_port, unary_ready_event, False))
+    unary_process.start()
+    streaming_ready_event.wait()
+    unary_ready_event.wait()
+
+    pool = GrpcConnectionPool(data_streaming=True)
+    pool.add_connection(
+        deployment='streaming', head=False, address=f'localhost:{streaming_port}'
+    )
+    pool.add_connection(
+        deployment='unary', head=False, address=f'localhost:{unary_port}'
+    )
+
+    # the first response establishes the stream
+    response, metadata = await pool.send_request(
+        request=_create_test_data_message(), deployment='streaming', head=False
+    )[0]
+    assert metadata['transport'] == 'stream'
+
+    # concurrent requests are multiplexed over the same stream and matched to their responses
+    sent_requests = [_create_test_data_message() for _ in range(10)]
+    results = await asyncio.gather(
+        *[
+            pool.send_request(
+                request=request, deployment='streaming', head=False, endpoint='/index'
+            )[0]
+            for request in sent_requests
+        ]
+    )
+    for request, (response, metadata) in zip(sent_requests, results):
+        assert response.header.request_id == request.header.request_id
+        assert metadata['transport'] == 'stream'
+        assert metadata['endpoint'] == '/index'
+
+    # errors are raised like the errors of unary calls
+    failing_task = pool.send_request(
+        request=_create_test_data_message(),
+        deployment='streaming',
+        head=False,
+        endpoint='/fail',
+    )[0]
+    await asyncio.wait([failing_task])
+    assert isinstance(failing_task.exception(), grpc.aio.AioRpcError)
+    assert failing_task.exception().code() == grpc.StatusCode.UNKNOWN
+
+    # replicas which do not serve the stream get unary calls
+    for _ in range(2):
+        response, metadata = await pool.send_request(
+            request=_create_test_data_message(), deployment='unary', head=False
+        )[0]
+        assert metadata['transport'] == 'unary'
+
+    await pool.close()
+    streaming_process.kill()
+    unary_process.kill()
+    streaming_process.join()
+    unary_process.join()
+
+
 def _create_test_data_message():
     return list(
         request_generator(
@@ -0,0 +1,128 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from jina import Document, DocumentArray
+from jina.clients.request import request_generator
+from jina.serve.shared_memory import (
+    SEGMENT_PREFIX,
+    SHARED_MEMORY_DIR,
+    SharedMemorySegments,
+    cleanup_stale_segments,
+    inline_shared_memory_docs,
+    is_shared_memory_supported,
+)
+from jina.types.request.data import DataRequest
+
+pytestmark = pytest.mark.skipif(
+    not is_shared_memory_supported(), reason='shared memory is not supported'
+)
+
+
+def _create_request(num_docs=10, size=4096):
+    return list(
+        request_generator(
+            '/',
+            DocumentArray(
+                [
+                    Document(tensor=np.ones(size, dtype='float32'))
+                    for _ in range(num_docs)
+                ]
+            ),
+        )
+    )[0]
+
+
+def _segment_exists(request):
+    return os.path.exists(
+        os.path.join(SHARED_MEMORY_DIR, request.proto.data.docs_shm.name)
+    )
+
+
+def test_shared_memory_segments_reference_counting():
+    segments = SharedMemorySegments()
+    request = _create_request()
+
+    shm_request = segments.acquire(request)
+    assert shm_request.proto.data.WhichOneof('documents') == 'docs_shm'
+    assert shm_request.header.request_id == request.header.request_id
+    assert segments.acquire(request) is shm_request
+    assert _segment_exists(shm_request)
+
+    # the receiver gets the serialized request
+    received = DataRequest(shm_request.proto.SerializeToString())
+    assert len(received.docs) == 10
+    assert received.docs[0].tensor.sum() == 4096
+
+    segments.release(request)
+    assert _segment_exists(shm_request)
+    segments.release(request)
+    assert not _segment_exists(shm_request)
+
+
+def test_shared_memory_segments_small_payload():
+    segments = SharedMemorySegments()
+    request = _create_request(num_docs=1, size=10)
+
+    assert segments.acquire(request) is request
+    segments.release(request)
+
+
+def test_shared_memory_segments_close():
+    segments = SharedMemorySegments()
+    shm_request = segments.acquire(_create_request())
+
+    segments.close()
+    assert not _segment_exists(shm_request)
+
+
+def test_inline_shared_memory_docs():
+    segments = SharedMemorySegments()
+    request = _create_request()
+    request.parameters = {'key': 'value'}
+    shm_request = segments.acquire(request)
+
+    inlined = inline_shared_memory_docs(shm_request)
+    assert inlined.proto.data.WhichOneof('documents') == 'docs'
+    assert inlined.header.request_id == request.header.request_id
+    assert inlined.parameters == {'key': 'value'}
+    assert len(inlined.docs) == 10
+    assert inline_shared_memory_docs(request) is request
+    segments.close()
+
+
+def test_shared_memory_compressed_docs():
+    segments = SharedMemorySegments()
+    docs = DocumentArray(
+        [Document(tensor=np.random.random(4096).astype('float32')) for _ in range(10)]
+    )
+    request = list(request_generator('/', docs, compress='ZLIB'))[0]
+    shm_request = segments.acquire(request)
+    assert shm_request.proto.data.WhichOneof('documents') == 'docs_shm'
+
+    received = DataRequest(shm_request.proto.SerializeToString())
+    np.testing.assert_equal(received.docs.tensors, docs.tensors)
+
+    # the docs stay compressed when they are inlined
+    inlined = inline_shared_memory_docs(shm_request)
+    assert inlined.proto.data.docs_bytes == request.proto.data.docs_bytes
+    assert inlined.header.docs_codec == 'ZLIB'
+    segments.close()
+
+
+def test_cleanup_stale_segments():
+    process = multiprocessing.Process(target=lambda: None)
+    process.start()
+    process.join()
+    stale = os.path.join(SHARED_MEMORY_DIR, f'{SEGMENT_PREFIX}{process.pid}-stale')
+    alive = os.path.join(SHARED_MEMORY_DIR, f'{SEGMENT_PREFIX}{os.getpid()}-alive')
+    for path in (stale, alive):
+        with open(path, 'wb') as f:
+            f.write(b'payload')
+
+    cleanup_stale_segments()
+    assert not os.path.exists(stale)
+    assert os.path.exists(alive)
+    os.unlink(alive)
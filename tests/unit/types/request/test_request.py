@@ -1,6 +1,8 @@
 import copy
 
+import numpy as np
 import pytest
+from google.protobuf import json_format
 from google.protobuf.json_format import MessageToDict, MessageToJson
 
 from docarray.proto.docarray_pb2 import DocumentProto
@@ -8,7 +10,11 @@ from jina.excepts import BadRequestType
 from jina.helper import random_identity
 from jina.proto import jina_pb2
 from docarray import DocumentArray, Document
-from jina.proto.serializer import DataRequestProto
+from jina.proto.serializer import (
+    DataRequestListProto,
+    DataRequestProto,
+    DataRequestStreamProto,
+)
 from jina.types.request.control import ControlRequest
 from jina.types.request.data import DataRequest, Response
 from tests import random_docs
@@ -133,4 +139,176 @@ def test_status():
     deserialized_request = DataRequestProto.FromString(byte_array)
     assert not deserialized_request.is_decompressed
     assert deserialized_request.status.code == jina_pb2.StatusProto.ERROR
+    assert deserialized_request.is_decompressed_wo_data
+    assert not deserialized_request.is_decompressed
+
+
+def test_lazy_serialization_wo_data():
+    r = DataRequest()
+    r.data.docs = DocumentArray(
+        [Document(text='534534534er5yr5y645745675675675345')] * 100
+    )
+    r.parameters = {'key': 'value'}
+    byte_array = DataRequestProto.SerializeToString(r)
+
+    deserialized_request = DataRequestProto.FromString(byte_array)
+    assert deserialized_request.parameters == {'key': 'value'}
+    assert deserialized_request.header.request_id == r.header.request_id
+    deserialized_request.routes.add().executor = 'head'
+    deserialized_request.header.exec_endpoint = '/foo'
+    assert deserialized_request.is_decompressed_wo_data
+    assert not deserialized_request.is_decompressed
+
+    # the changes are kept when the request is forwarded without parsing its data
+    forwarded_request = DataRequestProto.FromString(
+        DataRequestProto.SerializeToString(deserialized_request)
+    )
+    assert not deserialized_request.is_decompressed
+    assert forwarded_request.routes[0].executor == 'head'
+    assert forwarded_request.docs == r.docs
+    assert forwarded_request.is_decompressed
+
+    # and when the data is parsed
+    assert deserialized_request.docs == r.docs
     assert deserialized_request.is_decompressed
+    assert deserialized_request.header.exec_endpoint == '/foo'
+    assert deserialized_request.parameters == {'key': 'value'}
+
+
+def test_stream_serialization():
+    requests = [DataRequest(), DataRequest()]
+    for request in requests:
+        request.data.docs = DocumentArray(
+            [Document(text='534534534er5yr5y645745675675675345')] * 10
+        )
+    requests[1] = DataRequestProto.FromString(
+        DataRequestProto.SerializeToString(requests[1])
+    )
+    byte_array = DataRequestStreamProto.SerializeToString(
+        (requests, {'endpoint': '/foo'})
+    )
+    # the requests are serialized like the generated serializer does
+    message = jina_pb2.DataRequestStreamProto()
+    message.ParseFromString(byte_array)
+    assert [r.header.request_id for r in message.requests] == [
+        r.header.request_id for r in requests
+    ]
+
+    deserialized_requests, metadata = DataRequestStreamProto.FromString(byte_array)
+    assert metadata == {'endpoint': '/foo'}
+    assert not any(r.is_decompressed_wo_data for r in deserialized_requests)
+    assert [r.docs for r in deserialized_requests] == [r.docs for r in requests]
+
+
+def test_list_serialization():
+    requests = [DataRequest(), DataRequest()]
+    for request in requests:
+        request.data.docs = DocumentArray(
+            [Document(text='534534534er5yr5y645745675675675345')] * 10
+        )
+    requests[1] = DataRequestProto.FromString(
+        DataRequestProto.SerializeToString(requests[1])
+    )
+    byte_array = DataRequestListProto.SerializeToString(requests)
+    # the raw buffer of the request which was not deserialized is concatenated as is
+    assert not requests[1].is_decompressed_wo_data
+    message = jina_pb2.DataRequestListProto()
+    message.ParseFromString(byte_array)
+    assert [r.header.request_id for r in message.requests] == [
+        r.header.request_id for r in requests
+    ]
+
+    deserialized_requests = DataRequestListProto.FromString(byte_array)
+    assert not any(r.is_decompressed_wo_data for r in deserialized_requests)
+    assert [r.docs for r in deserialized_requests] == [r.docs for r in requests]
+
+    single_request = DataRequestListProto.FromString(
+        DataRequestListProto.SerializeToString(requests[0])
+    )
+    assert single_request[0].header.request_id == requests[0].header.request_id
+
+
+def test_parameters_cached(mocker):
+    r = DataRequest()
+    r.parameters = {'key': 'value', 'nested': {'top_k': 1}}
+    request = DataRequestProto.FromString(DataRequestProto.SerializeToString(r))
+    message_to_dict = mocker.spy(json_format, 'MessageToDict')
+
+    parameters = request.parameters
+    assert parameters == {'key': 'value', 'nested': {'top_k': 1.0}}
+    parameters['key'] = 'changed'
+    assert request.parameters['key'] == 'value'
+    assert message_to_dict.call_count == 1
+
+    # setting unchanged parameters does not rewrite them
+    request.parameters = request.parameters
+    assert message_to_dict.call_count == 1
+    request.parameters = {'key': 'changed'}
+    assert request.parameters == {'key': 'changed'}
+    assert message_to_dict.call_count == 2
+
+    # empty parameters are not converted
+    assert DataRequest().parameters == {}
+    assert message_to_dict.call_count == 2
+
+
+def test_tensor_columns():
+    embeddings = np.random.random((10, 8)).astype('float32')
+    docs = DocumentArray([Document(tags={'i': i}) for i in range(10)])
+    docs.embeddings = embeddings
+    docs[:, 'tensor'] = [np.ones(2) if i else np.ones(3) for i in range(10)]
+    embedding = docs[0].embedding
+    r = DataRequest()
+    r.header.tensor_columns = True
+    r.data.docs = docs
+
+    # only the embeddings have the same shape in all docs
+    assert list(r.proto.data.columns) == ['embedding']
+    assert not r.proto.data.docs.docs[0].HasField('embedding')
+    # the columns are written without changing the docs
+    assert docs[0].embedding is embedding
+
+    deserialized_docs = DataRequestProto.FromString(
+        DataRequestProto.SerializeToString(r)
+    ).docs
+    np.testing.assert_equal(deserialized_docs.embeddings, embeddings)
+    assert deserialized_docs[0].embedding.base is deserialized_docs[1].embedding.base
+    assert deserialized_docs[0].tensor.shape == (3,)
+    assert deserialized_docs[9].tags['i'] == 9
+    deserialized_docs[0].embedding *= 2
+
+
+@pytest.mark.parametrize('algorithm', ['ZLIB', 'LZMA', 'LZ4'])
+def test_compressed_docs(algorithm):
+    docs = DocumentArray([Document(text='hello ' * 100) for _ in range(10)])
+    r = DataRequest()
+    r.data.set_compressed_docs(docs, algorithm)
+    # LZ4 falls back to ZLIB if it is not installed
+    assert r.header.docs_codec in (algorithm, 'ZLIB')
+    assert len(r.proto.data.docs_bytes) < len(docs.to_bytes())
+
+    # the docs stay compressed while the request is forwarded
+    forwarded = DataRequest(DataRequestProto.SerializeToString(r))
+    forwarded.routes.add().executor = 'executor0'
+    forwarded = DataRequest(DataRequestProto.SerializeToString(forwarded))
+    assert not forwarded.is_decompressed
+    assert forwarded.header.docs_codec == r.header.docs_codec
+    assert forwarded.docs.texts == docs.texts
+
+    # replacing the docs does not keep the codec
+    forwarded.data.docs = DocumentArray([Document()])
+    assert not forwarded.header.HasField('docs_codec')
+
+
+def test_tensor_columns_opt_in():
+    docs = DocumentArray([Document() for _ in range(3)])
+    docs.embeddings = np.random.random((3, 8))
+    r = DataRequest()
+    r.data.docs = docs
+
+    # peers which do not read columns get the embeddings in the docs
+    assert len(r.proto.data.columns) == 0
+    assert r.proto.data.docs.docs[0].HasField('embedding')
+    np.testing.assert_equal(
+        DataRequest(r.to_bytes()).docs.embeddings, docs.embeddings
+    )